@@ -0,0 +1,51 @@
+"""Add denormalized message counters to threads
+
+Revision ID: 4b1d7e2a9c31
+Revises: c970e3b310cd
+Create Date: 2026-10-19 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d7e2a9c31'
+down_revision: Union[str, None] = 'c970e3b310cd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('threads', sa.Column('message_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('threads', sa.Column('total_tokens', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('threads', sa.Column('last_message_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('threads', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill counters from existing messages
+    op.execute(
+        """
+        UPDATE threads AS t
+        SET message_count = agg.message_count,
+            total_tokens = agg.total_tokens,
+            last_message_at = agg.last_message_at,
+            version = agg.message_count
+        FROM (
+            SELECT thread_id,
+                   COUNT(*) AS message_count,
+                   COALESCE(SUM(token_count), 0) AS total_tokens,
+                   MAX(timestamp) AS last_message_at
+            FROM messages
+            GROUP BY thread_id
+        ) AS agg
+        WHERE agg.thread_id = t.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('threads', 'version')
+    op.drop_column('threads', 'last_message_at')
+    op.drop_column('threads', 'total_tokens')
+    op.drop_column('threads', 'message_count')
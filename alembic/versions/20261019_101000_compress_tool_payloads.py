@@ -0,0 +1,110 @@
+"""Store tool payloads once and compress large ones
+
+Revision ID: 8e3f5a60d2b7
+Revises: 4b1d7e2a9c31
+Create Date: 2026-10-19 10:10:00.000000
+
+"""
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3f5a60d2b7'
+down_revision: Union[str, None] = '4b1d7e2a9c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors the default Settings.message_compression_threshold
+COMPRESSION_THRESHOLD = 2048
+BATCH_SIZE = 500
+
+
+def _decompress(data: bytes, codec: str) -> str:
+    if codec == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    return zlib.decompress(data).decode('utf-8')
+
+
+def upgrade() -> None:
+    op.add_column('messages', sa.Column('tool_payload', sa.LargeBinary(), nullable=True))
+    op.add_column('messages', sa.Column('tool_payload_codec', sa.String(length=16), nullable=True))
+    # Payloads are already compressed; skip pglz and store them out of line as-is
+    op.execute('ALTER TABLE messages ALTER COLUMN tool_payload SET STORAGE EXTERNAL')
+
+    # Normalize tool payloads into tool_result only
+    op.execute(
+        """
+        UPDATE messages
+        SET tool_result = content
+        WHERE role = 'tool' AND tool_result IS NULL
+        """
+    )
+    op.execute(
+        """
+        UPDATE messages
+        SET content = ''
+        WHERE role = 'tool' AND content = tool_result
+        """
+    )
+
+    # Compress large payloads in batches (zlib keeps the migration dependency-free)
+    bind = op.get_bind()
+    select_batch = sa.text(
+        """
+        SELECT id, tool_result FROM messages
+        WHERE role = 'tool'
+          AND tool_payload IS NULL
+          AND octet_length(tool_result) >= :threshold
+        LIMIT :batch_size
+        """
+    )
+    update_row = sa.text(
+        """
+        UPDATE messages
+        SET tool_payload = :payload, tool_payload_codec = 'zlib', tool_result = NULL
+        WHERE id = :id
+        """
+    )
+    while True:
+        rows = bind.execute(
+            select_batch, {'threshold': COMPRESSION_THRESHOLD, 'batch_size': BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            update_row,
+            [
+                {'id': row.id, 'payload': zlib.compress(row.tool_result.encode('utf-8'), 6)}
+                for row in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT id, tool_payload, tool_payload_codec FROM messages WHERE tool_payload IS NOT NULL"
+        )
+    )
+    restore_row = sa.text('UPDATE messages SET tool_result = :payload WHERE id = :id')
+    for row in rows.fetchall():
+        bind.execute(
+            restore_row,
+            {'id': row.id, 'payload': _decompress(row.tool_payload, row.tool_payload_codec)},
+        )
+
+    op.execute(
+        """
+        UPDATE messages
+        SET content = tool_result
+        WHERE role = 'tool' AND content = '' AND tool_result IS NOT NULL
+        """
+    )
+    op.drop_column('messages', 'tool_payload_codec')
+    op.drop_column('messages', 'tool_payload')
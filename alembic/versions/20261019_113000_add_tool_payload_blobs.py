@@ -0,0 +1,144 @@
+"""Deduplicate tool payloads into a content-addressed blob table
+
+Revision ID: a17c9e04f5d8
+Revises: 8e3f5a60d2b7
+Create Date: 2026-10-19 11:30:00.000000
+
+"""
+import hashlib
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a17c9e04f5d8'
+down_revision: Union[str, None] = '8e3f5a60d2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirror the defaults of Settings.tool_payload_dedup_threshold and
+# Settings.message_compression_threshold
+DEDUP_THRESHOLD = 256
+COMPRESSION_THRESHOLD = 2048
+BATCH_SIZE = 500
+
+
+def _decompress(data: bytes, codec: str | None) -> str:
+    if codec is None:
+        return data.decode('utf-8')
+    if codec == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    return zlib.decompress(data).decode('utf-8')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tool_payload_blobs',
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('codec', sa.String(length=16), nullable=True),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('hash', name=op.f('pk_tool_payload_blobs'))
+    )
+    # Large blobs are already compressed; store them out of line as-is
+    op.execute('ALTER TABLE tool_payload_blobs ALTER COLUMN data SET STORAGE EXTERNAL')
+
+    op.add_column('messages', sa.Column('tool_payload_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_messages_tool_payload_hash'), 'messages', ['tool_payload_hash'], unique=False)
+    op.create_foreign_key(
+        op.f('fk_messages_tool_payload_hash_tool_payload_blobs'),
+        'messages', 'tool_payload_blobs',
+        ['tool_payload_hash'], ['hash'],
+    )
+
+    # Move inline and per-row compressed payloads into the blob table
+    bind = op.get_bind()
+    select_batch = sa.text(
+        """
+        SELECT id, tool_result, tool_payload, tool_payload_codec FROM messages
+        WHERE role = 'tool'
+          AND tool_payload_hash IS NULL
+          AND (tool_payload IS NOT NULL OR octet_length(tool_result) >= :threshold)
+        LIMIT :batch_size
+        """
+    )
+    insert_blob = sa.text(
+        """
+        INSERT INTO tool_payload_blobs (hash, size_bytes, codec, data)
+        VALUES (:hash, :size_bytes, :codec, :data)
+        ON CONFLICT (hash) DO NOTHING
+        """
+    )
+    link_message = sa.text(
+        """
+        UPDATE messages
+        SET tool_payload_hash = :hash, tool_result = NULL,
+            tool_payload = NULL, tool_payload_codec = NULL
+        WHERE id = :id
+        """
+    )
+    while True:
+        rows = bind.execute(
+            select_batch, {'threshold': DEDUP_THRESHOLD, 'batch_size': BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+
+        blobs = {}
+        links = []
+        for row in rows:
+            if row.tool_payload is not None:
+                payload = _decompress(row.tool_payload, row.tool_payload_codec)
+            else:
+                payload = row.tool_result
+            raw = payload.encode('utf-8')
+            digest = hashlib.sha256(raw).hexdigest()
+            if digest not in blobs:
+                compressed = len(raw) >= COMPRESSION_THRESHOLD
+                blobs[digest] = {
+                    'hash': digest,
+                    'size_bytes': len(raw),
+                    'codec': 'zlib' if compressed else None,
+                    'data': zlib.compress(raw, 6) if compressed else raw,
+                }
+            links.append({'id': row.id, 'hash': digest})
+
+        bind.execute(insert_blob, list(blobs.values()))
+        bind.execute(link_message, links)
+
+    op.drop_column('messages', 'tool_payload_codec')
+    op.drop_column('messages', 'tool_payload')
+
+
+def downgrade() -> None:
+    op.add_column('messages', sa.Column('tool_payload', sa.LargeBinary(), nullable=True))
+    op.add_column('messages', sa.Column('tool_payload_codec', sa.String(length=16), nullable=True))
+
+    # Restore blob references as inline payloads
+    bind = op.get_bind()
+    blobs = bind.execute(
+        sa.text(
+            """
+            SELECT DISTINCT b.hash, b.codec, b.data
+            FROM tool_payload_blobs AS b
+            JOIN messages AS m ON m.tool_payload_hash = b.hash
+            """
+        )
+    ).fetchall()
+    restore = sa.text(
+        'UPDATE messages SET tool_result = :payload WHERE tool_payload_hash = :hash'
+    )
+    for blob in blobs:
+        bind.execute(restore, {'hash': blob.hash, 'payload': _decompress(blob.data, blob.codec)})
+
+    op.drop_constraint(
+        op.f('fk_messages_tool_payload_hash_tool_payload_blobs'), 'messages', type_='foreignkey'
+    )
+    op.drop_index(op.f('ix_messages_tool_payload_hash'), table_name='messages')
+    op.drop_column('messages', 'tool_payload_hash')
+    op.drop_table('tool_payload_blobs')
@@ -0,0 +1,40 @@
+"""Add per-user and per-thread token usage totals
+
+Revision ID: 5c2f9b7d1e63
+Revises: a17c9e04f5d8
+Create Date: 2026-10-19 12:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2f9b7d1e63'
+down_revision: Union[str, None] = 'a17c9e04f5d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'token_usage',
+        sa.Column('user_id', sa.String(length=255), nullable=False),
+        sa.Column('thread_id', sa.String(length=255), nullable=False),
+        sa.Column('usage_date', sa.Date(), nullable=False),
+        sa.Column('llm_calls', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('input_tokens', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('cached_input_tokens', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('output_tokens', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'thread_id', 'usage_date', name=op.f('pk_token_usage'))
+    )
+    op.create_index(op.f('ix_token_usage_thread_id'), 'token_usage', ['thread_id'], unique=False)
+    op.create_index(op.f('ix_token_usage_usage_date'), 'token_usage', ['usage_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_token_usage_usage_date'), table_name='token_usage')
+    op.drop_index(op.f('ix_token_usage_thread_id'), table_name='token_usage')
+    op.drop_table('token_usage')
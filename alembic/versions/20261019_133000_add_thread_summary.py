@@ -0,0 +1,27 @@
+"""Add rolling summary to threads
+
+Revision ID: d41b6e8a2f70
+Revises: 5c2f9b7d1e63
+Create Date: 2026-10-19 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41b6e8a2f70'
+down_revision: Union[str, None] = '5c2f9b7d1e63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('threads', sa.Column('summary', sa.Text(), nullable=True))
+    op.add_column('threads', sa.Column('summary_through_id', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('threads', 'summary_through_id')
+    op.drop_column('threads', 'summary')
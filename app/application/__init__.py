@@ -15,8 +15,10 @@ from .agent import (
 from .services import (
     ChatService,
     ThreadService,
+    UsageService,
     create_chat_service,
     create_thread_service,
+    create_usage_service,
 )
 
 __all__ = [
@@ -34,4 +36,6 @@ __all__ = [
     "ThreadService",
     "create_chat_service",
     "create_thread_service",
+    "UsageService",
+    "create_usage_service",
 ]
@@ -2,10 +2,18 @@
 Agent module - LangGraph agent definition and utilities.
 """
 
+from .answer_cache import AnswerCache, normalize_question
 from .graph import create_agent_graph
 from .graph_builder import GraphBuilder, create_graph_builder
 from .mappers import MessageMapper
-from .orchestrators import DatabaseObserver, SSEOrchestrator, StreamObserver
+from .orchestrators import (
+    AnswerCacheObserver,
+    DatabaseObserver,
+    SSEOrchestrator,
+    StreamObserver,
+    SummaryRefreshObserver,
+)
+from .nodes.summarize_node import SummarizeNode
 from .state_schema import AgentState, StreamEvent
 from .streaming import (
     StreamHandler,
@@ -13,6 +21,7 @@ from .streaming import (
     format_sse_event,
     stream_graph_events,
 )
+from .summary_refresher import SummaryRefresher, SummaryRepositories
 from .tools import get_all_tools, get_spec_info
 
 __all__ = [
@@ -29,6 +38,15 @@ __all__ = [
     "SSEOrchestrator",
     "StreamObserver",
     "DatabaseObserver",
+    "AnswerCacheObserver",
+    "SummaryRefreshObserver",
+    # Summaries
+    "SummarizeNode",
+    "SummaryRefresher",
+    "SummaryRepositories",
+    # Answer cache
+    "AnswerCache",
+    "normalize_question",
     # Streaming
     "StreamHandler",
     "create_stream_handler",
@@ -0,0 +1,127 @@
+"""
+Exact-match answer cache for first-turn questions.
+
+Many users of the same spec open a thread with the same question. The cache
+key combines the system prompt version, the Helix data version, the
+class/spec/role context and a normalized form of the question, so cached
+answers are dropped automatically when the prompt or the claim data change.
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+
+from app.infrastructure.cache import TTLCache
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question for exact-match lookup.
+
+    Case, punctuation and whitespace differences are ignored, so
+    "Arms rotation?" and "arms  rotation" share a cache entry.
+
+    Args:
+        question: Raw user input
+
+    Returns:
+        Normalized question text
+    """
+    text = unicodedata.normalize("NFKC", question).casefold()
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class AnswerCache:
+    """
+    TTL + LRU cache of final answers keyed by spec context and question.
+    """
+
+    def __init__(
+        self,
+        prompt_version: str,
+        data_version: str,
+        max_entries: int,
+        ttl_seconds: float,
+        max_question_chars: int,
+    ):
+        """
+        Initialize the answer cache.
+
+        Args:
+            prompt_version: Version of the system prompt answers were built with
+            data_version: Version of the Helix data answers were built with
+            max_entries: Maximum number of cached answers
+            ttl_seconds: Lifetime of a cached answer
+            max_question_chars: Longer questions are never cached
+        """
+        self.prompt_version = prompt_version
+        self.data_version = data_version
+        self.max_question_chars = max_question_chars
+        self._cache: TTLCache[str, str] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    def build_key(
+        self, question: str, wow_class: str, wow_spec: str, wow_role: str
+    ) -> str | None:
+        """
+        Build the cache key for a question, if it is cacheable.
+
+        Args:
+            question: Raw user input
+            wow_class: WoW class context
+            wow_spec: WoW spec context
+            wow_role: WoW role context
+
+        Returns:
+            Cache key, or None if the question should not be cached
+        """
+        normalized = normalize_question(question)
+        if not normalized or len(normalized) > self.max_question_chars:
+            return None
+
+        raw = json.dumps(
+            [
+                self.prompt_version,
+                self.data_version,
+                wow_class.lower(),
+                wow_spec.lower(),
+                wow_role.lower(),
+                normalized,
+            ]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached answer."""
+        return self._cache.get(key)
+
+    def set(self, key: str, answer: str) -> None:
+        """Store a final answer."""
+        if answer:
+            self._cache.set(key, answer)
+
+    def invalidate(
+        self, prompt_version: str | None = None, data_version: str | None = None
+    ) -> None:
+        """
+        Drop all cached answers, optionally moving to new versions.
+
+        Args:
+            prompt_version: New system prompt version
+            data_version: New Helix data version
+        """
+        if prompt_version is not None:
+            self.prompt_version = prompt_version
+        if data_version is not None:
+            self.data_version = data_version
+        self._cache.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return cache statistics."""
+        return self._cache.stats()
@@ -3,15 +3,24 @@ LangGraph agent definition.
 Defines the graph structure with nodes and edges.
 """
 
+from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
 from langgraph.graph import END, START, StateGraph
 
+from app.infrastructure.config import get_settings
 from app.infrastructure.llm import LLMClient
+from app.infrastructure.metrics import get_metrics
 
+from .knowledge.context_packs import get_context_pack_store
+from .prompts import PromptCompactor, sort_tools
+from .speculation import TURN_FIRST, TURN_FOLLOWUP, ToolCallStats, ToolSpeculator
 from .state_schema import AgentState
+from .tools import TOOL_PREDICTORS, ToolOutputGovernor, ToolOutputPolicy
 from .nodes.llm_node import LLMNode
+from .nodes.model_tier_node import ModelTierNode
 from .nodes.tool_node import ToolNode
 from .nodes.router_node import RouterNode
+from .nodes.summarize_node import SummarizeNode
 
 
 def create_agent_graph(llm_client: LLMClient, tools: list[BaseTool]) -> StateGraph:
@@ -28,14 +37,87 @@ def create_agent_graph(llm_client: LLMClient, tools: list[BaseTool]) -> StateGra
     # Create the graph
     graph = StateGraph(AgentState)
 
-    # Bind tools to the model so it can emit tool calls
-    model = llm_client.model.bind_tools(tools) if tools else llm_client.model
+    settings = get_settings()
+
+    # Bind tools to the model so it can emit tool calls. Sorted so the tool
+    # schemas form a stable prompt prefix across requests.
+    model = _bind_tools(llm_client, tools)
+    fast_model = None
+    if settings.openai_fast_model:
+        fast_model = _bind_tools(
+            llm_client.with_model(settings.openai_fast_model), tools
+        )
+    compactor = None
+    if settings.prompt_compaction_enabled:
+        compactor = PromptCompactor(
+            keep_tool_turns=settings.compaction_keep_tool_turns,
+            stale_tool_chars=settings.compaction_stale_tool_chars,
+        )
+
+    context_packs = get_context_pack_store() if settings.context_packs_enabled else None
+    speculator = _create_speculator(tools) if settings.speculation_enabled else None
+    output_governor = None
+    if settings.tool_output_governor_enabled:
+        output_governor = _create_output_governor()
+
     # Add nodes
-    graph.add_node("agent", LLMNode(model))
-    graph.add_node("tools", ToolNode(tools))
+    graph.add_node(
+        "agent",
+        LLMNode(
+            model,
+            compactor=compactor,
+            fast_model=fast_model,
+            context_packs=context_packs,
+            speculator=speculator,
+            max_tool_iterations=settings.agent_max_tool_iterations,
+        ),
+    )
+    graph.add_node(
+        "tools",
+        ToolNode(
+            tools,
+            max_concurrency=settings.tool_max_concurrency,
+            default_timeout=settings.tool_timeout_seconds,
+            timeouts=settings.tool_timeouts,
+            output_governor=output_governor,
+            memoize=settings.tool_memo_enabled,
+        ),
+    )
+
+    # Default flow: START -> agent <-> tools -> END. Optional stages run
+    # in order before the agent.
+    pre_agent: list[str] = []
+
+    if settings.summary_enabled:
+        # A hard limit before answering keeps the prompt bounded. The lower
+        # trigger is applied after the stream by the SummaryRefresher, so it
+        # never delays the answer.
+        graph.add_node(
+            "summarize",
+            SummarizeNode(
+                llm_client.with_temperature(0).model,
+                token_threshold=settings.summary_max_history_tokens,
+                keep_turns=settings.summary_keep_turns,
+            ),
+        )
+        pre_agent.append("summarize")
+
+    if fast_model is not None:
+        # Pick the model tier once per user turn, after summarization
+        graph.add_node(
+            "route_model",
+            ModelTierNode(
+                max_fast_chars=settings.routing_max_fast_chars,
+                max_fast_questions=settings.routing_max_fast_questions,
+                escalation_keywords=settings.routing_escalation_keywords,
+            ),
+        )
+        pre_agent.append("route_model")
 
-    # Set entry point: START -> agent
-    graph.set_entry_point("agent")
+    stages = [*pre_agent, "agent"]
+    graph.set_entry_point(stages[0])
+    for source, target in zip(stages, stages[1:], strict=False):
+        graph.add_edge(source, target)
 
     # Add edges
     graph.add_conditional_edges(
@@ -49,3 +131,52 @@ def create_agent_graph(llm_client: LLMClient, tools: list[BaseTool]) -> StateGra
     graph.add_edge("tools", "agent")
 
     return graph
+
+
+def _create_speculator(tools: list[BaseTool]) -> ToolSpeculator | None:
+    """Create the speculator for the predictable tools among the given ones."""
+    settings = get_settings()
+    tool_names = {tool.name for tool in tools}
+    predictors = {
+        name: predictor
+        for name, predictor in TOOL_PREDICTORS.items()
+        if name in tool_names
+    }
+    if not predictors:
+        return None
+    speculator = ToolSpeculator(
+        predictors,
+        ToolCallStats(
+            priors={
+                TURN_FIRST: settings.speculation_first_turn_prior,
+                TURN_FOLLOWUP: settings.speculation_followup_prior,
+            },
+            decay=settings.speculation_decay,
+        ),
+        min_confidence=settings.speculation_min_confidence,
+    )
+    get_metrics().register_collector("tool_speculation", speculator.stats_snapshot)
+    return speculator
+
+
+def _create_output_governor() -> ToolOutputGovernor:
+    """Create the tool output governor from the configured policies."""
+    settings = get_settings()
+    policies = {
+        name: ToolOutputPolicy(
+            max_tokens=policy.get("max_tokens", settings.tool_output_max_tokens),
+            fields=tuple(policy.get("fields", ())),
+            summarize=policy.get("summarize", False),
+        )
+        for name, policy in settings.tool_output_policies.items()
+    }
+    return ToolOutputGovernor(
+        ToolOutputPolicy(max_tokens=settings.tool_output_max_tokens), policies
+    )
+
+
+def _bind_tools(llm_client: LLMClient, tools: list[BaseTool]) -> Runnable:
+    """Bind tools (sorted by name) to the client's graph model."""
+    if not tools:
+        return llm_client.chat_model
+    return llm_client.chat_model.bind_tools(sort_tools(tools))
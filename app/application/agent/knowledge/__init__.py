@@ -0,0 +1,24 @@
+"""
+Static game knowledge used by the agent tools and prompts.
+"""
+
+from .context_packs import (
+    ContextPack,
+    ContextPackStore,
+    build_context_pack,
+    get_context_pack_store,
+)
+from .spec_index import SpecEntry, SpecKnowledgeIndex, get_spec_index, normalize_name
+
+__all__ = [
+    # Spec knowledge
+    "SpecEntry",
+    "SpecKnowledgeIndex",
+    "get_spec_index",
+    "normalize_name",
+    # Context packs
+    "ContextPack",
+    "ContextPackStore",
+    "build_context_pack",
+    "get_context_pack_store",
+]
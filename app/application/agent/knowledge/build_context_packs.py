@@ -0,0 +1,88 @@
+"""
+Build the per-spec context pack artifact from Helix.
+
+Run after ingesting new claims (and bumping HELIX_DATA_VERSION), or
+periodically from cron:
+
+    python -m app.application.agent.knowledge.build_context_packs [--output-dir DIR]
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.helix.client import get_helix_client
+from app.infrastructure.llm.tokenizer import load_encoding
+
+from .context_packs import ContextPackStore, build_context_pack, pack_targets
+from .spec_index import get_spec_index
+
+logger = logging.getLogger(__name__)
+
+
+async def build(output_dir: Path, token_budget: int, max_claims: int) -> Path:
+    """
+    Build packs for every spec and write the versioned artifact.
+
+    Args:
+        output_dir: Artifact directory
+        token_budget: Maximum tokens per pack
+        max_claims: Maximum claims per pack
+
+    Returns:
+        Path of the written artifact
+    """
+    settings = get_settings()
+    # Pack budgets are counted with the same tokenizer as the app
+    await load_encoding()
+    helix_client = get_helix_client()
+    packs = []
+    try:
+        for wow_class, wow_spec, wow_role in pack_targets(get_spec_index()):
+            try:
+                pack = await build_context_pack(
+                    helix_client,
+                    wow_class,
+                    wow_spec,
+                    wow_role,
+                    query=settings.context_pack_query,
+                    token_budget=token_budget,
+                    max_claims=max_claims,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Skipping context pack %s/%s: %s", wow_class, wow_spec, exc
+                )
+                continue
+            if pack is not None:
+                packs.append(pack)
+    finally:
+        await helix_client.aclose()
+
+    path = ContextPackStore(settings.helix_data_version, packs).write(output_dir)
+    logger.info("Wrote %d context packs to %s", len(packs), path)
+    return path
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output-dir", type=Path, default=Path(settings.context_pack_dir)
+    )
+    parser.add_argument(
+        "--token-budget", type=int, default=settings.context_pack_token_budget
+    )
+    parser.add_argument(
+        "--max-claims", type=int, default=settings.context_pack_max_claims
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(build(args.output_dir, args.token_budget, args.max_claims))
+
+
+if __name__ == "__main__":
+    main()
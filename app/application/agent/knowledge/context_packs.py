@@ -0,0 +1,208 @@
+"""
+Precomputed per-spec context packs.
+
+A context pack is a short, token-budgeted digest of the Helix claims for one
+class/spec/role. Packs are built offline (see build_context_packs), stored
+as one versioned JSON artifact per Helix data version and placed in the
+system prompt, so common questions are answered without a search_helix
+round trip.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.domain import WowClass
+from app.domain.entities.helix_query_result import HelixQueryResult
+from app.infrastructure.config import get_settings
+from app.infrastructure.helix.ranking import (
+    CLAIM_TEXT_FIELDS,
+    BM25Index,
+    extract_items,
+)
+from app.infrastructure.llm.tokenizer import count_tokens
+
+from .spec_index import SpecKnowledgeIndex, normalize_name
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_TEMPLATE = "context_packs-v{version}.json"
+
+
+class HelixSearchClient(Protocol):
+    """Any Helix client (HTTP, cached, snapshot or fixture)."""
+
+    async def query(
+        self, query_name: str, params: dict[str, Any] | None = None
+    ) -> HelixQueryResult: ...
+
+
+def pack_key(wow_class: str, wow_spec: str, wow_role: str) -> str:
+    """Build the lookup key of a class/spec/role context."""
+    return "|".join(normalize_name(value) for value in (wow_class, wow_spec, wow_role))
+
+
+def render_claim(item: Any) -> str:
+    """Render a claim as one compact line."""
+    if isinstance(item, dict):
+        for field in CLAIM_TEXT_FIELDS:
+            value = item.get(field)
+            if isinstance(value, str) and value.strip():
+                return " ".join(value.split())
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+@dataclass(frozen=True)
+class ContextPack:
+    """Digest of the Helix claims for one class/spec/role."""
+
+    wow_class: str
+    wow_spec: str
+    wow_role: str
+    text: str
+    tokens: int
+    claims: int
+
+
+class ContextPackStore:
+    """Context packs of one Helix data version, keyed by class/spec/role."""
+
+    def __init__(self, version: str, packs: list[ContextPack]):
+        self.version = version
+        self._packs = {
+            pack_key(pack.wow_class, pack.wow_spec, pack.wow_role): pack
+            for pack in packs
+        }
+
+    def __len__(self) -> int:
+        return len(self._packs)
+
+    def get(self, wow_class: str, wow_spec: str, wow_role: str) -> ContextPack | None:
+        """Get the pack for a class/spec/role context, if one was built."""
+        return self._packs.get(pack_key(wow_class, wow_spec, wow_role))
+
+    @classmethod
+    def load(cls, directory: Path, version: str) -> "ContextPackStore":
+        """
+        Load the artifact built for a Helix data version.
+
+        A missing artifact yields an empty store, so prompts simply carry no
+        pack until one is built.
+
+        Args:
+            directory: Artifact directory
+            version: Helix data version
+
+        Returns:
+            Loaded store
+        """
+        path = directory / ARTIFACT_TEMPLATE.format(version=version)
+        if not path.exists():
+            logger.info("No context packs for data version %s at %s", version, path)
+            return cls(version, [])
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(version, [ContextPack(**pack) for pack in data["packs"]])
+
+    def write(self, directory: Path) -> Path:
+        """
+        Write the store as a versioned artifact.
+
+        Args:
+            directory: Artifact directory
+
+        Returns:
+            Path of the written artifact
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / ARTIFACT_TEMPLATE.format(version=self.version)
+        artifact = {
+            "version": self.version,
+            "built_at": datetime.now(timezone.utc).isoformat(),
+            "packs": [asdict(pack) for pack in self._packs.values()],
+        }
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(artifact, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        tmp_path.replace(path)
+        return path
+
+
+def pack_targets(spec_index: SpecKnowledgeIndex) -> list[tuple[str, str, str]]:
+    """
+    List the (class, spec, role) contexts to build packs for.
+
+    Returns:
+        One context per WowSpec, using the values threads are created with
+    """
+    targets = []
+    for entry in spec_index.entries():
+        wow_class = WowClass(normalize_name(entry.wow_class).replace(" ", "-"))
+        targets.append((wow_class.value, entry.spec.value, entry.role.lower()))
+    return targets
+
+
+async def build_context_pack(
+    helix_client: HelixSearchClient,
+    wow_class: str,
+    wow_spec: str,
+    wow_role: str,
+    query: str,
+    token_budget: int,
+    max_claims: int,
+) -> ContextPack | None:
+    """
+    Build the context pack of one class/spec/role from Helix.
+
+    Claims are ranked against a broad query (rotation, stats, talents...)
+    and added until the token budget is reached.
+
+    Args:
+        helix_client: Client used to fetch the claims
+        wow_class: WoW class context
+        wow_spec: WoW spec context
+        wow_role: WoW role context
+        query: Ranking query for generally useful claims
+        token_budget: Maximum tokens of the pack text
+        max_claims: Maximum number of claims in the pack
+
+    Returns:
+        The pack, or None if Helix has no claims for the context
+    """
+    result = await helix_client.query(
+        "SearchClaimsByTags",
+        {"wow_class": wow_class, "wow_spec": wow_spec, "wow_role": wow_role},
+    )
+    index = BM25Index(extract_items(result.data))
+    lines: list[str] = []
+    tokens = 0
+    for ranked in index.search(query, max_claims):
+        line = f"- {render_claim(ranked.item)}"
+        line_tokens = count_tokens(line)
+        if tokens + line_tokens > token_budget:
+            break
+        lines.append(line)
+        tokens += line_tokens
+    if not lines:
+        return None
+    return ContextPack(
+        wow_class=wow_class,
+        wow_spec=wow_spec,
+        wow_role=wow_role,
+        text="\n".join(lines),
+        tokens=tokens,
+        claims=len(lines),
+    )
+
+
+@lru_cache
+def get_context_pack_store() -> ContextPackStore:
+    """Get the context packs of the current Helix data version."""
+    settings = get_settings()
+    return ContextPackStore.load(
+        Path(settings.context_pack_dir), settings.helix_data_version
+    )
@@ -0,0 +1,197 @@
+"""
+Spec knowledge index.
+
+Static knowledge about every WowSpec (class, role, key abilities, tips) is
+loaded once from specs.json and rendered to text up front, so get_spec_info
+is a dict lookup. Names the model sends ("bm", "ret", "holy priest",
+"retribtion") are resolved through aliases and fuzzy matching; class names
+and their aliases ("dh", "pally") resolve to every spec of the class.
+"""
+
+import difflib
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from app.domain import WowSpec
+from app.infrastructure.cache import TTLCache
+
+SPECS_PATH = Path(__file__).with_name("specs.json")
+FUZZY_CUTOFF = 0.8
+# Shorter keys are abbreviations; a close match would be a guess
+FUZZY_MIN_LENGTH = 4
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+SPEC_TEXT_TEMPLATE = """
+Specialization: {name}
+Class: {wow_class}
+Role: {role}
+Description: {description}
+
+Key Abilities:
+{abilities}
+
+Tips:
+{tips}
+"""
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a spec or class name for lookup ("Holy-Priest" -> "holy priest")."""
+    return _SEPARATORS.sub(" ", name.casefold()).strip()
+
+
+@dataclass(frozen=True)
+class SpecEntry:
+    """Knowledge about one specialization, with its rendered text."""
+
+    spec: WowSpec
+    wow_class: str
+    role: str
+    name: str
+    text: str
+
+
+class SpecKnowledgeIndex:
+    """
+    Lookup of spec knowledge by canonical WowSpec value, alias or close match.
+
+    Names shared by several specs ("holy", "prot", "frost") resolve to all of
+    them unless the class narrows it down.
+    """
+
+    def __init__(self, entries: list[SpecEntry], aliases: dict[str, list[WowSpec]]):
+        """
+        Initialize the index.
+
+        Args:
+            entries: One entry per spec
+            aliases: Normalized name -> specs it can refer to
+        """
+        self._entries = {entry.spec: entry for entry in entries}
+        self._aliases = aliases
+        self._names = list(aliases)
+        # Fuzzy lookups by key; "" records that nothing was close enough
+        self._fuzzy: TTLCache[str, str] = TTLCache(max_entries=1024)
+
+    @classmethod
+    def from_file(cls, path: Path = SPECS_PATH) -> "SpecKnowledgeIndex":
+        """
+        Load and render the index from a spec knowledge file.
+
+        Args:
+            path: JSON file with a "specs" list and optional "class_aliases"
+
+        Returns:
+            Loaded index
+
+        Raises:
+            ValueError: If the file does not cover every WowSpec
+        """
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries: list[SpecEntry] = []
+        aliases: dict[str, list[WowSpec]] = {}
+        for item in data["specs"]:
+            spec = WowSpec(item["spec"])
+            entries.append(
+                SpecEntry(
+                    spec=spec,
+                    wow_class=item["class"],
+                    role=item["role"],
+                    name=item["name"],
+                    text=SPEC_TEXT_TEMPLATE.format(
+                        name=item["name"],
+                        wow_class=item["class"],
+                        role=item["role"],
+                        description=item["description"],
+                        abilities="\n".join(
+                            f"- {ability}" for ability in item["key_abilities"]
+                        ),
+                        tips="\n".join(f"- {tip}" for tip in item["tips"]),
+                    ),
+                )
+            )
+            names = [
+                spec.value,
+                item["name"],
+                f"{item['name']} {item['class']}",
+                f"{item['class']} {item['name']}",
+                *item.get("aliases", []),
+            ]
+            class_names = [
+                item["class"],
+                *data.get("class_aliases", {}).get(item["class"], []),
+            ]
+            for name in [*names, *class_names]:
+                specs = aliases.setdefault(normalize_name(name), [])
+                if spec not in specs:
+                    specs.append(spec)
+
+        missing = set(WowSpec) - {entry.spec for entry in entries}
+        if missing:
+            raise ValueError(f"Spec knowledge is missing: {sorted(missing)}")
+        return cls(entries, aliases)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entries(self) -> list[SpecEntry]:
+        """Get all entries in WowSpec order."""
+        return list(self._entries.values())
+
+    def get(self, spec: WowSpec) -> SpecEntry:
+        """Get the entry of a canonical spec."""
+        return self._entries[spec]
+
+    def resolve(self, name: str, wow_class: str = "") -> list[SpecEntry]:
+        """
+        Resolve a spec name to its entries.
+
+        Args:
+            name: Spec name, alias or misspelling
+            wow_class: Class context used to pick among same-named specs
+
+        Returns:
+            Matching entries; empty if nothing matches, several if the name is
+            ambiguous and the class does not narrow it down
+        """
+        key = normalize_name(name)
+        specs = self._aliases.get(key)
+        if specs is None:
+            close = self._closest_name(key)
+            if close is None:
+                return []
+            specs = self._aliases[close]
+
+        entries = [self._entries[spec] for spec in specs]
+        if len(entries) > 1 and wow_class:
+            class_key = normalize_name(wow_class)
+            narrowed = [
+                entry
+                for entry in entries
+                if normalize_name(entry.wow_class) == class_key
+            ]
+            if narrowed:
+                return narrowed
+        return entries
+
+    def _closest_name(self, key: str) -> str | None:
+        if len(key) < FUZZY_MIN_LENGTH:
+            return None
+        close = self._fuzzy.get(key, record=False)
+        if close is None:
+            matches = difflib.get_close_matches(
+                key, self._names, n=1, cutoff=FUZZY_CUTOFF
+            )
+            close = matches[0] if matches else ""
+            self._fuzzy.set(key, close)
+        return close or None
+
+
+@lru_cache
+def get_spec_index() -> SpecKnowledgeIndex:
+    """Get the process-wide spec knowledge index (loaded on first use)."""
+    return SpecKnowledgeIndex.from_file()
@@ -33,6 +33,9 @@ class MessageMapper:
         Returns:
             List of LangChain BaseMessage instances
 
+        Message ids are carried over so graph nodes can refer to persisted
+        messages (e.g. when folding them into the thread summary).
+
         Mapping rules:
             - HUMAN → HumanMessage
             - AI → AIMessage (with tool_calls if present)
@@ -61,7 +64,7 @@ class MessageMapper:
         """
         match msg.role:
             case MessageRole.HUMAN:
-                return HumanMessage(content=msg.content)
+                return HumanMessage(content=msg.content, id=msg.id)
 
             case MessageRole.AI:
                 return MessageMapper._convert_ai_message(msg)
@@ -70,7 +73,7 @@ class MessageMapper:
                 return MessageMapper._convert_tool_message(msg)
 
             case MessageRole.SYSTEM:
-                return SystemMessage(content=msg.content)
+                return SystemMessage(content=msg.content, id=msg.id)
 
             case _:
                 return None
@@ -92,9 +95,9 @@ class MessageMapper:
                 }
                 for tc in msg.tool_calls
             ]
-            return AIMessage(content=msg.content, tool_calls=tool_calls)
+            return AIMessage(content=msg.content, tool_calls=tool_calls, id=msg.id)
 
-        return AIMessage(content=msg.content)
+        return AIMessage(content=msg.content, id=msg.id)
 
     @staticmethod
     def _convert_tool_message(msg: Message) -> ToolMessage | None:
@@ -106,10 +109,13 @@ class MessageMapper:
         if not msg.tool_call_id:
             return None
 
-        # Use tool_result if available, otherwise use content
-        content = msg.tool_result if msg.tool_result else msg.content
+        # Replay what the model saw; tool_result may hold the ungoverned output
+        content = msg.content if msg.content else msg.tool_result
+        artifact = msg.tool_result if msg.tool_result != content else None
 
         return ToolMessage(
             content=content,
             tool_call_id=msg.tool_call_id,
+            artifact=artifact,
+            id=msg.id,
         )
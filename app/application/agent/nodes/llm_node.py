@@ -1,36 +1,161 @@
+import logging
+import time
+
+from app.application.agent.run_context import get_run_context
+from app.application.agent.speculation import ToolSpeculator
 from app.application.agent.state_schema import AgentState
-from app.application.agent.prompts.system_prompt import AGENT_SYSTEM_PROMPT
-from langchain_core.messages import BaseMessageChunk, SystemMessage
+from app.application.agent.knowledge.context_packs import ContextPackStore
+from app.application.agent.prompts.assembler import PromptAssembler
+from app.application.agent.prompts.compactor import PromptCompactor
+from app.application.agent.nodes.model_tier_node import MODEL_TIER_FAST, MODEL_TIER_MAIN
+from app.infrastructure.metrics import get_metrics
+from langchain_core.messages import BaseMessageChunk
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import Runnable, RunnableConfig
 from collections.abc import AsyncGenerator
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+logger = logging.getLogger(__name__)
 
 
 class LLMNode:
-    def __init__(self, model: BaseChatModel) -> None:
+    def __init__(
+        self,
+        model: BaseChatModel,
+        compactor: PromptCompactor | None = None,
+        fast_model: Runnable | None = None,
+        context_packs: ContextPackStore | None = None,
+        speculator: ToolSpeculator | None = None,
+        max_tool_iterations: int | None = None,
+    ) -> None:
         self.model = model
+        self.fast_model = fast_model
+        self.assembler = PromptAssembler(context_packs)
+        self.compactor = compactor
+        self.speculator = speculator
+        self.max_tool_iterations = max_tool_iterations
 
     async def __call__(self, state: AgentState, config: RunnableConfig | None = None) -> AgentState:
         """Call the LLM with the current state."""
+        self._start_speculation(state, config)
         chat_history = self.mount_chat_history(state)
-        response = await self._stream_llm_response(self.model, chat_history, config)
+        tier, model = self._select_model(state)
+        budget_spent = self._tool_budget_spent(state)
+        if budget_spent:
+            # Out of tool iterations: answer with what the tools returned
+            model = model.bind(tool_choice="none")
+            get_metrics().increment("agent_tool_budget_exhausted_total")
+            logger.info(
+                "Tool budget spent thread=%s tool_iterations=%d",
+                state.thread_id,
+                state.tool_iterations,
+            )
+        started = time.perf_counter()
+        response = await self._stream_llm_response(model, chat_history, config, tier)
+        latency = time.perf_counter() - started
+        get_metrics().observe("llm_call_seconds", latency, tier=tier)
+        logger.info(
+            "LLM call thread=%s tier=%s latency_ms=%.0f",
+            state.thread_id,
+            tier,
+            latency * 1000,
+        )
+        self._record_usage(state, response)
+        if budget_spent and isinstance(response, AIMessage) and response.tool_calls:
+            # tool_choice is a hint; calls past the budget would be left unanswered
+            logger.warning("Dropping tool calls past the budget thread=%s", state.thread_id)
+            response = self._without_tool_calls(response)
         return {"messages": [response]}
 
-    def mount_chat_history(self, state: AgentState) -> str:
-        """Organize the system prompt based on the state."""
-        return [SystemMessage(content=AGENT_SYSTEM_PROMPT)] + state.messages
+    def _start_speculation(self, state: AgentState, config: RunnableConfig | None) -> None:
+        """On the turn's first model call, start predicted tool calls alongside it."""
+        if self.speculator is None or not state.messages:
+            return
+        run_context = get_run_context(config)
+        if run_context is None or run_context.speculation is not None:
+            return
+        if isinstance(state.messages[-1], HumanMessage):
+            run_context.speculation = self.speculator.start(state)
+
+    def _tool_budget_spent(self, state: AgentState) -> bool:
+        """Whether the run has used all of its tool iterations."""
+        return (
+            self.max_tool_iterations is not None
+            and state.tool_iterations >= self.max_tool_iterations
+        )
+
+    @staticmethod
+    def _without_tool_calls(message: AIMessage) -> AIMessage:
+        """Copy of the message without its tool calls, so the run can end on it."""
+        additional_kwargs = {
+            key: value for key, value in message.additional_kwargs.items() if key != "tool_calls"
+        }
+        update = {"tool_calls": [], "invalid_tool_calls": [], "additional_kwargs": additional_kwargs}
+        if hasattr(message, "tool_call_chunks"):
+            update["tool_call_chunks"] = []
+        return message.model_copy(update=update)
+
+    def _select_model(self, state: AgentState) -> tuple[str, Runnable]:
+        """Use the fast model when the turn was routed to the fast tier."""
+        if state.model_tier == MODEL_TIER_FAST and self.fast_model is not None:
+            return MODEL_TIER_FAST, self.fast_model
+        return MODEL_TIER_MAIN, self.model
+
+    def mount_chat_history(self, state: AgentState) -> list[BaseMessage]:
+        """Organize the prompt with the cacheable prefix first and the history last."""
+        messages = state.messages
+        if self.compactor is not None:
+            messages, stats = self.compactor.compact(messages)
+            if stats.changed:
+                logger.info(
+                    "Compacted prompt thread=%s deduplicated=%d truncated=%d dropped=%d tokens_saved=%d",
+                    state.thread_id,
+                    stats.deduplicated,
+                    stats.truncated,
+                    stats.dropped,
+                    stats.tokens_saved,
+                )
+        return self.assembler.assemble(
+            messages,
+            state.wow_class,
+            state.wow_spec,
+            state.wow_role,
+            summary=state.summary,
+        )
+
+    def _record_usage(self, state: AgentState, response: BaseMessage | None) -> None:
+        """Log prompt and provider-cached token counts for this call."""
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return
+        input_tokens = usage.get("input_tokens", 0)
+        cached_tokens = usage.get("input_token_details", {}).get("cache_read", 0)
+        logger.info(
+            "LLM call thread=%s input_tokens=%d cached_tokens=%d output_tokens=%d cache_hit_ratio=%.2f",
+            state.thread_id,
+            input_tokens,
+            cached_tokens,
+            usage.get("output_tokens", 0),
+            cached_tokens / input_tokens if input_tokens else 0.0,
+        )
     
     async def _stream_llm_response(
         self,
         model: BaseChatModel,
         messages: list[BaseMessage],
         config: RunnableConfig | None,
+        tier: str = MODEL_TIER_MAIN,
     ) -> AsyncGenerator[BaseMessageChunk]:
         """Stream the LLM response."""
         response = None
+        started = time.perf_counter()
         async for chunk in model.astream(messages, config):
             if response is None:
+                get_metrics().observe(
+                    "llm_time_to_first_token_seconds",
+                    time.perf_counter() - started,
+                    tier=tier,
+                )
                 response = chunk
             else:
                 response += chunk
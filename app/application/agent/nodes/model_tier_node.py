@@ -0,0 +1,85 @@
+import logging
+import re
+from collections.abc import Sequence
+
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
+
+from app.application.agent.state_schema import AgentState
+
+logger = logging.getLogger(__name__)
+
+MODEL_TIER_FAST = "fast"
+MODEL_TIER_MAIN = "main"
+
+_WORD_RE = re.compile(r"[\w']+")
+
+
+class ModelTierNode:
+    """
+    Picks the model tier for the current turn.
+
+    Short, lookup-style questions ("what is the stat priority", "best trinket")
+    go to the fast tier; anything long, multi-part or asking for reasoning
+    (comparisons, explanations, planning) is escalated to the main model. The
+    tier is chosen once per user turn and kept through its tool calls.
+    """
+
+    def __init__(
+        self,
+        max_fast_chars: int,
+        max_fast_questions: int,
+        escalation_keywords: Sequence[str],
+    ) -> None:
+        self.max_fast_chars = max_fast_chars
+        self.max_fast_questions = max_fast_questions
+        self.escalation_keywords = frozenset(
+            keyword.lower() for keyword in escalation_keywords
+        )
+
+    async def __call__(
+        self, state: AgentState, config: RunnableConfig | None = None
+    ) -> dict:
+        """Set state.model_tier from the latest user message."""
+        question = self._latest_question(state)
+        tier, reason = self.classify(question)
+        logger.info(
+            "Model routing thread=%s tier=%s reason=%s chars=%d",
+            state.thread_id,
+            tier,
+            reason,
+            len(question),
+        )
+        return {"model_tier": tier}
+
+    def classify(self, question: str) -> tuple[str, str]:
+        """
+        Classify a question into a model tier.
+
+        Args:
+            question: Latest user message text
+
+        Returns:
+            Tuple of (tier, reason)
+        """
+        if not question:
+            return MODEL_TIER_MAIN, "no_question"
+        if len(question) > self.max_fast_chars:
+            return MODEL_TIER_MAIN, "long"
+        if question.count("?") > self.max_fast_questions:
+            return MODEL_TIER_MAIN, "multi_question"
+        if "```" in question or "\n" in question.strip():
+            return MODEL_TIER_MAIN, "structured"
+
+        words = set(_WORD_RE.findall(question.lower()))
+        matched = words & self.escalation_keywords
+        if matched:
+            return MODEL_TIER_MAIN, f"keyword:{min(matched)}"
+        return MODEL_TIER_FAST, "simple"
+
+    @staticmethod
+    def _latest_question(state: AgentState) -> str:
+        for message in reversed(state.messages):
+            if isinstance(message, HumanMessage):
+                return message.content if isinstance(message.content, str) else ""
+        return ""
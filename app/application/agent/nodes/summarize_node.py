@@ -0,0 +1,150 @@
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    ToolMessage,
+)
+from langchain_core.runnables import RunnableConfig
+
+from app.application.agent.prompts.summary_prompt import SUMMARY_PROMPT
+from app.application.agent.state_schema import AgentState
+from app.infrastructure.llm.tokenizer import count_message_tokens
+
+logger = logging.getLogger(__name__)
+
+# Tool outputs are clipped in the transcript handed to the summarizer
+TRANSCRIPT_TOOL_CHARS = 1000
+
+
+@dataclass(frozen=True)
+class SummaryUpdate:
+    """
+    Result of folding older turns into the summary.
+
+    Attributes:
+        summary: The updated rolling summary
+        folded: Messages now covered by the summary
+        usage: Provider usage of the summary call, if reported
+    """
+
+    summary: str
+    folded: list[BaseMessage]
+    usage: dict[str, Any] | None = None
+
+    @property
+    def through_id(self) -> str:
+        """ID of the last message covered by the summary."""
+        return self.folded[-1].id
+
+
+class SummarizeNode:
+    """
+    Folds older turns into the rolling thread summary.
+
+    Runs when the history exceeds token_threshold. Everything before the last
+    keep_turns user turns is summarized together with the previous summary
+    and removed from the state; the cut always falls on a user message, so
+    tool calls stay paired with their results.
+    """
+
+    def __init__(
+        self, model: BaseChatModel, token_threshold: int, keep_turns: int
+    ) -> None:
+        self.model = model
+        self.token_threshold = token_threshold
+        self.keep_turns = max(1, keep_turns)
+
+    async def __call__(
+        self, state: AgentState, config: RunnableConfig | None = None
+    ) -> dict:
+        """Summarize older turns if the history is over the threshold."""
+        update = await self.fold(state.messages, state.summary, state.thread_id)
+        if update is None:
+            return {}
+        return {
+            "messages": [RemoveMessage(id=message.id) for message in update.folded],
+            "summary": update.summary,
+            "summary_through_id": update.through_id,
+            "summary_usage": update.usage,
+        }
+
+    async def fold(
+        self, messages: list[BaseMessage], summary: str | None, thread_id: str
+    ) -> SummaryUpdate | None:
+        """
+        Fold older turns into the summary if the history is over the threshold.
+
+        Args:
+            messages: Thread history in order
+            summary: Current rolling summary
+            thread_id: ID of the thread (for logging)
+
+        Returns:
+            The update, or None if nothing was folded
+        """
+        if count_message_tokens(messages) <= self.token_threshold:
+            return None
+
+        folded = self._messages_to_fold(messages)
+        if not folded:
+            return None
+
+        try:
+            response = await self._summarize(summary, folded)
+        except Exception:
+            # A stale summary is better than failing the user's turn
+            logger.exception("Summarization failed for thread %s", thread_id)
+            return None
+
+        logger.info("Summarized %d messages for thread %s", len(folded), thread_id)
+        return SummaryUpdate(
+            summary=str(response.content).strip(),
+            folded=folded,
+            usage=response.usage_metadata,
+        )
+
+    def _messages_to_fold(self, messages: list[BaseMessage]) -> list[BaseMessage]:
+        """Get the messages before the kept turns (all must have persisted ids)."""
+        human_indexes = [
+            index
+            for index, message in enumerate(messages)
+            if isinstance(message, HumanMessage)
+        ]
+        if len(human_indexes) <= self.keep_turns:
+            return []
+
+        folded = messages[: human_indexes[-self.keep_turns]]
+        if any(message.id is None for message in folded):
+            return []
+        return folded
+
+    async def _summarize(
+        self, previous_summary: str | None, messages: list[BaseMessage]
+    ) -> AIMessage:
+        prompt = SUMMARY_PROMPT.format(
+            summary=previous_summary or "(none)",
+            transcript=self._render_transcript(messages),
+        )
+        # No callbacks: summary tokens must not be streamed to the client
+        return await self.model.ainvoke(prompt, config={"callbacks": []})
+
+    def _render_transcript(self, messages: list[BaseMessage]) -> str:
+        lines = []
+        for message in messages:
+            if isinstance(message, HumanMessage):
+                lines.append(f"Player: {message.content}")
+            elif isinstance(message, AIMessage):
+                if message.content:
+                    lines.append(f"Coach: {message.content}")
+                for tool_call in message.tool_calls:
+                    lines.append(f"Coach used tool {tool_call['name']}")
+            elif isinstance(message, ToolMessage):
+                content = str(message.content)[:TRANSCRIPT_TOOL_CHARS]
+                lines.append(f"Tool result: {content}")
+        return "\n".join(lines)
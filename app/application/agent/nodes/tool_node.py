@@ -1,16 +1,34 @@
+import asyncio
 import json
+import time
 
 from langgraph.config import get_stream_writer
 from langchain_core.messages import ToolMessage
 from langchain_core.tools import BaseTool
 from langchain_core.runnables import RunnableConfig
+from app.application.agent.run_context import get_run_context
 from app.application.agent.state_schema import AgentState
+from app.application.agent.tools.output_governor import ToolOutputGovernor
 from app.domain.entities.message import ToolCall
+from app.infrastructure.metrics import get_metrics
 
 
 class ToolNode:
-    def __init__(self, tools: list[BaseTool]) -> None:
+    def __init__(
+        self,
+        tools: list[BaseTool],
+        max_concurrency: int = 4,
+        default_timeout: float = 20.0,
+        timeouts: dict[str, float] | None = None,
+        output_governor: ToolOutputGovernor | None = None,
+        memoize: bool = True,
+    ) -> None:
         self.all_tools_by_name = {tool.name: tool for tool in tools}
+        self.max_concurrency = max(1, max_concurrency)
+        self.default_timeout = default_timeout
+        self.timeouts = timeouts or {}
+        self.output_governor = output_governor
+        self.memoize = memoize
 
     async def __call__(self, state: AgentState, config: RunnableConfig | None = None) -> AgentState:
         """Call the tools with the current state."""
@@ -31,12 +49,21 @@ class ToolNode:
                 }
             )
 
-        outputs = []
-        for tool_call in tool_calls:
-            tool_result = await self._run_tool(tool_call, state, stream_writer)
-            outputs.append(tool_result)
-        
-        return {"messages": outputs}
+        # Run calls concurrently (bounded); gather keeps the call order
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_bounded(tool_call: ToolCall) -> ToolMessage:
+            async with semaphore:
+                return await self._run_tool(tool_call, state, stream_writer, config)
+
+        outputs = await asyncio.gather(*(run_bounded(tool_call) for tool_call in tool_calls))
+
+        # Speculative calls only target the first tool step of a turn
+        run_context = get_run_context(config)
+        if run_context is not None:
+            run_context.finish_speculation()
+
+        return {"messages": list(outputs), "tool_iterations": state.tool_iterations + 1}
 
     def _get_tool_calls(self, state: AgentState) -> list[ToolCall]:
         """Get the tool calls from the state."""
@@ -69,28 +96,57 @@ class ToolNode:
             arguments=json.dumps(args),
         )
 
-    async def _run_tool(self, tool_call: ToolCall, state: AgentState, stream_writer) -> ToolMessage:
+    async def _run_tool(
+        self,
+        tool_call: ToolCall,
+        state: AgentState,
+        stream_writer,
+        config: RunnableConfig | None = None,
+    ) -> ToolMessage:
         """Run the tool and return the result."""
+        timeout = self.timeouts.get(tool_call.name, self.default_timeout)
+        started = time.perf_counter()
+        status = "ok"
         try:
             injected_args = self._inject_context(tool_call.arguments, state)
-            tool_result = await self.all_tools_by_name[tool_call.name].arun(injected_args)
+            tool_input = self._parse_tool_input(injected_args)
+            # Identical calls within a run reuse the first result
+            memo = self._get_memo(config)
+            memo_key = self._memo_key(tool_call.name, tool_input)
+            if memo is not None and memo_key in memo:
+                status = "memoized"
+                content, original = memo[memo_key]
+            else:
+                tool_result = await asyncio.wait_for(
+                    self.all_tools_by_name[tool_call.name].arun(tool_input, config=config),
+                    timeout=timeout,
+                )
+                content, original = self._govern_output(tool_call.name, str(tool_result), tool_input)
+                if memo is not None:
+                    memo[memo_key] = (content, original)
             stream_writer(
                 {
                     "kind": "tool_result", 
                     "data": {
                         "tool_call_id": tool_call.id, 
-                        "content": tool_result, 
+                        "content": original if original is not None else content, 
                         "is_error": False
                     }
                 }
             )
             return ToolMessage(
-                content=tool_result,
+                content=content,
                 name=tool_call.name,
-                tool_call_id=tool_call.id
+                tool_call_id=tool_call.id,
+                artifact=original,
             )
         except Exception as e:
-            error_message = f"Error calling tool {tool_call.name}: {e}"
+            if isinstance(e, TimeoutError):
+                status = "timeout"
+                error_message = f"Error calling tool {tool_call.name}: timed out after {timeout:g}s"
+            else:
+                status = "error"
+                error_message = f"Error calling tool {tool_call.name}: {e}"
             stream_writer(
                 {
                     "kind": "tool_result", 
@@ -106,6 +162,61 @@ class ToolNode:
                 name=tool_call.name,
                 tool_call_id=tool_call.id
             )
+        finally:
+            metrics = get_metrics()
+            metrics.observe("tool_call_seconds", time.perf_counter() - started, tool=tool_call.name)
+            metrics.increment("tool_calls_total", tool=tool_call.name, status=status)
+
+    def _get_memo(self, config: RunnableConfig | None) -> dict[str, tuple[str, str | None]] | None:
+        """Get the run's tool result memo, if memoization applies."""
+        if not self.memoize:
+            return None
+        run_context = get_run_context(config)
+        return run_context.tool_results if run_context is not None else None
+
+    @staticmethod
+    def _memo_key(tool_name: str, tool_input: dict | str) -> str:
+        """Key a call by tool name and canonical arguments."""
+        if isinstance(tool_input, dict):
+            tool_input = json.dumps(tool_input, sort_keys=True, separators=(",", ":"))
+        return f"{tool_name}:{tool_input}"
+
+    def _govern_output(
+        self, tool_name: str, content: str, tool_input: dict | str
+    ) -> tuple[str, str | None]:
+        """
+        Bound a tool output before it enters the state.
+
+        Returns:
+            Tuple of (content for the model, original output if it was rewritten)
+        """
+        if self.output_governor is None:
+            return content, None
+        arguments = tool_input if isinstance(tool_input, dict) else None
+        governed = self.output_governor.govern(tool_name, content, arguments)
+        if not governed.changed:
+            return content, None
+        metrics = get_metrics()
+        metrics.increment("tool_outputs_governed_total", tool=tool_name)
+        metrics.increment(
+            "tool_output_tokens_saved_total",
+            governed.original_tokens - governed.tokens,
+            tool=tool_name,
+        )
+        metrics.increment(
+            "tool_output_bytes_saved_total",
+            governed.original_bytes - governed.bytes,
+            tool=tool_name,
+        )
+        return governed.content, content
+
+    def _parse_tool_input(self, arguments: str) -> dict | str:
+        """Pass JSON object arguments as a dict so each field maps to a tool arg."""
+        try:
+            parsed = json.loads(arguments) if arguments else {}
+        except json.JSONDecodeError:
+            return arguments
+        return parsed if isinstance(parsed, dict) else arguments
 
     def _inject_context(self, arguments: str, state: AgentState) -> str:
         """Inject class/spec/role into tool call arguments."""
@@ -2,7 +2,18 @@
 Orchestrators for managing agent execution and streaming.
 """
 
-from .observers import DatabaseObserver, StreamObserver
+from .observers import (
+    AnswerCacheObserver,
+    DatabaseObserver,
+    StreamObserver,
+    SummaryRefreshObserver,
+)
 from .sse_orchestrator import SSEOrchestrator
 
-__all__ = ["SSEOrchestrator", "StreamObserver", "DatabaseObserver"]
+__all__ = [
+    "SSEOrchestrator",
+    "StreamObserver",
+    "DatabaseObserver",
+    "AnswerCacheObserver",
+    "SummaryRefreshObserver",
+]
@@ -2,7 +2,14 @@
 Stream observers for the SSE orchestrator.
 """
 
+from .answer_cache_observer import AnswerCacheObserver
 from .base import StreamObserver
 from .db_observer import DatabaseObserver
+from .summary_refresh_observer import SummaryRefreshObserver
 
-__all__ = ["StreamObserver", "DatabaseObserver"]
+__all__ = [
+    "StreamObserver",
+    "DatabaseObserver",
+    "AnswerCacheObserver",
+    "SummaryRefreshObserver",
+]
@@ -0,0 +1,75 @@
+"""
+Answer cache observer for recording final answers during streaming.
+"""
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from app.application.agent.answer_cache import AnswerCache
+from app.application.agent.state_schema import StreamEvent
+
+
+class AnswerCacheObserver:
+    """
+    Observer that stores the final agent answer in the answer cache.
+
+    Only the last AI message without tool calls is recorded, and only if the
+    stream completes without errors.
+    """
+
+    def __init__(self, answer_cache: AnswerCache, cache_key: str):
+        """
+        Initialize the answer cache observer.
+
+        Args:
+            answer_cache: Cache receiving the final answer
+            cache_key: Key computed for the incoming question
+        """
+        self.answer_cache = answer_cache
+        self.cache_key = cache_key
+        self._final_answer: str | None = None
+        self._failed = False
+
+    async def on_event(self, event: StreamEvent) -> None:
+        """Stream events are not needed; the answer comes from node output."""
+        return
+
+    async def on_node_complete(self, node: str, messages: list[BaseMessage]) -> None:
+        """
+        Capture the final AI message produced by the agent node.
+
+        Args:
+            node: The node name that completed
+            messages: New messages produced by the node
+        """
+        for message in messages:
+            if not isinstance(message, AIMessage):
+                continue
+            if message.tool_calls or not isinstance(message.content, str):
+                self._final_answer = None
+                continue
+            self._final_answer = message.content
+
+    async def on_summary_update(
+        self, summary: str, through_id: str, usage: dict | None = None
+    ) -> None:
+        """Summaries do not affect the cached answer."""
+        return
+
+    async def on_stream_complete(self, full_response: str) -> None:
+        """
+        Store the captured answer once the stream completes.
+
+        Args:
+            full_response: The complete accumulated response text
+        """
+        if not self._failed and self._final_answer:
+            self.answer_cache.set(self.cache_key, self._final_answer)
+
+    async def on_error(self, error: Exception) -> None:
+        """
+        Never cache answers from failed runs.
+
+        Args:
+            error: The exception that occurred
+        """
+        self._failed = True
@@ -37,6 +37,19 @@ class StreamObserver(Protocol):
         """
         ...
 
+    async def on_summary_update(
+        self, summary: str, through_id: str, usage: dict | None = None
+    ) -> None:
+        """
+        Called when a node folds older turns into the thread summary.
+
+        Args:
+            summary: The updated rolling summary
+            through_id: ID of the last message covered by the summary
+            usage: Provider usage of the summary call, if reported
+        """
+        ...
+
     async def on_stream_complete(self, full_response: str) -> None:
         """
         Called when the stream is complete.
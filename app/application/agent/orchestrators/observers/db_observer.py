@@ -9,8 +9,13 @@ from datetime import datetime, timezone
 from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
 
 from app.application.agent.state_schema import StreamEvent
-from app.domain import Message, MessageRole, ToolCall
-from app.domain.repositories import MessageRepository
+from app.domain import Message, MessageRole, TokenUsage, ToolCall
+from app.domain.repositories import (
+    MessageRepository,
+    ThreadRepository,
+    UsageRepository,
+)
+from app.infrastructure.llm.tokenizer import count_tokens
 
 
 class DatabaseObserver:
@@ -18,13 +23,17 @@ class DatabaseObserver:
     Observer that persists AI messages to the database.
 
     This observer listens to stream events and saves the AI response
-    to the database when the stream completes.
+    to the database when the stream completes. Provider usage reported by
+    each model call is accumulated and written once per run.
     """
 
     def __init__(
         self,
         message_repository: MessageRepository,
         thread_id: str,
+        user_id: str | None = None,
+        usage_repository: UsageRepository | None = None,
+        thread_repository: ThreadRepository | None = None,
     ):
         """
         Initialize the database observer.
@@ -32,39 +41,28 @@ class DatabaseObserver:
         Args:
             message_repository: Repository for message persistence
             thread_id: ID of the conversation thread
+            user_id: ID of the user, required for usage accounting
+            usage_repository: Optional repository for per-user token totals
+            thread_repository: Optional repository for storing thread summaries
         """
         self.message_repository = message_repository
         self.thread_id = thread_id
+        self.usage_repository = usage_repository
+        self.thread_repository = thread_repository
+        self.usage = TokenUsage(user_id=user_id or "", thread_id=thread_id)
 
     async def on_event(self, event: StreamEvent) -> None:
         """
         Called when a stream event is processed.
 
-        Persists tool results as they happen to ensure tool messages
-        are available in history for subsequent LLM calls.
+        Tool results are persisted once, from the tools node output in
+        on_node_complete, where the real tool_call_id is known. Saving them
+        here as well stored a second copy keyed by the LangChain run id.
 
         Args:
             event: The stream event that was processed
         """
-        if event.event != "on_tool_end":
-            return
-
-        tool_call_id = event.run_id or ""
-        if not tool_call_id:
-            return
-
-        output = event.data.get("output")
-        content = json.dumps(output) if isinstance(output, (dict, list)) else str(output)
-
-        tool_message = Message(
-            id=f"tool_{tool_call_id}",
-            thread_id=self.thread_id,
-            role=MessageRole.TOOL,
-            content=content,
-            tool_call_id=tool_call_id,
-            tool_result=content,
-        )
-        await self.message_repository.save(tool_message)
+        return
 
     async def on_node_complete(self, node: str, messages: list[BaseMessage]) -> None:
         """
@@ -77,34 +75,69 @@ class DatabaseObserver:
             messages: New messages produced by the node
         """
         for message in messages:
-            domain_message = self._convert_message(message)
-            if domain_message is not None:
-                await self.message_repository.save(domain_message)
+            if isinstance(message, AIMessage) and message.usage_metadata:
+                self.usage.add_reported_call(message.usage_metadata)
+
+        domain_messages = [
+            domain_message
+            for domain_message in map(self._convert_message, messages)
+            if domain_message is not None
+        ]
+        if domain_messages:
+            # Single batch so thread counters are bumped once per node
+            await self.message_repository.save_many(domain_messages)
+
+    async def on_summary_update(
+        self, summary: str, through_id: str, usage: dict | None = None
+    ) -> None:
+        """
+        Store the rolling summary on the thread so later turns reuse it.
+
+        Args:
+            summary: The updated rolling summary
+            through_id: ID of the last message covered by the summary
+            usage: Provider usage of the summary call, billed with the turn
+        """
+        if usage:
+            self.usage.add_reported_call(usage)
+        if self.thread_repository is not None:
+            await self.thread_repository.update_summary(
+                self.thread_id, summary, through_id
+            )
 
     async def on_stream_complete(self, full_response: str) -> None:
         """
         Called when the stream is complete.
 
-        Saves the AI response to the database.
+        Messages are persisted on node completion; this flushes the run's
+        token usage.
 
         Args:
             full_response: The complete accumulated response text
         """
-        # Persistence now happens on node completion.
-        # We keep this method as a no-op for future extensions.
-        return
+        await self._flush_usage()
 
     async def on_error(self, error: Exception) -> None:
         """
         Called when an error occurs during streaming.
 
-        Could be extended to log errors or save partial responses.
+        Calls that completed before the error were still billed, so their
+        usage is flushed.
 
         Args:
             error: The exception that occurred
         """
-        # Could log the error or save partial response
-        pass
+        await self._flush_usage()
+
+    async def _flush_usage(self) -> None:
+        """Write accumulated usage in one batch and reset the accumulator."""
+        if self.usage_repository is None or not self.usage.user_id:
+            return
+        if self.usage.llm_calls == 0:
+            return
+        usage = self.usage
+        self.usage = TokenUsage(user_id=usage.user_id, thread_id=usage.thread_id)
+        await self.usage_repository.record([usage])
 
     def _convert_message(self, message: BaseMessage) -> Message | None:
         """
@@ -144,16 +177,33 @@ class DatabaseObserver:
             content=message.content or "",
             timestamp=datetime.now(timezone.utc),
             tool_calls=tool_calls,
+            token_count=self._count_ai_tokens(message),
         )
 
+    @staticmethod
+    def _count_ai_tokens(message: AIMessage) -> int:
+        """Prefer provider-reported output tokens over a local count."""
+        if message.usage_metadata:
+            return message.usage_metadata.get("output_tokens", 0)
+        return count_tokens(message.content or "")
+
     def _convert_tool_message(self, message: ToolMessage) -> Message:
-        """Convert ToolMessage to domain Message."""
+        """
+        Convert ToolMessage to domain Message.
+
+        The content is what the model saw; when the tool output governor
+        rewrote it, the original output (the message artifact) is kept as the
+        tool result.
+        """
+        content = message.content or ""
+        original = message.artifact if isinstance(message.artifact, str) else content
         return Message(
             id=str(uuid.uuid4()),
             thread_id=self.thread_id,
             role=MessageRole.TOOL,
-            content=message.content or "",
+            content=content,
             timestamp=datetime.now(timezone.utc),
             tool_call_id=message.tool_call_id,
-            tool_result=message.content or "",
+            tool_result=original,
+            token_count=count_tokens(content),
         )
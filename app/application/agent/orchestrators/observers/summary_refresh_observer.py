@@ -0,0 +1,82 @@
+"""
+Summary refresh observer for scheduling summaries after the stream.
+"""
+
+from langchain_core.messages import BaseMessage, RemoveMessage
+
+from app.application.agent.state_schema import AgentState, StreamEvent
+from app.application.agent.summary_refresher import SummaryRefresher
+
+
+class SummaryRefreshObserver:
+    """
+    Observer that refreshes the thread summary once the answer is streamed.
+
+    It tracks the run's history (including turns folded before answering) and
+    hands it to the refresher only if the stream completes without errors.
+    """
+
+    def __init__(self, refresher: SummaryRefresher, state: AgentState):
+        """
+        Initialize the summary refresh observer.
+
+        Args:
+            refresher: Refresher running the summary in the background
+            state: Initial state of the run
+        """
+        self.refresher = refresher
+        self.thread_id = state.thread_id
+        self.user_id = state.user_id
+        self._messages = list(state.messages)
+        self._summary = state.summary
+        self._failed = False
+
+    async def on_event(self, event: StreamEvent) -> None:
+        """Stream events are not needed; the history comes from node output."""
+        return
+
+    async def on_node_complete(self, node: str, messages: list[BaseMessage]) -> None:
+        """
+        Apply the node's messages to the tracked history.
+
+        Args:
+            node: The node name that completed
+            messages: New messages produced by the node
+        """
+        removed = {
+            message.id for message in messages if isinstance(message, RemoveMessage)
+        }
+        if removed:
+            self._messages = [
+                message for message in self._messages if message.id not in removed
+            ]
+        self._messages.extend(
+            message for message in messages if not isinstance(message, RemoveMessage)
+        )
+
+    async def on_summary_update(
+        self, summary: str, through_id: str, usage: dict | None = None
+    ) -> None:
+        """Track the summary written before answering."""
+        self._summary = summary
+
+    async def on_stream_complete(self, full_response: str) -> None:
+        """
+        Schedule the refresh once the stream completes.
+
+        Args:
+            full_response: The complete accumulated response text
+        """
+        if not self._failed:
+            self.refresher.schedule(
+                self.thread_id, self.user_id, self._messages, self._summary
+            )
+
+    async def on_error(self, error: Exception) -> None:
+        """
+        Skip the refresh of failed runs.
+
+        Args:
+            error: The exception that occurred
+        """
+        self._failed = True
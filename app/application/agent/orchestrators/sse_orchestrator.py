@@ -3,13 +3,15 @@ SSE Orchestrator for managing graph execution and streaming with debouncing.
 """
 
 import asyncio
+import uuid
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 
 from langgraph.graph.state import CompiledStateGraph
 
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage
 
+from app.application.agent.run_context import RunContext
 from app.application.agent.state_schema import AgentState, StreamEvent
 from app.application.agent.streaming import (
     build_langchain_stream_event,
@@ -23,6 +25,9 @@ from .observers.base import StreamObserver
 DEBOUNCE_INTERVAL_MS = 50
 DEBOUNCE_INTERVAL_S = DEBOUNCE_INTERVAL_MS / 1000
 
+# Size of the chunks a cached answer is replayed in
+REPLAY_CHUNK_CHARS = 64
+
 
 @dataclass
 class _StreamState:
@@ -89,6 +94,13 @@ class SSEOrchestrator:
         for observer in self._observers:
             await observer.on_node_complete(node, messages)
 
+    async def _notify_summary_update(
+        self, summary: str, through_id: str, usage: dict | None
+    ) -> None:
+        """Notify all observers that the thread summary changed."""
+        for observer in self._observers:
+            await observer.on_summary_update(summary, through_id, usage)
+
     async def _notify_error(self, error: Exception) -> None:
         """Notify all observers of an error."""
         for observer in self._observers:
@@ -115,8 +127,12 @@ class SSEOrchestrator:
             llm_event_context=None,
         )
 
+        run_context = RunContext()
+
         try:
-            async for event in self.graph.astream_events(state, version="v2"):
+            async for event in self.graph.astream_events(
+                state, run_context.as_config(), version="v2"
+            ):
                 event_kind = event.get("event")
                 event_data = event.get("data", {})
                 event_name = event.get("name", "")
@@ -151,7 +167,10 @@ class SSEOrchestrator:
                     continue
 
                 if event_kind == "on_chain_end" and event_name:
-                    await self._handle_chain_end(event_data, event_name, stream_state)
+                    if self._is_graph_node(event, event_name):
+                        await self._handle_chain_end(
+                            event_data, event_name, stream_state
+                        )
                     yield format_sse_event(build_langchain_stream_event(event))
                     continue
 
@@ -179,6 +198,76 @@ class SSEOrchestrator:
             error_event = StreamEvent(event="error", data={"error": str(e)})
             yield format_sse_event(error_event)
 
+        finally:
+            await run_context.aclose()
+
+    async def stream_answer(self, answer: str) -> AsyncGenerator[str, None]:
+        """
+        Replay a precomputed answer as if the agent node had produced it.
+
+        Emits the same event sequence as a live run without tool calls
+        (chain start, chat model start/stream/end, chain end, done), and
+        notifies observers so the answer is persisted like a live one.
+
+        Args:
+            answer: Final answer text
+
+        Yields:
+            SSE-formatted event strings
+        """
+        chain_run_id = str(uuid.uuid4())
+        model_run_id = str(uuid.uuid4())
+        node_metadata = {"langgraph_node": "agent"}
+
+        try:
+            yield format_sse_event(
+                StreamEvent(event="on_chain_start", name="agent", run_id=chain_run_id)
+            )
+            yield format_sse_event(
+                StreamEvent(
+                    event="on_chat_model_start",
+                    run_id=model_run_id,
+                    parent_ids=[chain_run_id],
+                    metadata=node_metadata,
+                )
+            )
+            for start in range(0, len(answer), REPLAY_CHUNK_CHARS):
+                stream_event = StreamEvent(
+                    event="on_chat_model_stream",
+                    run_id=model_run_id,
+                    parent_ids=[chain_run_id],
+                    metadata=node_metadata,
+                    data={
+                        "chunk": {"content": answer[start : start + REPLAY_CHUNK_CHARS]}
+                    },
+                )
+                await self._notify_observers(stream_event)
+                yield format_sse_event(stream_event)
+            yield format_sse_event(
+                StreamEvent(
+                    event="on_chat_model_end",
+                    run_id=model_run_id,
+                    parent_ids=[chain_run_id],
+                    metadata=node_metadata,
+                    data={"output": {"content": answer}},
+                )
+            )
+
+            await self._notify_node_complete("agent", [AIMessage(content=answer)])
+            yield format_sse_event(
+                StreamEvent(event="on_chain_end", name="agent", run_id=chain_run_id)
+            )
+
+            await self._notify_complete(answer)
+            done_event = StreamEvent(event="done", data={})
+            await self._notify_observers(done_event)
+            yield format_sse_event(done_event)
+
+        except Exception as e:
+            await self._notify_error(e)
+            error_event = StreamEvent(event="error", data={"error": str(e)})
+            yield format_sse_event(error_event)
+
     def _now(self) -> float:
         return asyncio.get_event_loop().time()
 
@@ -232,6 +321,16 @@ class SSEOrchestrator:
         await self._notify_observers(stream_event)
         return format_sse_event(stream_event)
 
+    @staticmethod
+    def _is_graph_node(event: dict, event_name: str) -> bool:
+        """
+        Check whether a chain event belongs to a graph node.
+
+        The root graph run also ends with the full state (after summarization
+        even a shorter one), which must not be reported as new messages.
+        """
+        return event.get("metadata", {}).get("langgraph_node") == event_name
+
     async def _handle_chain_end(
         self, event_data: dict, node: str, stream_state: _StreamState
     ) -> None:
@@ -242,6 +341,14 @@ class SSEOrchestrator:
         if new_messages:
             await self._notify_node_complete(node, new_messages)
 
+        output = event_data.get("output")
+        if isinstance(output, dict) and output.get("summary_through_id"):
+            await self._notify_summary_update(
+                output["summary"],
+                output["summary_through_id"],
+                output.get("summary_usage"),
+            )
+
     def _extract_new_messages(
         self, event_data: dict, total_message_count: int
     ) -> tuple[list[BaseMessage], int]:
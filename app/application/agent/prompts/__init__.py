@@ -0,0 +1,19 @@
+"""
+Agent prompts module.
+"""
+
+from .assembler import PromptAssembler, build_system_prompt, sort_tools
+from .compactor import CompactionStats, PromptCompactor
+from .summary_prompt import SUMMARY_PROMPT
+from .system_prompt import AGENT_SYSTEM_PROMPT, AGENT_SYSTEM_PROMPT_VERSION
+
+__all__ = [
+    "AGENT_SYSTEM_PROMPT",
+    "AGENT_SYSTEM_PROMPT_VERSION",
+    "CompactionStats",
+    "PromptAssembler",
+    "PromptCompactor",
+    "SUMMARY_PROMPT",
+    "build_system_prompt",
+    "sort_tools",
+]
@@ -0,0 +1,140 @@
+"""
+Prompt assembly ordered for provider-side prefix caching.
+
+OpenAI-compatible backends cache the longest previously seen prompt prefix.
+The prompt is therefore laid out from the most to the least shared part:
+
+1. Tool schemas (sent by the provider ahead of the messages, sorted by name)
+2. The static agent system prompt (identical for every user)
+3. The spec context block and its context pack (identical for every user of
+   a class/spec/role)
+4. The thread summary, if older turns were summarized (changes rarely)
+5. The conversation history (volatile, always last)
+
+Nothing per-request (timestamps, ids, user names) may appear before the
+history, otherwise the cached prefix stops matching.
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+from langchain_core.messages import BaseMessage, SystemMessage
+
+from app.application.agent.knowledge.context_packs import ContextPackStore
+
+from .system_prompt import AGENT_SYSTEM_PROMPT
+
+SPEC_CONTEXT_TEMPLATE = """
+## Player context
+Class: {wow_class}
+Specialization: {wow_spec}
+Role: {wow_role}
+
+Tailor every answer to this class, specialization and role. Pass these exact
+values to tools that take wow_class, wow_spec or wow_role.
+"""
+
+CONTEXT_PACK_TEMPLATE = """
+## Knowledge base notes for this specialization
+{context_pack}
+
+Answer from these notes when they cover the question. Call search_helix only
+for details they do not cover.
+"""
+
+SUMMARY_TEMPLATE = """Summary of the earlier conversation with this player:
+{summary}"""
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.split())
+
+
+@lru_cache(maxsize=256)
+def build_system_prompt(
+    wow_class: str, wow_spec: str, wow_role: str, context_pack: str = ""
+) -> str:
+    """
+    Build the system prompt for a spec context.
+
+    The result is byte-identical for the same context, so every
+    user of a spec shares the same cacheable prefix.
+
+    Args:
+        wow_class: WoW class context
+        wow_spec: WoW spec context
+        wow_role: WoW role context
+        context_pack: Precomputed knowledge base notes for the context
+
+    Returns:
+        Static system prompt followed by the spec context block and the
+        context pack (if any)
+    """
+    prompt = AGENT_SYSTEM_PROMPT + SPEC_CONTEXT_TEMPLATE.format(
+        wow_class=_normalize(wow_class),
+        wow_spec=_normalize(wow_spec),
+        wow_role=_normalize(wow_role),
+    )
+    if context_pack:
+        prompt += CONTEXT_PACK_TEMPLATE.format(context_pack=context_pack)
+    return prompt
+
+
+def sort_tools[ToolT](tools: Sequence[ToolT]) -> list[ToolT]:
+    """
+    Order tools deterministically so their schemas form a stable prefix.
+
+    Args:
+        tools: Tools to bind to the model
+
+    Returns:
+        Tools sorted by name
+    """
+    return sorted(tools, key=lambda tool: getattr(tool, "name", ""))
+
+
+class PromptAssembler:
+    """Assembles the model input with the stable prefix first."""
+
+    def __init__(self, context_packs: ContextPackStore | None = None):
+        """
+        Initialize the assembler.
+
+        Args:
+            context_packs: Per-spec context packs placed in the system prompt
+        """
+        self.context_packs = context_packs
+
+    def assemble(
+        self,
+        messages: Sequence[BaseMessage],
+        wow_class: str,
+        wow_spec: str,
+        wow_role: str,
+        summary: str | None = None,
+    ) -> list[BaseMessage]:
+        """
+        Build the message list sent to the model.
+
+        Args:
+            messages: Conversation history (volatile suffix)
+            wow_class: WoW class context
+            wow_spec: WoW spec context
+            wow_role: WoW role context
+            summary: Rolling summary of turns dropped from the history
+
+        Returns:
+            System prompt with spec context, the summary (if any) and the history
+        """
+        context_pack = ""
+        if self.context_packs is not None:
+            pack = self.context_packs.get(wow_class, wow_spec, wow_role)
+            if pack is not None:
+                context_pack = pack.text
+        system_prompt = build_system_prompt(wow_class, wow_spec, wow_role, context_pack)
+        prefix: list[BaseMessage] = [SystemMessage(content=system_prompt)]
+        if summary:
+            prefix.append(
+                SystemMessage(content=SUMMARY_TEMPLATE.format(summary=summary))
+            )
+        return [*prefix, *messages]
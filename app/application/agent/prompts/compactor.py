@@ -0,0 +1,150 @@
+"""
+Prompt compaction of tool outputs replayed from history.
+
+Past tool results are the bulk of a long thread's prompt: the same Helix
+payload is often fetched again on later turns, and old results rarely matter
+once they have been answered. Compaction only rewrites the prompt sent to
+the model; the graph state and the stored messages keep the full outputs.
+"""
+
+import hashlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from app.infrastructure.llm.tokenizer import count_tokens
+
+DUPLICATE_TEMPLATE = "[Same result as tool call {tool_call_id}, repeated below]"
+TRUNCATED_TEMPLATE = (
+    "{head}\n[... {elided} characters of an older tool result omitted; "
+    "call the tool again if the full output is needed]"
+)
+MISSING_RESULT = "[No result was recorded for this tool call]"
+
+
+@dataclass
+class CompactionStats:
+    """Outcome of compacting one prompt."""
+
+    deduplicated: int = 0
+    truncated: int = 0
+    dropped: int = 0
+    tokens_saved: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """Whether compaction rewrote anything."""
+        return bool(self.deduplicated or self.truncated or self.dropped)
+
+
+def _payload_key(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class PromptCompactor:
+    """
+    Rewrites tool outputs in the history sent to the model.
+
+    - A payload repeated verbatim is kept only at its latest occurrence;
+      earlier copies point to it.
+    - Outputs from user turns older than keep_tool_turns are truncated.
+    - Tool results without a matching call are dropped, and calls without a
+      result get a placeholder, so the call/result pairing stays valid.
+    """
+
+    def __init__(self, keep_tool_turns: int = 1, stale_tool_chars: int = 400):
+        self.keep_tool_turns = max(1, keep_tool_turns)
+        self.stale_tool_chars = stale_tool_chars
+
+    def compact(
+        self, messages: Sequence[BaseMessage]
+    ) -> tuple[list[BaseMessage], CompactionStats]:
+        """
+        Compact tool outputs in a message history.
+
+        Args:
+            messages: Conversation history in order
+
+        Returns:
+            Tuple of (compacted messages, stats)
+        """
+        stats = CompactionStats()
+        messages = self._repair_pairing(messages, stats)
+
+        human_indexes = [
+            index
+            for index, message in enumerate(messages)
+            if isinstance(message, HumanMessage)
+        ]
+        recent_start = (
+            human_indexes[-self.keep_tool_turns]
+            if len(human_indexes) >= self.keep_tool_turns
+            else 0
+        )
+
+        # Latest occurrence of each payload, by tool_call_id
+        latest_by_payload: dict[str, str] = {}
+        for message in messages:
+            if isinstance(message, ToolMessage) and isinstance(message.content, str):
+                latest_by_payload[_payload_key(message.content)] = message.tool_call_id
+
+        compacted: list[BaseMessage] = []
+        for index, message in enumerate(messages):
+            if not isinstance(message, ToolMessage) or not isinstance(
+                message.content, str
+            ):
+                compacted.append(message)
+                continue
+
+            content = message.content
+            latest_call_id = latest_by_payload[_payload_key(content)]
+            if latest_call_id != message.tool_call_id:
+                new_content = DUPLICATE_TEMPLATE.format(tool_call_id=latest_call_id)
+                stats.deduplicated += 1
+            elif index < recent_start and len(content) > self.stale_tool_chars:
+                new_content = TRUNCATED_TEMPLATE.format(
+                    head=content[: self.stale_tool_chars],
+                    elided=len(content) - self.stale_tool_chars,
+                )
+                stats.truncated += 1
+            else:
+                compacted.append(message)
+                continue
+
+            stats.tokens_saved += count_tokens(content) - count_tokens(new_content)
+            compacted.append(message.model_copy(update={"content": new_content}))
+
+        return compacted, stats
+
+    def _repair_pairing(
+        self, messages: Sequence[BaseMessage], stats: CompactionStats
+    ) -> list[BaseMessage]:
+        """Drop orphan tool results and fill in results for unanswered calls."""
+        repaired: list[BaseMessage] = []
+        pending: list[str] = []
+        for message in messages:
+            if isinstance(message, ToolMessage):
+                if message.tool_call_id in pending:
+                    pending.remove(message.tool_call_id)
+                    repaired.append(message)
+                else:
+                    stats.dropped += 1
+                    stats.tokens_saved += count_tokens(str(message.content))
+                continue
+
+            repaired.extend(self._placeholders(pending))
+            pending = []
+            repaired.append(message)
+            if isinstance(message, AIMessage):
+                pending = [call["id"] for call in message.tool_calls if call.get("id")]
+
+        repaired.extend(self._placeholders(pending))
+        return repaired
+
+    @staticmethod
+    def _placeholders(tool_call_ids: list[str]) -> list[ToolMessage]:
+        return [
+            ToolMessage(content=MISSING_RESULT, tool_call_id=tool_call_id)
+            for tool_call_id in tool_call_ids
+        ]
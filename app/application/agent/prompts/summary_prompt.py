@@ -0,0 +1,17 @@
+SUMMARY_PROMPT = """
+You maintain a running summary of a conversation between a World of Warcraft
+player and their coach. Update the existing summary with the new messages.
+
+Keep what the coach needs to continue the conversation: the player's goals,
+the content they play, gear or talent details they shared, advice already
+given and open questions. Drop greetings and small talk. Write at most 200
+words in the language of the conversation.
+
+Existing summary:
+{summary}
+
+New messages:
+{transcript}
+
+Updated summary:
+"""
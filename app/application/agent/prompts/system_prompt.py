@@ -1,3 +1,6 @@
+# Bump whenever the assembled system prompt changes; used to invalidate cached answers
+AGENT_SYSTEM_PROMPT_VERSION = "3"
+
 AGENT_SYSTEM_PROMPT = """
 You are an expert World of Warcraft coach. You help players improve their gameplay by providing advice on:
 - Class and specialization mechanics
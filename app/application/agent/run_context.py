@@ -0,0 +1,58 @@
+"""
+Per-run context shared by the nodes and tools of one graph execution.
+
+The orchestrator creates a RunContext for every run and passes it in
+config["configurable"]. It carries run-scoped objects that must not live in
+the graph state (tasks, caches) and is closed when the run ends.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from langchain_core.runnables import RunnableConfig
+
+if TYPE_CHECKING:
+    from .speculation import Speculation
+
+RUN_CONTEXT_KEY = "run_context"
+
+
+@dataclass
+class RunContext:
+    """Run-scoped state of one graph execution."""
+
+    # Tool calls started ahead of the model's first tool step, if any
+    speculation: Speculation | None = None
+    # Tool results by tool name and canonical arguments, as
+    # (content for the model, original output if it was rewritten)
+    tool_results: dict[str, tuple[str, str | None]] = field(default_factory=dict)
+
+    def as_config(self) -> RunnableConfig:
+        """Build the graph config carrying this context."""
+        return {"configurable": {RUN_CONTEXT_KEY: self}}
+
+    def finish_speculation(self) -> None:
+        """Settle the speculation (cancelling unclaimed calls), if any."""
+        if self.speculation is not None:
+            self.speculation.finish()
+
+    async def aclose(self) -> None:
+        """Release run-scoped resources at the end of the run."""
+        self.finish_speculation()
+
+
+def get_run_context(config: RunnableConfig | None) -> RunContext | None:
+    """
+    Get the RunContext of the current run.
+
+    Args:
+        config: Config passed to a node or tool
+
+    Returns:
+        The run's context, or None when the graph runs without one
+    """
+    if not config:
+        return None
+    return config.get("configurable", {}).get(RUN_CONTEXT_KEY)
@@ -0,0 +1,228 @@
+"""
+Speculative tool execution.
+
+Tool latency normally starts only after the model has streamed its tool
+call. For calls that are predictable from the thread context (the first turn
+of a thread almost always searches Helix for the thread's spec), the
+expensive part of the call is started together with the first model call
+of the turn, and the tool picks up the result when the model's arguments
+lead to the same work. Unclaimed speculative calls are cancelled.
+
+Whether a prediction is worth starting is learned per tool and turn kind
+from how often it matched the model's actual calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import AIMessage
+
+from app.infrastructure.metrics import get_metrics
+
+from .state_schema import AgentState
+
+logger = logging.getLogger(__name__)
+
+TURN_FIRST = "first"
+TURN_FOLLOWUP = "followup"
+
+
+@dataclass(frozen=True)
+class PredictedCall:
+    """
+    A tool call expected in the model's next tool step.
+
+    Attributes:
+        tool_name: Tool the prediction is for
+        key: Canonical key of the work the tool would do; the tool claims
+            the speculative result with the key built from its actual args
+        run: Starts that work
+    """
+
+    tool_name: str
+    key: str
+    run: Callable[[], Awaitable[Any]]
+
+
+Predictor = Callable[[AgentState], PredictedCall | None]
+
+
+class ToolCallStats:
+    """
+    Exponentially weighted match rate of predictions per tool and turn kind.
+    """
+
+    def __init__(self, priors: dict[str, float], decay: float):
+        """
+        Initialize the statistics.
+
+        Args:
+            priors: Initial match probability per turn kind
+            decay: Weight of each new observation (0-1)
+        """
+        self.priors = priors
+        self.decay = decay
+        self._rates: dict[tuple[str, str], float] = {}
+
+    def probability(self, tool_name: str, turn_kind: str) -> float:
+        """Get the current match probability of a prediction."""
+        return self._rates.get((tool_name, turn_kind), self.priors.get(turn_kind, 0.0))
+
+    def record(self, tool_name: str, turn_kind: str, matched: bool) -> None:
+        """Fold one prediction outcome into the match rate."""
+        rate = self.probability(tool_name, turn_kind)
+        self._rates[(tool_name, turn_kind)] = rate * (1 - self.decay) + (
+            self.decay if matched else 0.0
+        )
+
+    def snapshot(self) -> dict[str, float]:
+        """Return the learned match rates."""
+        return {
+            f"{tool}:{kind}": round(rate, 3)
+            for (tool, kind), rate in self._rates.items()
+        }
+
+
+@dataclass
+class _Prediction:
+    call: PredictedCall
+    task: asyncio.Task[Any] | None
+    matched: bool = False
+
+
+@dataclass
+class Speculation:
+    """Predictions (and started calls) for the first tool step of one turn."""
+
+    speculator: ToolSpeculator
+    turn_kind: str
+    predictions: list[_Prediction] = field(default_factory=list)
+    finished: bool = False
+
+    def claim(self, tool_name: str, key: str) -> asyncio.Task[Any] | None:
+        """
+        Claim the speculative call matching an actual tool call.
+
+        Args:
+            tool_name: Tool being executed
+            key: Canonical key built from the tool's actual arguments
+
+        Returns:
+            The started call to await, or None to run the tool normally
+        """
+        if self.finished:
+            return None
+        for prediction in self.predictions:
+            if prediction.call.tool_name == tool_name and prediction.call.key == key:
+                prediction.matched = True
+                return prediction.task
+        return None
+
+    def finish(self) -> None:
+        """Record outcomes and cancel unclaimed calls; idempotent."""
+        if self.finished:
+            return
+        self.finished = True
+        self.speculator.record(self)
+
+
+class ToolSpeculator:
+    """Starts predicted tool calls for the first tool step of a turn."""
+
+    def __init__(
+        self,
+        predictors: dict[str, Predictor],
+        stats: ToolCallStats,
+        min_confidence: float,
+    ):
+        """
+        Initialize the speculator.
+
+        Args:
+            predictors: Prediction function per tool name
+            stats: Learned match rates
+            min_confidence: Match probability needed to start a call
+        """
+        self.predictors = predictors
+        self.stats = stats
+        self.min_confidence = min_confidence
+        self.started = 0
+        self.hits = 0
+
+    def start(self, state: AgentState) -> Speculation:
+        """
+        Predict the turn's tool calls and start the confident ones.
+
+        Predictions below the confidence threshold are still tracked, so
+        their match rate keeps being learned.
+
+        Args:
+            state: Agent state at the first model call of the turn
+
+        Returns:
+            The turn's speculation
+        """
+        turn_kind = self._turn_kind(state)
+        speculation = Speculation(speculator=self, turn_kind=turn_kind)
+        for tool_name, predictor in self.predictors.items():
+            call = predictor(state)
+            if call is None:
+                continue
+            task = None
+            if self.stats.probability(tool_name, turn_kind) >= self.min_confidence:
+                task = asyncio.create_task(call.run())
+                # Unclaimed calls are cancelled; don't log their errors
+                task.add_done_callback(_consume_exception)
+                self.started += 1
+            speculation.predictions.append(_Prediction(call=call, task=task))
+        return speculation
+
+    def record(self, speculation: Speculation) -> None:
+        """Learn from a finished speculation and discard unclaimed calls."""
+        metrics = get_metrics()
+        for prediction in speculation.predictions:
+            tool_name = prediction.call.tool_name
+            self.stats.record(tool_name, speculation.turn_kind, prediction.matched)
+            if prediction.task is None:
+                continue
+            if prediction.matched:
+                self.hits += 1
+                outcome = "hit"
+            else:
+                prediction.task.cancel()
+                outcome = "wasted"
+            metrics.increment(
+                "speculative_tool_calls_total", tool=tool_name, outcome=outcome
+            )
+            logger.debug(
+                "Speculative %s call %s (turn=%s)",
+                tool_name,
+                outcome,
+                speculation.turn_kind,
+            )
+
+    def stats_snapshot(self) -> dict[str, Any]:
+        """Return hit rate and learned match rates."""
+        return {
+            "started": self.started,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.started if self.started else 0.0,
+            "match_rates": self.stats.snapshot(),
+        }
+
+    @staticmethod
+    def _turn_kind(state: AgentState) -> str:
+        has_answer = any(isinstance(message, AIMessage) for message in state.messages)
+        if has_answer or state.summary:
+            return TURN_FOLLOWUP
+        return TURN_FIRST
+
+
+def _consume_exception(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
@@ -2,7 +2,7 @@
 LangGraph state schema for the agent.
 """
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
@@ -23,6 +23,11 @@ class AgentState(BaseModel):
         wow_class: WoW class context (required)
         wow_spec: WoW spec context (required)
         wow_role: WoW role context (required: tank, healer, dps)
+        summary: Rolling summary of turns no longer present in messages
+        summary_through_id: ID of the last message folded into the summary
+        summary_usage: Provider usage of the summary call made in this run
+        model_tier: Model tier chosen for the current turn ("fast" or "main")
+        tool_iterations: Tool steps executed in the current run
     """
 
     messages: Annotated[list[BaseMessage], add_messages] = Field(default_factory=list)
@@ -31,6 +36,11 @@ class AgentState(BaseModel):
     wow_class: str
     wow_spec: str
     wow_role: str
+    summary: str | None = None
+    summary_through_id: str | None = None
+    summary_usage: dict[str, Any] | None = None
+    model_tier: str | None = None
+    tool_iterations: int = 0
 
     class Config:
         arbitrary_types_allowed = True
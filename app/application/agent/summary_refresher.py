@@ -0,0 +1,92 @@
+"""
+Background summary refresh.
+
+Once an answer has been streamed, the thread's history may be over the
+summary trigger. Folding it then keeps the next turn's prompt compact, but
+doing so inside the graph would hold back the stream's `done` event and the
+request's commit for a whole model call. The refresh runs as a background
+task instead, with its own database session.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from langchain_core.messages import BaseMessage
+
+from app.domain import TokenUsage
+from app.domain.repositories import ThreadRepository, UsageRepository
+
+from .nodes.summarize_node import SummarizeNode
+
+logger = logging.getLogger(__name__)
+
+SummaryRepositories = Callable[
+    [], AbstractAsyncContextManager[tuple[ThreadRepository, UsageRepository]]
+]
+
+
+class SummaryRefresher:
+    """Refreshes thread summaries after answers, outside the request."""
+
+    def __init__(self, summarizer: SummarizeNode, repositories: SummaryRepositories):
+        """
+        Initialize the refresher.
+
+        Args:
+            summarizer: Node folding older turns (its threshold is the trigger)
+            repositories: Opens a unit of work yielding the thread and usage
+                repositories; it commits on exit
+        """
+        self.summarizer = summarizer
+        self.repositories = repositories
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def schedule(
+        self,
+        thread_id: str,
+        user_id: str,
+        messages: list[BaseMessage],
+        summary: str | None,
+    ) -> None:
+        """
+        Refresh the summary of a thread in the background.
+
+        Args:
+            thread_id: ID of the thread
+            user_id: ID of the user billed for the summary call
+            messages: Thread history after the answer, in order
+            summary: Current rolling summary
+        """
+        task = asyncio.create_task(self._refresh(thread_id, user_id, messages, summary))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        """Wait for pending refreshes, so none is cut off at shutdown."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _refresh(
+        self,
+        thread_id: str,
+        user_id: str,
+        messages: list[BaseMessage],
+        summary: str | None,
+    ) -> None:
+        try:
+            update = await self.summarizer.fold(messages, summary, thread_id)
+            if update is None:
+                return
+            usage = TokenUsage(user_id=user_id, thread_id=thread_id)
+            if update.usage:
+                usage.add_reported_call(update.usage)
+            async with self.repositories() as (thread_repository, usage_repository):
+                await thread_repository.update_summary(
+                    thread_id, update.summary, update.through_id
+                )
+                await usage_repository.record([usage])
+        except Exception:
+            # The next turn summarizes before answering if it has to
+            logger.exception("Summary refresh failed for thread %s", thread_id)
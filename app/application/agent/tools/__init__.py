@@ -5,7 +5,11 @@ Agent tools module.
 from langchain_core.tools import BaseTool
 
 from .get_spec_info import get_spec_info
-from .helix_search import search_helix
+from .helix_search import predict_search_helix, search_helix
+from .output_governor import GovernedOutput, ToolOutputGovernor, ToolOutputPolicy
+
+# Tools whose calls can be predicted from the thread context (see speculation)
+TOOL_PREDICTORS = {"search_helix": predict_search_helix}
 
 
 def get_all_tools() -> list[BaseTool]:
@@ -18,4 +22,13 @@ def get_all_tools() -> list[BaseTool]:
     return [get_spec_info, search_helix]
 
 
-__all__ = ["get_spec_info", "search_helix", "get_all_tools"]
+__all__ = [
+    "get_spec_info",
+    "search_helix",
+    "predict_search_helix",
+    "TOOL_PREDICTORS",
+    "GovernedOutput",
+    "ToolOutputGovernor",
+    "ToolOutputPolicy",
+    "get_all_tools",
+]
@@ -6,23 +6,81 @@ Searches HelixDB for claims/procedures filtered by class/spec/role.
 
 from __future__ import annotations
 
+import asyncio
 import json
 
-from langchain_core.tools import tool
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import ToolException, tool
 
+from app.application.agent.run_context import get_run_context
+from app.application.agent.speculation import PredictedCall
+from app.application.agent.state_schema import AgentState
+from app.domain.entities.helix_query_result import HelixQueryResult
+from app.infrastructure.config import get_settings
+from app.infrastructure.helix.cache import build_cache_key
 from app.infrastructure.helix.client import get_helix_client
+from app.infrastructure.helix.ranking import fit_to_token_budget, get_result_index_cache
+
+
+def helix_query_for(
+    wow_class: str, wow_spec: str, wow_role: str
+) -> tuple[str, dict[str, str]]:
+    """Pick the Helix query and params for a class/spec/role context."""
+    if wow_class and wow_spec:
+        return "SearchClaimsByTags", {
+            "wow_class": wow_class,
+            "wow_spec": wow_spec,
+            "wow_role": wow_role,
+        }
+    return "SearchClaimsByRole", {"wow_role": wow_role}
+
+
+def predict_search_helix(state: AgentState) -> PredictedCall:
+    """
+    Predict a search_helix call for the thread's class/spec/role.
+
+    Only the Helix query is speculated; ranking against the model's
+    user_query is cheap and runs once the actual call arrives.
+    """
+    query_name, params = helix_query_for(
+        state.wow_class, state.wow_spec, state.wow_role
+    )
+    return PredictedCall(
+        tool_name="search_helix",
+        key=build_cache_key("", query_name, params),
+        run=lambda: get_helix_client().query(query_name, params),
+    )
+
+
+async def _claimed_result(task: asyncio.Task) -> HelixQueryResult | None:
+    """
+    Await a speculative query that parallel calls may share.
+
+    The shield keeps one caller's timeout from cancelling the query for the
+    others. Returns None if the query itself was cancelled (e.g. when the
+    speculation was settled), so the caller runs the query normally.
+    """
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            raise
+        return None
 
 
 @tool
-def search_helix(
+async def search_helix(
     user_query: str,
     wow_class: str,
     wow_spec: str,
     wow_role: str,
     limit: int = 10,
+    config: RunnableConfig = None,
 ) -> str:
     """
-    Search HelixDB for claims/procedures filtered by tags.
+    Search HelixDB for claims/procedures filtered by tags, ranked by
+    relevance to the user query.
 
     Args:
         user_query: Natural language user query
@@ -31,24 +89,40 @@ def search_helix(
         wow_role: WoW role context
         limit: Max results to return
     """
+    settings = get_settings()
+    query_name, params = helix_query_for(wow_class, wow_spec, wow_role)
+
+    # Use the query started speculatively for this run, if it matches
+    speculative = None
+    run_context = get_run_context(config)
+    if run_context is not None and run_context.speculation is not None:
+        speculative = run_context.speculation.claim(
+            "search_helix", build_cache_key("", query_name, params)
+        )
+
     try:
-        helix_client = get_helix_client()
-        if wow_class and wow_spec:
-            result = helix_client.query(
-                "SearchClaimsByTags",
-                {
-                    "wow_class": wow_class,
-                    "wow_spec": wow_spec,
-                    "wow_role": wow_role,
-                },
-            )
-        else:
-            result = helix_client.query(
-                "SearchClaimsByRole",
-                {
-                    "wow_role": wow_role,
-                },
-            )
-        return json.dumps(result.data, ensure_ascii=True)
+        result = None
+        if speculative is not None:
+            result = await _claimed_result(speculative)
+        if result is None:
+            result = await get_helix_client().query(query_name, params)
     except Exception as exc:
-        return f"Helix search error: {exc}"
+        # Raised so the tool node reports it as an error and never memoizes it
+        raise ToolException(f"Helix search error: {exc}") from exc
+
+    # Rank the tag matches against the question and keep the best ones
+    index = get_result_index_cache().get(
+        build_cache_key(settings.helix_data_version, query_name, params), result.data
+    )
+    ranked = index.search(user_query, min(limit, settings.helix_search_max_results))
+    kept, _ = fit_to_token_budget(ranked, settings.helix_search_token_budget)
+    return json.dumps(
+        {
+            "total_matches": len(index.items),
+            "results": [
+                {"source": item.source, "score": item.score, "data": item.item}
+                for item in kept
+            ],
+        },
+        ensure_ascii=True,
+    )
@@ -0,0 +1,225 @@
+"""
+Tool output governor.
+
+Tool results become ToolMessages that are re-sent on every later model call
+of the turn and replayed on later turns. The governor bounds each result
+before it enters the graph state, using a per-tool policy:
+
+- projection: JSON objects that carry a claim text field are reduced to
+  their text fields plus the policy's fields (e.g. ids of Helix claims);
+- summarization: plain-text results over budget keep the sentences most
+  relevant to the call's arguments, in their original order;
+- truncation: results still over budget drop trailing list items (JSON) or
+  their tail (text).
+
+The original output is kept as the ToolMessage artifact, so it is persisted
+and streamed unchanged.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from app.infrastructure.helix.ranking import CLAIM_TEXT_FIELDS, BM25Index, RankedItem
+from app.infrastructure.llm.tokenizer import count_tokens
+
+TRUNCATED_TEMPLATE = "{head}\n[... {elided} characters of this tool result omitted]"
+OMITTED_KEY = "omitted_items"
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_TEXT_FIELDS = frozenset(CLAIM_TEXT_FIELDS)
+
+
+@dataclass(frozen=True)
+class ToolOutputPolicy:
+    """
+    How the output of one tool is bounded.
+
+    Attributes:
+        max_tokens: Token budget of the output sent to the model
+        fields: Fields kept, besides their text, from JSON objects that carry
+            a claim text field (projection is off when empty)
+        summarize: Whether text over budget is summarized extractively
+            before being truncated
+    """
+
+    max_tokens: int
+    fields: tuple[str, ...] = ()
+    summarize: bool = False
+
+
+@dataclass(frozen=True)
+class GovernedOutput:
+    """A tool output as sent to the model, with what was saved."""
+
+    content: str
+    original_tokens: int
+    tokens: int
+    original_bytes: int
+    bytes: int
+
+    @property
+    def changed(self) -> bool:
+        """Whether the governor rewrote the output."""
+        return self.bytes != self.original_bytes or self.tokens != self.original_tokens
+
+
+class ToolOutputGovernor:
+    """Applies per-tool output policies to tool results."""
+
+    def __init__(
+        self,
+        default_policy: ToolOutputPolicy,
+        policies: dict[str, ToolOutputPolicy] | None = None,
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            default_policy: Policy of tools without their own
+            policies: Policy per tool name
+        """
+        self.default_policy = default_policy
+        self.policies = policies or {}
+
+    def policy_for(self, tool_name: str) -> ToolOutputPolicy:
+        """Get the policy of a tool."""
+        return self.policies.get(tool_name, self.default_policy)
+
+    def govern(
+        self, tool_name: str, content: str, arguments: dict[str, Any] | None = None
+    ) -> GovernedOutput:
+        """
+        Bound a tool output according to the tool's policy.
+
+        Args:
+            tool_name: Tool that produced the output
+            content: Tool output
+            arguments: Call arguments; their text guides summarization
+
+        Returns:
+            The governed output and its size before and after
+        """
+        policy = self.policy_for(tool_name)
+        original_tokens = count_tokens(content)
+        governed = content
+
+        parsed = _parse_json(content)
+        if parsed is not None:
+            if policy.fields:
+                parsed = _project(parsed, frozenset(policy.fields))
+                governed = _dumps(parsed)
+            if count_tokens(governed) > policy.max_tokens:
+                governed = _trim_json(parsed, policy.max_tokens)
+        elif original_tokens > policy.max_tokens and policy.summarize:
+            governed = _summarize(content, _query_text(arguments), policy.max_tokens)
+
+        tokens = count_tokens(governed) if governed is not content else original_tokens
+        if tokens > policy.max_tokens:
+            governed = _truncate(governed, tokens, policy.max_tokens)
+            tokens = count_tokens(governed)
+
+        if parsed is not None and tokens >= original_tokens:
+            # Re-serializing alone must not count as a rewrite
+            governed, tokens = content, original_tokens
+        return GovernedOutput(
+            content=governed,
+            original_tokens=original_tokens,
+            tokens=tokens,
+            original_bytes=len(content.encode("utf-8")),
+            bytes=len(governed.encode("utf-8")),
+        )
+
+
+def _parse_json(content: str) -> Any:
+    if not content or content[0] not in "[{":
+        return None
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        return None
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=True)
+
+
+def _project(value: Any, fields: frozenset[str]) -> Any:
+    """Reduce objects carrying claim text to their text and the fields, recursively."""
+    if isinstance(value, list):
+        return [_project(item, fields) for item in value]
+    if isinstance(value, dict):
+        if _TEXT_FIELDS.intersection(value):
+            return {
+                key: item
+                for key, item in value.items()
+                if key in fields or key in _TEXT_FIELDS
+            }
+        return {key: _project(item, fields) for key, item in value.items()}
+    return value
+
+
+def _trim_json(value: Any, max_tokens: int) -> str:
+    """
+    Drop trailing items of the largest list until the JSON fits the budget.
+
+    Objects record how many items were dropped under OMITTED_KEY.
+    """
+    if isinstance(value, list):
+        items = value
+    elif isinstance(value, dict):
+        lists = [item for item in value.values() if isinstance(item, list)]
+        if not lists:
+            return _dumps(value)
+        items = max(lists, key=len)
+    else:
+        return _dumps(value)
+
+    excess = count_tokens(_dumps(value)) - max_tokens
+    omitted = 0
+    while excess > 0 and len(items) > 1:
+        excess -= count_tokens(_dumps(items.pop()))
+        omitted += 1
+    if omitted and isinstance(value, dict):
+        value[OMITTED_KEY] = value.get(OMITTED_KEY, 0) + omitted
+    return _dumps(value)
+
+
+def _query_text(arguments: dict[str, Any] | None) -> str:
+    if not arguments:
+        return ""
+    return " ".join(value for value in arguments.values() if isinstance(value, str))
+
+
+def _summarize(content: str, query: str, max_tokens: int) -> str:
+    """Keep the sentences most relevant to the query, in original order."""
+    sentences = [
+        sentence for sentence in _SENTENCE_RE.split(content) if sentence.strip()
+    ]
+    index = BM25Index(
+        [
+            RankedItem(source=str(position), item=sentence)
+            for position, sentence in enumerate(sentences)
+        ]
+    )
+    kept: list[int] = []
+    used = 0
+    for ranked in index.search(query, len(sentences)):
+        tokens = count_tokens(ranked.item)
+        if used + tokens > max_tokens:
+            continue
+        kept.append(int(ranked.source))
+        used += tokens
+    return "\n".join(sentences[position] for position in sorted(kept))
+
+
+def _truncate(content: str, tokens: int, max_tokens: int) -> str:
+    """Cut text to about max_tokens, marking how much was left out."""
+    marker_tokens = count_tokens(
+        TRUNCATED_TEMPLATE.format(head="", elided=len(content))
+    )
+    keep_chars = len(content) * max(max_tokens - marker_tokens, 0) // max(tokens, 1)
+    return TRUNCATED_TEMPLATE.format(
+        head=content[:keep_chars].rstrip(), elided=len(content) - keep_chars
+    )
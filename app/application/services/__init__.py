@@ -4,10 +4,13 @@ Application services.
 
 from .chat_service import ChatService, create_chat_service
 from .thread_service import ThreadService, create_thread_service
+from .usage_service import UsageService, create_usage_service
 
 __all__ = [
     "ChatService",
     "create_chat_service",
     "ThreadService",
     "create_thread_service",
+    "UsageService",
+    "create_usage_service",
 ]
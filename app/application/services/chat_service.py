@@ -2,6 +2,7 @@
 Chat service - orchestrates agent execution and message persistence.
 """
 
+import logging
 import uuid
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
@@ -9,15 +10,26 @@ from datetime import datetime, timezone
 from langgraph.graph.state import CompiledStateGraph
 
 from app.domain import Message, MessageRole, Thread, WowClass, WowSpec
-from app.domain.repositories import MessageRepository, ThreadRepository
+from app.domain.repositories import (
+    MessageRepository,
+    ThreadRepository,
+    UsageRepository,
+)
+from app.infrastructure.llm.tokenizer import count_tokens
 
 from ..agent import (
     AgentState,
+    AnswerCache,
+    AnswerCacheObserver,
     DatabaseObserver,
     MessageMapper,
     SSEOrchestrator,
+    SummaryRefresher,
+    SummaryRefreshObserver,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ChatService:
     """
@@ -35,6 +47,9 @@ class ChatService:
         graph: CompiledStateGraph,
         message_repository: MessageRepository,
         thread_repository: ThreadRepository,
+        answer_cache: AnswerCache | None = None,
+        usage_repository: UsageRepository | None = None,
+        summary_refresher: SummaryRefresher | None = None,
     ):
         """
         Initialize the chat service.
@@ -43,10 +58,16 @@ class ChatService:
             graph: Compiled LangGraph agent (singleton)
             message_repository: Repository for message persistence
             thread_repository: Repository for thread persistence
+            answer_cache: Optional cache of first-turn answers (singleton)
+            usage_repository: Optional repository for per-user token totals
+            summary_refresher: Optional background summary refresh (singleton)
         """
         self.graph = graph
         self.message_repository = message_repository
         self.thread_repository = thread_repository
+        self.answer_cache = answer_cache
+        self.usage_repository = usage_repository
+        self.summary_refresher = summary_refresher
         self._orchestrator = SSEOrchestrator(graph)
 
     async def process_message(
@@ -83,7 +104,7 @@ class ChatService:
             wow_spec=WowSpec(wow_spec),
             wow_role=wow_role,
         )
-        await self.thread_repository.get_or_create(thread)
+        thread, _ = await self.thread_repository.get_or_create(thread)
 
         # Save user message first and capture timestamp
         user_timestamp = datetime.now(timezone.utc)
@@ -93,14 +114,27 @@ class ChatService:
             role=MessageRole.HUMAN,
             content=input_text,
             timestamp=user_timestamp,
+            token_count=count_tokens(input_text),
         )
         await self.message_repository.save(user_message)
 
-        # Load conversation history up to and including the just-saved message
+        # Load conversation history up to and including the just-saved message.
+        # Turns already folded into the thread summary are not reloaded.
         history = await self.message_repository.get_up_to_timestamp(
-            thread_id, user_timestamp
+            thread_id, user_timestamp, after_id=thread.summary_through_id
         )
 
+        # First-turn questions can be answered from the answer cache
+        cache_key = None
+        if (
+            self.answer_cache is not None
+            and len(history) == 1
+            and thread.summary is None
+        ):
+            cache_key = self.answer_cache.build_key(
+                input_text, wow_class, wow_spec, wow_role
+            )
+
         # Convert domain messages to LangChain messages using the mapper
         messages = MessageMapper.to_langchain_messages(history)
 
@@ -112,28 +146,57 @@ class ChatService:
             wow_class=wow_class,
             wow_spec=wow_spec,
             wow_role=wow_role,
+            summary=thread.summary,
+            summary_through_id=thread.summary_through_id,
         )
 
         # Set up database observer for automatic AI message persistence
         db_observer = DatabaseObserver(
             message_repository=self.message_repository,
             thread_id=thread_id,
+            user_id=user_id,
+            usage_repository=self.usage_repository,
+            thread_repository=self.thread_repository,
         )
         self._orchestrator.add_observer(db_observer)
 
+        cached_answer = self.answer_cache.get(cache_key) if cache_key else None
+        cache_observer = None
+        if cache_key and cached_answer is None:
+            cache_observer = AnswerCacheObserver(self.answer_cache, cache_key)
+            self._orchestrator.add_observer(cache_observer)
+
+        # Refresh the summary after the answer, outside the request
+        summary_observer = None
+        if self.summary_refresher is not None and cached_answer is None:
+            summary_observer = SummaryRefreshObserver(self.summary_refresher, state)
+            self._orchestrator.add_observer(summary_observer)
+
         try:
-            # Stream via orchestrator (handles debouncing and observer notifications)
-            async for event in self._orchestrator.stream(state):
+            if cached_answer is not None:
+                logger.info("Answer cache hit for thread %s", thread_id)
+                stream = self._orchestrator.stream_answer(cached_answer)
+            else:
+                # Stream via orchestrator (handles debouncing and observer notifications)
+                stream = self._orchestrator.stream(state)
+            async for event in stream:
                 yield event
         finally:
-            # Clean up observer
+            # Clean up observers
             self._orchestrator.remove_observer(db_observer)
+            if cache_observer is not None:
+                self._orchestrator.remove_observer(cache_observer)
+            if summary_observer is not None:
+                self._orchestrator.remove_observer(summary_observer)
 
 
 def create_chat_service(
     graph: CompiledStateGraph,
     message_repository: MessageRepository,
     thread_repository: ThreadRepository,
+    answer_cache: AnswerCache | None = None,
+    usage_repository: UsageRepository | None = None,
+    summary_refresher: SummaryRefresher | None = None,
 ) -> ChatService:
     """
     Create a new ChatService instance.
@@ -142,6 +205,9 @@ def create_chat_service(
         graph: Compiled LangGraph agent
         message_repository: Repository for messages
         thread_repository: Repository for threads
+        answer_cache: Optional cache of first-turn answers
+        usage_repository: Optional repository for token usage
+        summary_refresher: Optional background summary refresh
 
     Returns:
         Configured ChatService
@@ -150,4 +216,7 @@ def create_chat_service(
         graph=graph,
         message_repository=message_repository,
         thread_repository=thread_repository,
+        answer_cache=answer_cache,
+        usage_repository=usage_repository,
+        summary_refresher=summary_refresher,
     )
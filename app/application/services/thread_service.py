@@ -2,6 +2,9 @@
 Thread service - manages conversation threads.
 """
 
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from app.domain import Message, Thread
 from app.domain.repositories import MessageRepository, ThreadRepository
 
@@ -39,7 +42,11 @@ class ThreadService:
         return await self.thread_repository.get_by_id(thread_id)
 
     async def get_thread_messages(
-        self, thread_id: str, limit: int | None = None, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int | None = None,
+        offset: int = 0,
+        after_id: str | None = None,
     ) -> list[Message]:
         """
         Get all messages for a thread.
@@ -48,12 +55,13 @@ class ThreadService:
             thread_id: The thread ID
             limit: Maximum number of messages to return
             offset: Number of messages to skip
+            after_id: Cursor; only messages after this message id are returned
 
         Returns:
             List of messages ordered by timestamp
         """
         return await self.message_repository.get_by_thread_id(
-            thread_id, limit=limit, offset=offset
+            thread_id, limit=limit, offset=offset, after_id=after_id
         )
 
     async def get_user_threads(
@@ -74,6 +82,27 @@ class ThreadService:
             user_id, limit=limit, offset=offset
         )
 
+    def export_messages(
+        self,
+        user_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Stream messages across all matching threads for export.
+
+        Args:
+            user_id: Only include threads owned by this user
+            since: Timestamp lower bound (inclusive)
+            until: Timestamp upper bound (exclusive)
+
+        Returns:
+            Async iterator of messages ordered by thread, then timestamp
+        """
+        return self.message_repository.stream_for_export(
+            user_id=user_id, since=since, until=until
+        )
+
     async def delete_thread(self, thread_id: str) -> bool:
         """
         Delete a thread and all its messages.
@@ -0,0 +1,72 @@
+"""
+Usage service - reports LLM token spend.
+"""
+
+from datetime import date
+
+from app.domain import TokenUsage
+from app.domain.repositories import UsageRepository
+
+
+class UsageService:
+    """
+    Service for reading token usage totals.
+    """
+
+    def __init__(self, usage_repository: UsageRepository):
+        """
+        Initialize the usage service.
+
+        Args:
+            usage_repository: Repository for token usage
+        """
+        self.usage_repository = usage_repository
+
+    async def get_user_usage(
+        self, user_id: str, since: date | None = None
+    ) -> TokenUsage:
+        """
+        Get a user's usage summed across threads.
+
+        Args:
+            user_id: The user ID
+            since: Only include usage from this day on (inclusive)
+
+        Returns:
+            Aggregate usage for the user
+        """
+        return await self.usage_repository.get_user_totals(user_id, since=since)
+
+    async def get_top_threads(
+        self,
+        limit: int = 20,
+        since: date | None = None,
+        user_id: str | None = None,
+    ) -> list[TokenUsage]:
+        """
+        Get the threads that drive the most spend.
+
+        Args:
+            limit: Maximum number of threads to return
+            since: Only include usage from this day on (inclusive)
+            user_id: Only include threads owned by this user
+
+        Returns:
+            Per-thread usage ordered by total tokens descending
+        """
+        return await self.usage_repository.get_top_threads(
+            limit=limit, since=since, user_id=user_id
+        )
+
+
+def create_usage_service(usage_repository: UsageRepository) -> UsageService:
+    """
+    Create a new UsageService instance.
+
+    Args:
+        usage_repository: Repository for token usage
+
+    Returns:
+        Configured UsageService
+    """
+    return UsageService(usage_repository=usage_repository)
@@ -3,14 +3,15 @@ Domain layer - contains entities, value objects, and repository interfaces.
 This layer has no external dependencies.
 """
 
-from .entities import Message, Thread, ToolCall, User
-from .repositories import MessageRepository, ThreadRepository
+from .entities import Message, Thread, TokenUsage, ToolCall, User
+from .repositories import MessageRepository, ThreadRepository, UsageRepository
 from .value_objects import MessageRole, WowClass, WowSpec
 
 __all__ = [
     # Entities
     "Message",
     "Thread",
+    "TokenUsage",
     "ToolCall",
     "User",
     # Value Objects
@@ -20,4 +21,5 @@ __all__ = [
     # Repositories
     "MessageRepository",
     "ThreadRepository",
+    "UsageRepository",
 ]
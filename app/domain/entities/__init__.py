@@ -4,6 +4,7 @@ Domain entities - core business objects.
 
 from .message import Message, ToolCall
 from .thread import Thread
+from .token_usage import TokenUsage
 from .user import User
 
-__all__ = ["Message", "ToolCall", "Thread", "User"]
+__all__ = ["Message", "ToolCall", "Thread", "TokenUsage", "User"]
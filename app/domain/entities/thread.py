@@ -27,6 +27,12 @@ class Thread:
         title: Optional title for the thread
         created_at: When the thread was created
         updated_at: When the thread was last updated
+        message_count: Number of messages in the thread (denormalized)
+        total_tokens: Sum of message token counts (denormalized)
+        last_message_at: Timestamp of the most recent message
+        version: Monotonic counter bumped on every thread or message write
+        summary: Rolling summary of the older turns of the conversation
+        summary_through_id: ID of the last message folded into the summary
     """
 
     id: str
@@ -37,6 +43,12 @@ class Thread:
     title: str | None = None
     created_at: datetime = field(default_factory=_utc_now)
     updated_at: datetime = field(default_factory=_utc_now)
+    message_count: int = 0
+    total_tokens: int = 0
+    last_message_at: datetime | None = None
+    version: int = 0
+    summary: str | None = None
+    summary_through_id: str | None = None
 
     def get_context_summary(self) -> str:
         """Get a summary of the WoW context."""
@@ -0,0 +1,76 @@
+"""
+TokenUsage entity representing LLM spend aggregated per user and thread.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+
+
+def _utc_today() -> date:
+    """Get current UTC date."""
+    return datetime.now(timezone.utc).date()
+
+
+@dataclass
+class TokenUsage:
+    """
+    LLM token usage for a user's thread on a given day.
+
+    Input tokens are what the provider billed for prompts (the whole history
+    is re-sent on every call), so they usually dominate spend.
+
+    Attributes:
+        user_id: ID of the user
+        thread_id: ID of the thread (None for per-user aggregates)
+        usage_date: UTC day the usage was recorded (None for aggregates)
+        llm_calls: Number of model calls
+        input_tokens: Prompt tokens billed by the provider
+        cached_input_tokens: Prompt tokens served from the provider's prefix cache
+        output_tokens: Completion tokens billed by the provider
+    """
+
+    user_id: str
+    thread_id: str | None = None
+    usage_date: date | None = field(default_factory=_utc_today)
+    llm_calls: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Total billed tokens (input + output)."""
+        return self.input_tokens + self.output_tokens
+
+    def add_call(
+        self, input_tokens: int, output_tokens: int, cached_input_tokens: int = 0
+    ) -> None:
+        """
+        Account for one model call.
+
+        Args:
+            input_tokens: Prompt tokens of the call
+            output_tokens: Completion tokens of the call
+            cached_input_tokens: Prompt tokens read from the provider cache
+        """
+        self.llm_calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cached_input_tokens += cached_input_tokens
+
+    def add_reported_call(self, usage: Mapping) -> None:
+        """
+        Account for one model call from provider-reported usage.
+
+        Args:
+            usage: Usage metadata of the call (input_tokens, output_tokens and
+                input_token_details.cache_read)
+        """
+        self.add_call(
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            cached_input_tokens=usage.get("input_token_details", {}).get(
+                "cache_read", 0
+            ),
+        )
@@ -4,5 +4,6 @@ Repository interfaces (protocols) for domain persistence.
 
 from .message_repository import MessageRepository
 from .thread_repository import ThreadRepository
+from .usage_repository import UsageRepository
 
-__all__ = ["MessageRepository", "ThreadRepository"]
+__all__ = ["MessageRepository", "ThreadRepository", "UsageRepository"]
@@ -2,6 +2,7 @@
 Message repository interface.
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Protocol
 
@@ -51,7 +52,11 @@ class MessageRepository(Protocol):
         ...
 
     async def get_by_thread_id(
-        self, thread_id: str, limit: int | None = None, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int | None = None,
+        offset: int = 0,
+        after_id: str | None = None,
     ) -> list[Message]:
         """
         Get all messages for a thread.
@@ -60,6 +65,7 @@ class MessageRepository(Protocol):
             thread_id: The thread ID
             limit: Maximum number of messages to return
             offset: Number of messages to skip
+            after_id: Only return messages positioned after this message
 
         Returns:
             List of messages ordered by timestamp ascending
@@ -79,7 +85,7 @@ class MessageRepository(Protocol):
         ...
 
     async def get_up_to_timestamp(
-        self, thread_id: str, up_to: datetime
+        self, thread_id: str, up_to: datetime, after_id: str | None = None
     ) -> list[Message]:
         """
         Get all messages for a thread up to and including a specific timestamp.
@@ -90,8 +96,32 @@ class MessageRepository(Protocol):
         Args:
             thread_id: The thread ID
             up_to: Timestamp upper bound (inclusive)
+            after_id: Cursor; only messages after this message id are returned
+                (used to skip turns already folded into the thread summary)
 
         Returns:
             List of messages ordered by timestamp ascending
         """
         ...
+
+    def stream_for_export(
+        self,
+        user_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Stream messages across threads for bulk export.
+
+        Implementations should read incrementally (server-side cursor) so
+        memory use stays constant regardless of the number of messages.
+
+        Args:
+            user_id: Only include threads owned by this user
+            since: Timestamp lower bound (inclusive)
+            until: Timestamp upper bound (exclusive)
+
+        Yields:
+            Messages ordered by thread, then timestamp
+        """
+        ...
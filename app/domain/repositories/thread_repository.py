@@ -65,6 +65,19 @@ class ThreadRepository(Protocol):
         """
         ...
 
+    async def update_summary(
+        self, thread_id: str, summary: str, through_id: str
+    ) -> None:
+        """
+        Store the rolling summary of a thread's older turns.
+
+        Args:
+            thread_id: The thread ID
+            summary: Summary text covering every message up to through_id
+            through_id: ID of the last message folded into the summary
+        """
+        ...
+
     async def delete(self, thread_id: str) -> bool:
         """
         Delete a thread by ID.
@@ -0,0 +1,58 @@
+"""
+Token usage repository interface.
+"""
+
+from datetime import date
+from typing import Protocol
+
+from app.domain.entities import TokenUsage
+
+
+class UsageRepository(Protocol):
+    """
+    Interface for token usage accounting.
+    Implementations should handle database-specific logic.
+    """
+
+    async def record(self, usages: list[TokenUsage]) -> None:
+        """
+        Add usage to the running totals in a single batch.
+
+        Args:
+            usages: Usage deltas, keyed by (user_id, thread_id, usage_date)
+        """
+        ...
+
+    async def get_user_totals(
+        self, user_id: str, since: date | None = None
+    ) -> TokenUsage:
+        """
+        Get a user's usage summed across all threads.
+
+        Args:
+            user_id: The user ID
+            since: Only include usage from this day on (inclusive)
+
+        Returns:
+            Aggregate usage (thread_id and usage_date are None)
+        """
+        ...
+
+    async def get_top_threads(
+        self,
+        limit: int = 20,
+        since: date | None = None,
+        user_id: str | None = None,
+    ) -> list[TokenUsage]:
+        """
+        Get the threads with the highest usage.
+
+        Args:
+            limit: Maximum number of threads to return
+            since: Only include usage from this day on (inclusive)
+            user_id: Only include threads owned by this user
+
+        Returns:
+            Per-thread aggregates (usage_date is None) ordered by total tokens
+        """
+        ...
@@ -12,6 +12,7 @@ from .database import (
     init_database,
 )
 from .llm import LLMClient
+from .metrics import MetricsRegistry, get_metrics
 
 __all__ = [
     # Config
@@ -26,4 +27,7 @@ __all__ = [
     "ThreadRepositoryImpl",
     # LLM
     "LLMClient",
+    # Metrics
+    "MetricsRegistry",
+    "get_metrics",
 ]
@@ -0,0 +1,7 @@
+"""
+In-process caching utilities.
+"""
+
+from .ttl_cache import TTLCache
+
+__all__ = ["TTLCache"]
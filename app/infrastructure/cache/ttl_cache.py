@@ -0,0 +1,131 @@
+"""
+Bounded in-process cache with LRU eviction and optional TTL.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass
+class _Entry[V]:
+    value: V
+    stored_at: float
+
+
+class TTLCache[K: Hashable, V]:
+    """
+    Size-capped LRU cache whose entries optionally expire after a TTL.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept (LRU evicted beyond it)
+            ttl_seconds: Entry lifetime; None keeps entries until evicted
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, record=False) is not None
+
+    def get(self, key: K, record: bool = True) -> V | None:
+        """
+        Get a fresh value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            record: Whether to count the lookup in hit/miss statistics
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or self._is_expired(entry):
+            if entry is not None:
+                del self._entries[key]
+            if record:
+                self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if record:
+            self.hits += 1
+        return entry.value
+
+    def get_entry_age(self, key: K) -> float | None:
+        """
+        Get the age in seconds of an entry, ignoring expiry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Seconds since the entry was stored, or None if absent
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return self._clock() - entry.stored_at
+
+    def peek(self, key: K) -> V | None:
+        """Get a value even if expired, without touching LRU order or stats."""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._entries[key] = _Entry(value=value, stored_at=self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry and return its value, if present."""
+        entry = self._entries.pop(key, None)
+        return entry.value if entry is not None else None
+
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return size and hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _is_expired(self, entry: _Entry[V]) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        return self._clock() - entry.stored_at > self.ttl_seconds
@@ -9,8 +9,12 @@ from .connection import (
     get_session_factory,
     init_database,
 )
-from .models import MessageModel, ThreadModel
-from .repositories import MessageRepositoryImpl, ThreadRepositoryImpl
+from .models import MessageModel, ThreadModel, TokenUsageModel, ToolPayloadBlobModel
+from .repositories import (
+    MessageRepositoryImpl,
+    ThreadRepositoryImpl,
+    UsageRepositoryImpl,
+)
 
 __all__ = [
     # Connection
@@ -22,7 +26,10 @@ __all__ = [
     # Models
     "MessageModel",
     "ThreadModel",
+    "TokenUsageModel",
+    "ToolPayloadBlobModel",
     # Repositories
     "MessageRepositoryImpl",
     "ThreadRepositoryImpl",
+    "UsageRepositoryImpl",
 ]
@@ -0,0 +1,82 @@
+"""
+Compression codecs for large payloads stored at rest.
+
+zstd is the default codec; zlib can be configured instead. The codec name
+is stored next to each payload so rows written with either codec can always
+be read back. zstandard is a runtime dependency: stored zstd rows must stay
+readable.
+"""
+
+import zlib
+from functools import lru_cache
+
+import zstandard
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+
+
+@lru_cache
+def _zstd_compressor() -> zstandard.ZstdCompressor:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+
+
+@lru_cache
+def _zstd_decompressor() -> zstandard.ZstdDecompressor:
+    return zstandard.ZstdDecompressor()
+
+
+def resolve_codec(preferred: str) -> str:
+    """
+    Resolve the codec to write with, falling back to zlib for unknown names.
+
+    Args:
+        preferred: Configured codec name ("zstd" or "zlib")
+
+    Returns:
+        Codec name to write with
+    """
+    if preferred == CODEC_ZSTD:
+        return CODEC_ZSTD
+    return CODEC_ZLIB
+
+
+def compress_text(text: str, codec: str) -> bytes:
+    """
+    Compress UTF-8 text with the given codec.
+
+    Args:
+        text: Text to compress
+        codec: Codec name returned by resolve_codec
+
+    Returns:
+        Compressed bytes
+    """
+    raw = text.encode("utf-8")
+    if codec == CODEC_ZSTD:
+        return _zstd_compressor().compress(raw)
+    return zlib.compress(raw, ZLIB_LEVEL)
+
+
+def decompress_text(data: bytes, codec: str) -> str:
+    """
+    Decompress bytes written by compress_text.
+
+    Args:
+        data: Compressed bytes
+        codec: Codec name stored alongside the payload
+
+    Returns:
+        Original text
+
+    Raises:
+        ValueError: If the codec is unknown
+    """
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    if codec == CODEC_ZSTD:
+        return _zstd_decompressor().decompress(data).decode("utf-8")
+    raise ValueError(f"Unknown compression codec: {codec}")
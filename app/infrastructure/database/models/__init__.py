@@ -4,5 +4,7 @@ SQLAlchemy database models.
 
 from .message_model import MessageModel
 from .thread_model import ThreadModel
+from .token_usage_model import TokenUsageModel
+from .tool_payload_blob_model import ToolPayloadBlobModel
 
-__all__ = ["MessageModel", "ThreadModel"]
+__all__ = ["MessageModel", "ThreadModel", "TokenUsageModel", "ToolPayloadBlobModel"]
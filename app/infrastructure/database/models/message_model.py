@@ -4,7 +4,14 @@ SQLAlchemy model for Message.
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -33,6 +40,14 @@ class MessageModel(Base):
     )
     tool_calls: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     tool_call_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Tool payloads are stored once: inline in tool_result when small, or as
+    # a reference to a deduplicated blob in tool_payload_blobs
     tool_result: Mapped[str | None] = mapped_column(Text, nullable=True)
+    tool_payload_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        ForeignKey("tool_payload_blobs.hash"),
+        nullable=True,
+        index=True,
+    )
     reasoning: Mapped[str | None] = mapped_column(Text, nullable=True)
     token_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -4,7 +4,7 @@ SQLAlchemy model for Thread.
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.database.connection import Base
@@ -32,3 +32,17 @@ class ThreadModel(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    total_tokens: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_message_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    summary_through_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -0,0 +1,43 @@
+"""
+SQLAlchemy model for TokenUsage.
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.connection import Base
+
+
+class TokenUsageModel(Base):
+    """
+    SQLAlchemy model for token_usage table.
+
+    One row per (user, thread, UTC day), incremented in place. There is no
+    foreign key to threads so spend survives thread deletion.
+    """
+
+    __tablename__ = "token_usage"
+
+    user_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True, index=True)
+    usage_date: Mapped[date] = mapped_column(Date, primary_key=True, index=True)
+    llm_calls: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    input_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    cached_input_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    output_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
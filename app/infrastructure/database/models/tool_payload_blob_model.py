@@ -0,0 +1,32 @@
+"""
+SQLAlchemy model for content-addressed tool payload blobs.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.connection import Base
+
+
+class ToolPayloadBlobModel(Base):
+    """
+    SQLAlchemy model for tool_payload_blobs table.
+
+    Each distinct tool payload is stored once, keyed by the SHA-256 of its
+    UTF-8 text. Messages reference blobs through tool_payload_hash.
+    """
+
+    __tablename__ = "tool_payload_blobs"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    # None means data holds the raw UTF-8 text
+    codec: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
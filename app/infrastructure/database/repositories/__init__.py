@@ -4,5 +4,6 @@ Repository implementations for PostgreSQL.
 
 from .message_repository_impl import MessageRepositoryImpl
 from .thread_repository_impl import ThreadRepositoryImpl
+from .usage_repository_impl import UsageRepositoryImpl
 
-__all__ = ["MessageRepositoryImpl", "ThreadRepositoryImpl"]
+__all__ = ["MessageRepositoryImpl", "ThreadRepositoryImpl", "UsageRepositoryImpl"]
@@ -2,14 +2,22 @@
 PostgreSQL implementation of MessageRepository.
 """
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.domain.entities import Message, ToolCall
 from app.domain.value_objects import MessageRole
-from app.infrastructure.database.models import MessageModel
+from app.infrastructure.config import get_settings
+from app.infrastructure.database.models import MessageModel, ThreadModel
+
+from .tool_payload_store import ToolPayloadStore, payload_hash
+
+# Rows fetched per round trip when streaming through a server-side cursor
+EXPORT_BATCH_SIZE = 500
 
 
 class MessageRepositoryImpl:
@@ -17,9 +25,19 @@ class MessageRepositoryImpl:
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._payload_store = ToolPayloadStore(session)
+        self._dedup_threshold = get_settings().tool_payload_dedup_threshold
+
+    def _to_entity(
+        self, model: MessageModel, payloads: dict[str, str] | None = None
+    ) -> Message:
+        """
+        Convert SQLAlchemy model to domain entity.
 
-    def _to_entity(self, model: MessageModel) -> Message:
-        """Convert SQLAlchemy model to domain entity."""
+        Args:
+            model: Message model (or a row exposing the same attributes)
+            payloads: Resolved blob payloads keyed by hash
+        """
         tool_calls = None
         if model.tool_calls:
             tool_calls = [
@@ -31,21 +49,36 @@ class MessageRepositoryImpl:
                 for tc in model.tool_calls
             ]
 
+        content = model.content
+        tool_result = model.tool_result
+        if model.role == MessageRole.TOOL.value:
+            # Tool payloads live in a single place; expose them as both
+            # content and tool_result, as callers expect
+            if model.tool_payload_hash:
+                tool_result = (payloads or {}).get(model.tool_payload_hash)
+            content = content or tool_result or ""
+
         return Message(
             id=model.id,
             thread_id=model.thread_id,
             role=MessageRole(model.role),
-            content=model.content,
+            content=content,
             timestamp=model.timestamp,
             tool_calls=tool_calls,
             tool_call_id=model.tool_call_id,
-            tool_result=model.tool_result,
+            tool_result=tool_result,
             reasoning=model.reasoning,
             token_count=model.token_count,
         )
 
-    def _to_model(self, entity: Message) -> MessageModel:
-        """Convert domain entity to SQLAlchemy model."""
+    def _to_model(self, entity: Message) -> tuple[MessageModel, str | None]:
+        """
+        Convert domain entity to SQLAlchemy model.
+
+        Returns:
+            Tuple of (model, payload) where payload is the tool payload text
+            to store in the blob store, or None if kept inline
+        """
         tool_calls_json = None
         if entity.tool_calls:
             tool_calls_json = [
@@ -59,35 +92,106 @@ class MessageRepositoryImpl:
                 for tc in entity.tool_calls
             ]
 
-        return MessageModel(
+        content = entity.content
+        tool_result = entity.tool_result
+        tool_payload_hash = None
+        blob_payload = None
+        if entity.is_tool():
+            # Store the payload once instead of duplicating it in content
+            payload = entity.tool_result or entity.content
+            content = "" if payload == entity.content else entity.content
+            tool_result = payload
+            if len(payload.encode("utf-8")) >= self._dedup_threshold:
+                tool_payload_hash = payload_hash(payload)
+                blob_payload = payload
+                tool_result = None
+
+        model = MessageModel(
             id=entity.id,
             thread_id=entity.thread_id,
             role=entity.role.value,
-            content=entity.content,
+            content=content,
             timestamp=entity.timestamp,
             tool_calls=tool_calls_json,
             tool_call_id=entity.tool_call_id,
-            tool_result=entity.tool_result,
+            tool_result=tool_result,
+            tool_payload_hash=tool_payload_hash,
             reasoning=entity.reasoning,
             token_count=entity.token_count,
         )
+        return model, blob_payload
 
-    async def save(self, message: Message) -> Message:
-        """Save a message to the database."""
-        model = self._to_model(message)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+    async def _to_entities(self, models: Sequence[MessageModel]) -> list[Message]:
+        """Convert models to entities, resolving blob payloads in one lookup."""
+        hashes = {
+            model.tool_payload_hash for model in models if model.tool_payload_hash
+        }
+        payloads = await self._payload_store.get_many(hashes) if hashes else {}
+        return [self._to_entity(model, payloads) for model in models]
 
-    async def save_many(self, messages: list[Message]) -> list[Message]:
-        """Save multiple messages to the database."""
-        models = [self._to_model(msg) for msg in messages]
+    async def _add_models(
+        self, messages: list[Message]
+    ) -> tuple[list[MessageModel], dict[str, str]]:
+        """Store blob payloads (deduplicated) and add message models to the session."""
+        models: list[MessageModel] = []
+        payloads: dict[str, str] = {}
+        for message in messages:
+            model, blob_payload = self._to_model(message)
+            if blob_payload is not None:
+                payloads[model.tool_payload_hash] = blob_payload
+            models.append(model)
+
+        # Blobs first so message foreign keys resolve on flush
+        await self._payload_store.put_many(payloads)
         self.session.add_all(models)
         await self.session.flush()
         for model in models:
             await self.session.refresh(model)
-        return [self._to_entity(model) for model in models]
+        return models, payloads
+
+    async def _increment_thread_counters(self, models: list[MessageModel]) -> None:
+        """
+        Apply denormalized counter increments for newly inserted messages.
+
+        Runs in the caller's transaction, issuing a single UPDATE per thread
+        regardless of how many messages were written.
+
+        Args:
+            models: Freshly flushed message models
+        """
+        per_thread: dict[str, list[MessageModel]] = {}
+        for model in models:
+            per_thread.setdefault(model.thread_id, []).append(model)
+
+        for thread_id, thread_models in per_thread.items():
+            tokens = sum(model.token_count or 0 for model in thread_models)
+            latest = max(model.timestamp for model in thread_models)
+            await self.session.execute(
+                update(ThreadModel)
+                .where(ThreadModel.id == thread_id)
+                .values(
+                    message_count=ThreadModel.message_count + len(thread_models),
+                    total_tokens=ThreadModel.total_tokens + tokens,
+                    # GREATEST ignores NULLs, so the first message just sets it
+                    last_message_at=func.greatest(ThreadModel.last_message_at, latest),
+                    version=ThreadModel.version + 1,
+                    updated_at=func.now(),
+                )
+            )
+
+    async def save(self, message: Message) -> Message:
+        """Save a message to the database."""
+        models, payloads = await self._add_models([message])
+        await self._increment_thread_counters(models)
+        return self._to_entity(models[0], payloads)
+
+    async def save_many(self, messages: list[Message]) -> list[Message]:
+        """Save multiple messages to the database."""
+        if not messages:
+            return []
+        models, payloads = await self._add_models(messages)
+        await self._increment_thread_counters(models)
+        return [self._to_entity(model, payloads) for model in models]
 
     async def get_by_id(self, message_id: str) -> Message | None:
         """Get a message by ID."""
@@ -95,33 +199,80 @@ class MessageRepositoryImpl:
             select(MessageModel).where(MessageModel.id == message_id)
         )
         model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        if not model:
+            return None
+        return (await self._to_entities([model]))[0]
 
     async def get_by_thread_id(
-        self, thread_id: str, limit: int | None = None, offset: int = 0
+        self,
+        thread_id: str,
+        limit: int | None = None,
+        offset: int = 0,
+        after_id: str | None = None,
     ) -> list[Message]:
-        """Get all messages for a thread ordered by timestamp."""
+        """
+        Get all messages for a thread ordered by timestamp.
+
+        When after_id is given, only messages positioned after that message
+        (by timestamp, then id) are returned. An unknown cursor yields no rows.
+        """
         query = (
             select(MessageModel)
             .where(MessageModel.thread_id == thread_id)
-            .order_by(MessageModel.timestamp.asc())
+            .order_by(MessageModel.timestamp.asc(), MessageModel.id.asc())
             .offset(offset)
         )
+        if after_id:
+            query = query.where(self._after_cursor(after_id))
         if limit:
             query = query.limit(limit)
 
         result = await self.session.execute(query)
-        return [self._to_entity(model) for model in result.scalars().all()]
+        return await self._to_entities(result.scalars().all())
+
+    @staticmethod
+    def _after_cursor(after_id: str) -> ColumnElement[bool]:
+        """Filter for messages positioned after a message, by (timestamp, id)."""
+        cursor = aliased(MessageModel)
+        cursor_timestamp = (
+            select(cursor.timestamp).where(cursor.id == after_id).scalar_subquery()
+        )
+        return or_(
+            MessageModel.timestamp > cursor_timestamp,
+            and_(
+                MessageModel.timestamp == cursor_timestamp,
+                MessageModel.id > after_id,
+            ),
+        )
 
     async def delete_by_thread_id(self, thread_id: str) -> int:
-        """Delete all messages in a thread."""
+        """Delete all messages in a thread, and the blobs only they referenced."""
         result = await self.session.execute(
-            delete(MessageModel).where(MessageModel.thread_id == thread_id)
+            delete(MessageModel)
+            .where(MessageModel.thread_id == thread_id)
+            .returning(MessageModel.tool_payload_hash)
         )
-        return result.rowcount
+        payload_hashes = list(result.scalars())
+        await self._payload_store.delete_unreferenced(
+            {digest for digest in payload_hashes if digest}
+        )
+        await self.session.execute(
+            update(ThreadModel)
+            .where(ThreadModel.id == thread_id)
+            .values(
+                message_count=0,
+                total_tokens=0,
+                last_message_at=None,
+                summary=None,
+                summary_through_id=None,
+                version=ThreadModel.version + 1,
+                updated_at=func.now(),
+            )
+        )
+        return len(payload_hashes)
 
     async def get_up_to_timestamp(
-        self, thread_id: str, up_to: datetime
+        self, thread_id: str, up_to: datetime, after_id: str | None = None
     ) -> list[Message]:
         """
         Get all messages for a thread up to and including a specific timestamp.
@@ -129,6 +280,7 @@ class MessageRepositoryImpl:
         Args:
             thread_id: The thread ID
             up_to: Timestamp upper bound (inclusive)
+            after_id: Cursor; only messages after this message id are returned
 
         Returns:
             List of messages ordered by timestamp ascending
@@ -139,8 +291,51 @@ class MessageRepositoryImpl:
                 MessageModel.thread_id == thread_id,
                 MessageModel.timestamp <= up_to,
             )
-            .order_by(MessageModel.timestamp.asc())
+            .order_by(MessageModel.timestamp.asc(), MessageModel.id.asc())
         )
+        if after_id:
+            query = query.where(self._after_cursor(after_id))
 
         result = await self.session.execute(query)
-        return [self._to_entity(model) for model in result.scalars().all()]
+        return await self._to_entities(result.scalars().all())
+
+    async def stream_for_export(
+        self,
+        user_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Stream messages across threads through a server-side cursor.
+
+        Selects plain columns instead of ORM entities so rows never enter the
+        session identity map, keeping memory constant for any export size.
+
+        Args:
+            user_id: Only include threads owned by this user
+            since: Timestamp lower bound (inclusive)
+            until: Timestamp upper bound (exclusive)
+
+        Yields:
+            Messages ordered by thread, then timestamp
+        """
+        query = select(*MessageModel.__table__.columns).order_by(
+            MessageModel.thread_id.asc(),
+            MessageModel.timestamp.asc(),
+            MessageModel.id.asc(),
+        )
+        if user_id is not None:
+            query = query.join(ThreadModel, ThreadModel.id == MessageModel.thread_id)
+            query = query.where(ThreadModel.user_id == user_id)
+        if since is not None:
+            query = query.where(MessageModel.timestamp >= since)
+        if until is not None:
+            query = query.where(MessageModel.timestamp < until)
+
+        result = await self.session.stream(
+            query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            # Rows expose the same attribute names as MessageModel
+            for message in await self._to_entities(rows):
+                yield message
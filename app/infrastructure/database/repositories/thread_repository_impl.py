@@ -4,7 +4,7 @@ PostgreSQL implementation of ThreadRepository.
 
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,6 +30,12 @@ class ThreadRepositoryImpl:
             title=model.title,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            message_count=model.message_count,
+            total_tokens=model.total_tokens,
+            last_message_at=model.last_message_at,
+            version=model.version,
+            summary=model.summary,
+            summary_through_id=model.summary_through_id,
         )
 
     def _to_model(self, entity: Thread) -> ThreadModel:
@@ -43,6 +49,12 @@ class ThreadRepositoryImpl:
             title=entity.title,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
+            message_count=entity.message_count,
+            total_tokens=entity.total_tokens,
+            last_message_at=entity.last_message_at,
+            version=entity.version,
+            summary=entity.summary,
+            summary_through_id=entity.summary_through_id,
         )
 
     async def save(self, thread: Thread) -> Thread:
@@ -79,23 +91,40 @@ class ThreadRepositoryImpl:
 
     async def update(self, thread: Thread) -> Thread:
         """Update an existing thread."""
+        # The version is bumped in SQL so concurrent updates never lose one
         result = await self.session.execute(
-            select(ThreadModel).where(ThreadModel.id == thread.id)
+            update(ThreadModel)
+            .where(ThreadModel.id == thread.id)
+            .values(
+                title=thread.title,
+                wow_class=thread.wow_class.value,
+                wow_spec=thread.wow_spec.value,
+                wow_role=thread.wow_role,
+                updated_at=datetime.now(timezone.utc),
+                version=ThreadModel.version + 1,
+            )
+            .returning(ThreadModel)
+            .execution_options(populate_existing=True)
         )
         model = result.scalar_one_or_none()
         if not model:
             raise ValueError(f"Thread {thread.id} not found")
-
-        model.title = thread.title
-        model.wow_class = thread.wow_class.value
-        model.wow_spec = thread.wow_spec.value
-        model.wow_role = thread.wow_role
-        model.updated_at = datetime.now(timezone.utc)
-
-        await self.session.flush()
-        await self.session.refresh(model)
         return self._to_entity(model)
 
+    async def update_summary(
+        self, thread_id: str, summary: str, through_id: str
+    ) -> None:
+        """Store the rolling summary without touching activity timestamps."""
+        await self.session.execute(
+            update(ThreadModel)
+            .where(ThreadModel.id == thread_id)
+            .values(
+                summary=summary,
+                summary_through_id=through_id,
+                updated_at=ThreadModel.updated_at,
+            )
+        )
+
     async def delete(self, thread_id: str) -> bool:
         """Delete a thread by ID."""
         result = await self.session.execute(
@@ -0,0 +1,176 @@
+"""
+Content-addressed store for tool payloads.
+
+Identical tool outputs (e.g. the same Helix claim set returned to every user
+of a spec) are stored once in tool_payload_blobs and referenced by hash.
+Blobs no message references any more are deleted along with the messages.
+"""
+
+import hashlib
+import logging
+from functools import lru_cache
+
+from sqlalchemy import delete, false, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.config import get_settings
+from app.infrastructure.database.compression import (
+    compress_text,
+    decompress_text,
+    resolve_codec,
+)
+from app.infrastructure.database.models import MessageModel, ToolPayloadBlobModel
+
+logger = logging.getLogger(__name__)
+
+
+def payload_hash(payload: str) -> str:
+    """
+    Compute the content address of a payload.
+
+    Args:
+        payload: Tool payload text
+
+    Returns:
+        Hex SHA-256 of the UTF-8 encoded payload
+    """
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@lru_cache
+def get_tool_payload_cache() -> TTLCache[str, str]:
+    """
+    Get the process-wide hot cache of blob contents.
+
+    Blobs are immutable, so entries never go stale; the TTL only releases
+    the memory of blobs loaded long ago, and deleted blobs are evicted.
+    """
+    settings = get_settings()
+    return TTLCache(
+        max_entries=settings.tool_payload_cache_entries,
+        ttl_seconds=settings.tool_payload_cache_ttl_seconds,
+    )
+
+
+class ToolPayloadStore:
+    """Reads and writes deduplicated tool payload blobs."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        settings = get_settings()
+        self._compression_threshold = settings.message_compression_threshold
+        self._compression_codec = resolve_codec(settings.message_compression_codec)
+        self._cache = get_tool_payload_cache()
+
+    async def put_many(self, payloads: dict[str, str]) -> None:
+        """
+        Store payloads, skipping any whose hash already exists.
+
+        Args:
+            payloads: Mapping of payload hash to payload text
+        """
+        if not payloads:
+            return
+
+        rows = []
+        for digest, payload in payloads.items():
+            raw = payload.encode("utf-8")
+            codec = None
+            data = raw
+            if len(raw) >= self._compression_threshold:
+                codec = self._compression_codec
+                data = compress_text(payload, codec)
+            rows.append(
+                {"hash": digest, "size_bytes": len(raw), "codec": codec, "data": data}
+            )
+
+        # Existing blobs are locked, not rewritten, so a concurrent cleanup
+        # cannot delete a blob this transaction is about to reference
+        await self.session.execute(
+            insert(ToolPayloadBlobModel)
+            .values(rows)
+            .on_conflict_do_update(
+                index_elements=["hash"],
+                set_={"hash": ToolPayloadBlobModel.hash},
+                where=false(),
+            )
+        )
+        for digest, payload in payloads.items():
+            self._cache.set(digest, payload)
+
+    async def get_many(self, hashes: set[str]) -> dict[str, str]:
+        """
+        Resolve payloads by hash, serving from the hot cache when possible.
+
+        Args:
+            hashes: Payload hashes to resolve
+
+        Returns:
+            Mapping of hash to payload text (unknown hashes are omitted)
+        """
+        payloads: dict[str, str] = {}
+        missing: list[str] = []
+        for digest in hashes:
+            cached = self._cache.get(digest)
+            if cached is None:
+                missing.append(digest)
+            else:
+                payloads[digest] = cached
+
+        if missing:
+            result = await self.session.execute(
+                select(
+                    ToolPayloadBlobModel.hash,
+                    ToolPayloadBlobModel.codec,
+                    ToolPayloadBlobModel.data,
+                ).where(ToolPayloadBlobModel.hash.in_(missing))
+            )
+            for row in result:
+                if row.codec is None:
+                    payload = row.data.decode("utf-8")
+                else:
+                    payload = decompress_text(row.data, row.codec)
+                payloads[row.hash] = payload
+                self._cache.set(row.hash, payload)
+
+        return payloads
+
+    async def delete_unreferenced(self, hashes: set[str]) -> int:
+        """
+        Delete blobs among the given ones that no message references.
+
+        Runs in a savepoint: if a concurrent transaction starts referencing
+        a blob, the cleanup is skipped and never fails the caller.
+
+        Args:
+            hashes: Hashes of blobs whose references were just removed
+
+        Returns:
+            Number of blobs deleted
+        """
+        if not hashes:
+            return 0
+
+        referenced = (
+            select(MessageModel.id)
+            .where(MessageModel.tool_payload_hash == ToolPayloadBlobModel.hash)
+            .exists()
+        )
+        try:
+            async with self.session.begin_nested():
+                result = await self.session.execute(
+                    delete(ToolPayloadBlobModel)
+                    .where(ToolPayloadBlobModel.hash.in_(hashes), ~referenced)
+                    .returning(ToolPayloadBlobModel.hash)
+                )
+                deleted = list(result.scalars())
+        except IntegrityError as exc:
+            logger.warning("Skipped tool payload cleanup: %s", exc)
+            return 0
+
+        for digest in deleted:
+            self._cache.pop(digest)
+        return len(deleted)
@@ -0,0 +1,111 @@
+"""
+PostgreSQL implementation of UsageRepository.
+"""
+
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities import TokenUsage
+from app.infrastructure.database.models import TokenUsageModel
+
+_COUNTERS = ("llm_calls", "input_tokens", "cached_input_tokens", "output_tokens")
+
+
+class UsageRepositoryImpl:
+    """PostgreSQL implementation of UsageRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def record(self, usages: list[TokenUsage]) -> None:
+        """Add usage to the running totals with one upsert."""
+        rows: dict[tuple, dict] = {}
+        for usage in usages:
+            if usage.llm_calls == 0 or usage.thread_id is None:
+                continue
+            key = (usage.user_id, usage.thread_id, usage.usage_date)
+            row = rows.setdefault(
+                key,
+                {
+                    "user_id": usage.user_id,
+                    "thread_id": usage.thread_id,
+                    "usage_date": usage.usage_date,
+                    **dict.fromkeys(_COUNTERS, 0),
+                },
+            )
+            for counter in _COUNTERS:
+                row[counter] += getattr(usage, counter)
+        if not rows:
+            return
+
+        statement = insert(TokenUsageModel).values(list(rows.values()))
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["user_id", "thread_id", "usage_date"],
+                set_={
+                    **{
+                        counter: getattr(TokenUsageModel, counter)
+                        + getattr(statement.excluded, counter)
+                        for counter in _COUNTERS
+                    },
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    async def get_user_totals(
+        self, user_id: str, since: date | None = None
+    ) -> TokenUsage:
+        """Get a user's usage summed across all threads."""
+        query = select(
+            *(
+                func.coalesce(func.sum(getattr(TokenUsageModel, counter)), 0)
+                for counter in _COUNTERS
+            )
+        ).where(TokenUsageModel.user_id == user_id)
+        if since is not None:
+            query = query.where(TokenUsageModel.usage_date >= since)
+
+        row = (await self.session.execute(query)).one()
+        return TokenUsage(
+            user_id=user_id,
+            usage_date=None,
+            **dict(zip(_COUNTERS, (int(value) for value in row), strict=True)),
+        )
+
+    async def get_top_threads(
+        self,
+        limit: int = 20,
+        since: date | None = None,
+        user_id: str | None = None,
+    ) -> list[TokenUsage]:
+        """Get the threads with the highest usage."""
+        sums = [
+            func.sum(getattr(TokenUsageModel, counter)).label(counter)
+            for counter in _COUNTERS
+        ]
+        total = func.sum(TokenUsageModel.input_tokens + TokenUsageModel.output_tokens)
+        query = (
+            select(TokenUsageModel.user_id, TokenUsageModel.thread_id, *sums)
+            .group_by(TokenUsageModel.user_id, TokenUsageModel.thread_id)
+            .order_by(total.desc())
+            .limit(limit)
+        )
+        if since is not None:
+            query = query.where(TokenUsageModel.usage_date >= since)
+        if user_id is not None:
+            query = query.where(TokenUsageModel.user_id == user_id)
+
+        result = await self.session.execute(query)
+        return [
+            TokenUsage(
+                user_id=row.user_id,
+                thread_id=row.thread_id,
+                usage_date=None,
+                **{counter: int(getattr(row, counter)) for counter in _COUNTERS},
+            )
+            for row in result
+        ]
@@ -0,0 +1,178 @@
+"""
+Cache layer for Helix query results.
+
+The Helix query space is small (class/spec/role tags) and the data only
+changes when new claims are ingested, so results are cached per query and
+parameters under the current Helix data version.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from app.domain.entities.helix_query_result import HelixQueryResult
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from .client import HelixQueryClient
+
+logger = logging.getLogger(__name__)
+
+
+def build_cache_key(data_version: str, query_name: str, params: dict[str, Any]) -> str:
+    """
+    Build the cache key for a query.
+
+    Parameters are canonicalized (sorted keys, compact separators), so the
+    same query built in a different key order shares an entry.
+
+    Args:
+        data_version: Helix data version the result belongs to
+        query_name: Name of the Helix query
+        params: Query parameters
+
+    Returns:
+        Cache key
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{data_version}:{query_name}:{canonical}"
+
+
+class CachedHelixQueryClient:
+    """
+    Helix client wrapper with a TTL + LRU result cache.
+
+    - Fresh entries (younger than ttl_seconds) are served from memory.
+    - Stale entries (up to stale_seconds past the TTL) are served as-is
+      while a background query refreshes them.
+    - Concurrent misses for the same key share one Helix query.
+    - Failed queries are never cached; a failed refresh keeps the stale
+      entry.
+    """
+
+    def __init__(
+        self,
+        client: HelixQueryClient,
+        data_version: str,
+        max_entries: int,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+    ) -> None:
+        self._client = client
+        self.data_version = data_version
+        self.ttl_seconds = ttl_seconds
+        self._cache: TTLCache[str, HelixQueryResult] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds + stale_seconds
+        )
+        self._in_flight: dict[str, asyncio.Task[HelixQueryResult]] = {}
+        self._refreshes: set[asyncio.Task[HelixQueryResult]] = set()
+
+    async def query(
+        self, query_name: str, params: dict[str, Any] | None = None
+    ) -> HelixQueryResult:
+        """
+        Run a Helix query, serving it from the cache when possible.
+
+        Args:
+            query_name: Name of the deployed Helix query
+            params: Query parameters
+
+        Returns:
+            HelixQueryResult (shared with other callers; do not mutate)
+        """
+        payload = params or {}
+        key = build_cache_key(self.data_version, query_name, payload)
+        start = time.perf_counter()
+
+        result = self._cache.get(key)
+        if result is not None:
+            age = self._cache.get_entry_age(key) or 0.0
+            outcome = "hit"
+            if age > self.ttl_seconds:
+                outcome = "stale"
+                self._refresh_in_background(key, query_name, payload)
+        else:
+            outcome = "joined" if key in self._in_flight else "miss"
+            task = self._fetch(key, query_name, payload)
+            # Shielded so one caller's cancellation doesn't fail the others
+            result = await asyncio.shield(task)
+
+        metrics = get_metrics()
+        metrics.increment("helix_cache_lookups_total", query=query_name, result=outcome)
+        metrics.observe(
+            "helix_cached_query_seconds",
+            time.perf_counter() - start,
+            query=query_name,
+            result=outcome,
+        )
+        return result
+
+    def invalidate(self, data_version: str | None = None) -> None:
+        """
+        Drop all cached results, optionally moving to a new data version.
+
+        Queries already in flight finish but their results are stored under
+        the version they were started with, so they are never served again.
+
+        Args:
+            data_version: New Helix data version
+        """
+        if data_version is not None:
+            self.data_version = data_version
+        self._cache.clear()
+        logger.info("Helix cache invalidated (data_version=%s)", self.data_version)
+
+    def stats(self) -> dict[str, float]:
+        """Return cache statistics."""
+        return {**self._cache.stats(), "in_flight": len(self._in_flight)}
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Get connection counts of the underlying client's HTTP pool."""
+        return self._client.pool_stats()
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes and close the underlying client."""
+        for task in self._refreshes:
+            task.cancel()
+        await self._client.aclose()
+
+    def _fetch(
+        self, key: str, query_name: str, params: dict[str, Any]
+    ) -> asyncio.Task[HelixQueryResult]:
+        """Start (or join) the single query that fills a cache key."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._query_and_store(key, query_name, params))
+            self._in_flight[key] = task
+        return task
+
+    async def _query_and_store(
+        self, key: str, query_name: str, params: dict[str, Any]
+    ) -> HelixQueryResult:
+        try:
+            result = await self._client.query(query_name, params)
+            self._cache.set(key, result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _refresh_in_background(
+        self, key: str, query_name: str, params: dict[str, Any]
+    ) -> None:
+        if key in self._in_flight:
+            return
+        task = self._fetch(key, query_name, params)
+        self._refreshes.add(task)
+        task.add_done_callback(self._on_refresh_done)
+
+    def _on_refresh_done(self, task: asyncio.Task[HelixQueryResult]) -> None:
+        self._refreshes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Helix cache refresh failed, keeping stale entry: %s", task.exception()
+            )
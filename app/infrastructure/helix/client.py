@@ -1,37 +1,194 @@
+"""HelixDB infrastructure module."""
 from __future__ import annotations
 
+import asyncio
+import logging
+import random
+import time
 from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
-import helix
+import httpx
 
 from app.domain.entities.helix_query_result import HelixQueryResult
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.http_pool import pool_stats
+from app.infrastructure.metrics import get_metrics
+
+from .cache import CachedHelixQueryClient
+from .fixture import FixtureHelixQueryClient
+from .snapshot import SnapshotHelixQueryClient
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: the Helix server (or a proxy) is overloaded/restarting
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class HelixQueryError(Exception):
+    """Raised when a Helix query fails after all retries."""
+
+    def __init__(self, query_name: str, message: str, status_code: int | None = None) -> None:
+        super().__init__(f"Helix query '{query_name}' failed: {message}")
+        self.query_name = query_name
+        self.status_code = status_code
 
 
 class HelixQueryClient:
-    def __init__(self, client: helix.Client) -> None:
-        self._client = client
+    """
+    Async client for Helix queries over a pooled HTTP client.
+
+    Speaks the same protocol as helix.Client (POST {base_url}/{query_name}
+    with a JSON payload) without blocking the event loop. In-flight queries
+    are bounded by max_concurrency; transport errors and retryable statuses
+    are retried with jittered exponential backoff.
+    """
 
-    def query(self, query_name: str, params: dict[str, Any] | None = None) -> HelixQueryResult:
+    def __init__(
+        self,
+        base_url: str,
+        http_client: httpx.AsyncClient,
+        api_key: str = "",
+        max_concurrency: int = 16,
+        max_retries: int = 2,
+        retry_backoff: float = 0.2,
+        verbose: bool = False,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._http_client = http_client
+        self._headers = {"x-api-key": api_key} if api_key else {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._verbose = verbose
+
+    async def query(self, query_name: str, params: dict[str, Any] | None = None) -> HelixQueryResult:
+        """
+        Run a Helix query.
+
+        Args:
+            query_name: Name of the deployed Helix query
+            params: Query parameters
+
+        Returns:
+            HelixQueryResult with the response list (one entry per payload,
+            like helix.Client)
+
+        Raises:
+            HelixQueryError: If the query fails after all retries
+        """
         payload = params or {}
-        result = self._client.query(query_name, payload)
-        return HelixQueryResult(query_name=query_name, data=result)
+        metrics = get_metrics()
+        start = time.perf_counter()
+        status = "error"
+        try:
+            async with self._semaphore:
+                data = await self._send_with_retries(query_name, payload)
+            status = "ok"
+            return HelixQueryResult(query_name=query_name, data=[data])
+        finally:
+            elapsed = time.perf_counter() - start
+            if self._verbose:
+                logger.info("Helix query %s %s in %.3fs", query_name, status, elapsed)
+            metrics.observe("helix_query_seconds", elapsed, query=query_name)
+            metrics.increment("helix_queries_total", query=query_name, status=status)
 
+    async def _send_with_retries(self, query_name: str, payload: dict[str, Any]) -> Any:
+        url = f"{self._base_url}/{query_name}"
+        attempt = 0
+        while True:
+            try:
+                response = await self._http_client.post(url, json=payload, headers=self._headers)
+            except httpx.TransportError as exc:
+                error = HelixQueryError(query_name, f"{type(exc).__name__}: {exc}")
+            else:
+                if response.status_code < 400:
+                    return response.json()
+                error = HelixQueryError(query_name, response.text, response.status_code)
+                if response.status_code not in RETRYABLE_STATUSES:
+                    raise error
 
-@lru_cache
-def get_helix_client() -> HelixQueryClient:
+            if attempt >= self._max_retries:
+                raise error
+            attempt += 1
+            get_metrics().increment("helix_query_retries_total", query=query_name)
+            delay = self._retry_backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+            logger.warning("Retrying Helix query %s in %.2fs: %s", query_name, delay, error)
+            await asyncio.sleep(delay)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Get connection counts of the pooled HTTP client."""
+        return pool_stats(self._http_client)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._http_client.aclose()
+
+
+def _helix_base_url() -> str:
     settings = get_settings()
     if settings.helix_api_endpoint:
-        client = helix.Client(
-            api_endpoint=settings.helix_api_endpoint,
-            api_key=settings.helix_api_key,
-            verbose=settings.helix_verbose,
-        )
-    else:
-        client = helix.Client(
-            local=settings.helix_local,
-            port=settings.helix_port,
-            verbose=settings.helix_verbose,
+        return settings.helix_api_endpoint
+    return f"http://127.0.0.1:{settings.helix_port}"
+
+
+def _create_upstream_client() -> HelixQueryClient | FixtureHelixQueryClient:
+    settings = get_settings()
+    if settings.helix_fixture_path:
+        return FixtureHelixQueryClient(
+            Path(settings.helix_fixture_path),
+            dump_query=settings.helix_snapshot_query,
         )
-    return HelixQueryClient(client)
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.helix_max_connections,
+            max_keepalive_connections=settings.helix_max_connections,
+        ),
+        timeout=httpx.Timeout(
+            settings.helix_timeout_seconds,
+            connect=settings.helix_connect_timeout_seconds,
+        ),
+    )
+    return HelixQueryClient(
+        base_url=_helix_base_url(),
+        http_client=http_client,
+        api_key=settings.helix_api_key if settings.helix_api_endpoint else "",
+        max_concurrency=settings.helix_max_concurrency,
+        max_retries=settings.helix_max_retries,
+        retry_backoff=settings.helix_retry_backoff_seconds,
+        verbose=settings.helix_verbose,
+    )
+
+
+@lru_cache
+def get_helix_snapshot() -> SnapshotHelixQueryClient | None:
+    """Get the local claim snapshot client, if the snapshot is enabled."""
+    settings = get_settings()
+    if not settings.helix_snapshot_enabled:
+        return None
+    return SnapshotHelixQueryClient(
+        _create_upstream_client(),
+        path=Path(settings.helix_snapshot_path),
+        dump_query=settings.helix_snapshot_query,
+        refresh_seconds=settings.helix_snapshot_refresh_seconds,
+    )
+
+
+@lru_cache
+def get_helix_client() -> HelixQueryClient | CachedHelixQueryClient:
+    settings = get_settings()
+    client = get_helix_snapshot() or _create_upstream_client()
+    if not settings.helix_cache_enabled:
+        return client
+    cached = CachedHelixQueryClient(
+        client,
+        data_version=settings.helix_data_version,
+        max_entries=settings.helix_cache_max_entries,
+        ttl_seconds=settings.helix_cache_ttl_seconds,
+        stale_seconds=settings.helix_cache_stale_seconds,
+    )
+    if isinstance(client, SnapshotHelixQueryClient):
+        # Cached results built on an older snapshot are dropped on swap
+        client.add_listener(cached.invalidate)
+    return cached
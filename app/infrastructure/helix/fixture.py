@@ -0,0 +1,70 @@
+"""
+Fixture-file stand-in for HelixDB.
+
+Serves the claim queries from a JSON file ({"claims": [...]}) so the agent
+can run and be tested without a Helix server.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from app.domain.entities.helix_query_result import HelixQueryResult
+
+from .snapshot import (
+    SEARCH_BY_ROLE,
+    SEARCH_BY_TAGS,
+    claim_tags,
+    claims_from_response,
+    matches_query,
+)
+
+
+class FixtureHelixQueryClient:
+    """Answers Helix claim queries from a fixture file, in-process."""
+
+    def __init__(self, path: Path, dump_query: str) -> None:
+        self.path = path
+        self.dump_query = dump_query
+        self._claims = claims_from_response(orjson.loads(path.read_bytes()))
+
+    async def query(
+        self, query_name: str, params: dict[str, Any] | None = None
+    ) -> HelixQueryResult:
+        """
+        Run a claim query against the fixture.
+
+        Args:
+            query_name: SearchClaimsByTags, SearchClaimsByRole or the dump query
+            params: Query parameters
+
+        Returns:
+            HelixQueryResult shaped like the Helix response
+
+        Raises:
+            ValueError: If the query is not supported by the fixture
+        """
+        payload = params or {}
+        if query_name == self.dump_query:
+            claims = list(self._claims)
+        elif query_name in (SEARCH_BY_TAGS, SEARCH_BY_ROLE):
+            claims = [
+                claim
+                for claim in self._claims
+                if matches_query(claim_tags(claim), query_name, payload)
+            ]
+        else:
+            raise ValueError(
+                f"Query '{query_name}' is not available in the Helix fixture"
+            )
+        return HelixQueryResult(query_name=query_name, data=[{"claims": claims}])
+
+    def pool_stats(self) -> dict[str, Any]:
+        """No HTTP pool behind a fixture."""
+        return {}
+
+    async def aclose(self) -> None:
+        """Nothing to close."""
@@ -0,0 +1,275 @@
+"""
+Lexical ranking of Helix search results.
+
+Tag queries return every claim/procedure for a class/spec/role. A BM25 index
+over those items picks the ones relevant to the user's question, so only the
+top results are sent to the model.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.llm.tokenizer import count_tokens
+
+_TOKEN_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "do",
+        "does",
+        "for",
+        "from",
+        "how",
+        "i",
+        "in",
+        "is",
+        "it",
+        "my",
+        "of",
+        "on",
+        "or",
+        "should",
+        "the",
+        "to",
+        "what",
+        "when",
+        "which",
+        "who",
+        "why",
+        "with",
+        "you",
+        "your",
+        "o",
+        "os",
+        "de",
+        "da",
+        "das",
+        "dos",
+        "e",
+        "em",
+        "um",
+        "uma",
+        "para",
+        "por",
+        "com",
+        "como",
+        "qual",
+        "quais",
+        "que",
+        "meu",
+        "minha",
+    }
+)
+# Claim fields holding its text, in order of preference
+CLAIM_TEXT_FIELDS = ("text", "content", "claim", "summary", "description")
+# Keys holding identifiers rather than text
+_ID_KEY_RE = re.compile(r"(^|_)id$", re.IGNORECASE)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase terms, dropping stopwords and single characters.
+
+    A trailing plural "s" is removed so "trinkets" matches "trinket".
+    """
+    terms = []
+    for term in _TOKEN_RE.findall(text.casefold()):
+        if len(term) < 2 or term in _STOPWORDS:
+            continue
+        if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+
+@dataclass
+class RankedItem:
+    """A search result item and where it came from."""
+
+    source: str
+    item: Any
+    score: float = 0.0
+
+
+def extract_items(data: Any) -> list[RankedItem]:
+    """
+    Collect the result items of a Helix response.
+
+    Helix returns one dict per payload, mapping each returned variable
+    (e.g. "claims", "procedures") to a list of items.
+
+    Args:
+        data: HelixQueryResult.data
+
+    Returns:
+        Items in response order, tagged with their variable name
+    """
+    responses = data if isinstance(data, list) else [data]
+    items: list[RankedItem] = []
+    for response in responses:
+        if not isinstance(response, dict):
+            continue
+        for source, value in response.items():
+            values = value if isinstance(value, list) else [value]
+            items.extend(RankedItem(source=source, item=item) for item in values)
+    return items
+
+
+def _item_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(
+            _item_text(item)
+            for key, item in value.items()
+            if not _ID_KEY_RE.search(str(key))
+        )
+    if isinstance(value, list):
+        return " ".join(_item_text(item) for item in value)
+    return ""
+
+
+@dataclass
+class BM25Index:
+    """
+    Okapi BM25 index over the items of one Helix response.
+
+    Postings map each term to (item position, term frequency) pairs, so a
+    search only touches items sharing a term with the query.
+    """
+
+    items: list[RankedItem]
+    k1: float = 1.2
+    b: float = 0.75
+    postings: dict[str, list[tuple[int, int]]] = field(init=False, default_factory=dict)
+    lengths: list[int] = field(init=False, default_factory=list)
+    average_length: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        for position, ranked in enumerate(self.items):
+            terms = tokenize(_item_text(ranked.item))
+            self.lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                self.postings.setdefault(term, []).append((position, frequency))
+        if self.lengths:
+            self.average_length = sum(self.lengths) / len(self.lengths) or 1.0
+
+    def search(self, query: str, limit: int) -> list[RankedItem]:
+        """
+        Rank items against a query.
+
+        Items matching no query term keep their response order after the
+        matching ones, so an empty or unmatched query returns the first items.
+
+        Args:
+            query: User query
+            limit: Maximum number of items returned
+
+        Returns:
+            Up to `limit` items, best first, with scores set
+        """
+        scores = [0.0] * len(self.items)
+        item_count = len(self.items)
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            document_frequency = len(postings)
+            idf = math.log(
+                1 + (item_count - document_frequency + 0.5) / (document_frequency + 0.5)
+            )
+            for position, frequency in postings:
+                norm = (
+                    1 - self.b + self.b * self.lengths[position] / self.average_length
+                )
+                scores[position] += (
+                    idf * frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+                )
+
+        order = sorted(range(item_count), key=lambda position: -scores[position])
+        return [
+            RankedItem(
+                source=self.items[position].source,
+                item=self.items[position].item,
+                score=round(scores[position], 3),
+            )
+            for position in order[: max(0, limit)]
+        ]
+
+
+class ResultIndexCache:
+    """
+    Caches BM25 indexes per Helix query so postings are built once per
+    result set instead of once per tool call.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._cache: TTLCache[str, tuple[Any, BM25Index]] = TTLCache(
+            max_entries=max_entries
+        )
+
+    def get(self, key: str, data: Any) -> BM25Index:
+        """
+        Get the index for a result, building it if missing or outdated.
+
+        Args:
+            key: Cache key of the Helix query
+            data: Result data the index must be built from
+
+        Returns:
+            BM25 index over the result items
+        """
+        cached = self._cache.get(key)
+        # A refreshed result is a new object, which invalidates the index
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        index = BM25Index(extract_items(data))
+        self._cache.set(key, (data, index))
+        return index
+
+
+@lru_cache
+def get_result_index_cache() -> ResultIndexCache:
+    """Get the process-wide cache of result indexes."""
+    return ResultIndexCache()
+
+
+def fit_to_token_budget(
+    items: list[RankedItem], max_tokens: int
+) -> tuple[list[RankedItem], int]:
+    """
+    Keep the best items whose serialized size fits a token budget.
+
+    The first item is always kept so the model gets at least one result.
+
+    Args:
+        items: Ranked items, best first
+        max_tokens: Token budget for the kept items
+
+    Returns:
+        Tuple of (kept items, tokens used)
+    """
+    kept: list[RankedItem] = []
+    used = 0
+    for ranked in items:
+        tokens = count_tokens(json.dumps(ranked.item, ensure_ascii=True, default=str))
+        if kept and used + tokens > max_tokens:
+            break
+        kept.append(ranked)
+        used += tokens
+    return kept, used
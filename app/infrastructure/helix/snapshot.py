@@ -0,0 +1,367 @@
+"""
+Local snapshot of the Helix claim corpus.
+
+The claims are dumped from Helix into a JSON-lines file that is memory
+mapped and indexed by tags, so SearchClaimsByTags/SearchClaimsByRole are
+answered in-process. Only record offsets and the tag index live on the heap;
+claims are decoded from the mapped file when a query returns them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mmap
+import os
+import time
+from array import array
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from app.domain.entities.helix_query_result import HelixQueryResult
+from app.infrastructure.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from .client import HelixQueryClient
+
+logger = logging.getLogger(__name__)
+
+SEARCH_BY_TAGS = "SearchClaimsByTags"
+SEARCH_BY_ROLE = "SearchClaimsByRole"
+TAG_FIELDS = ("wow_class", "wow_spec", "wow_role")
+
+
+def _tag(value: Any) -> str:
+    return str(value or "").strip().lower()
+
+
+def claim_tags(claim: dict[str, Any]) -> tuple[str, str, str]:
+    """Get the normalized (class, spec, role) tags of a claim."""
+    wow_class, wow_spec, wow_role = (_tag(claim.get(field)) for field in TAG_FIELDS)
+    return wow_class, wow_spec, wow_role
+
+
+def matches_query(
+    tags: tuple[str, str, str], query_name: str, params: dict[str, Any]
+) -> bool:
+    """
+    Check whether claim tags match a claim search query.
+
+    Args:
+        tags: Normalized (class, spec, role) tags of a claim
+        query_name: SearchClaimsByTags or SearchClaimsByRole
+        params: Query parameters
+
+    Returns:
+        True if the claim belongs in the query result
+    """
+    wow_class, wow_spec, wow_role = tags
+    role = _tag(params.get("wow_role"))
+    if role and wow_role != role:
+        return False
+    if query_name == SEARCH_BY_ROLE:
+        return True
+    return wow_class == _tag(params.get("wow_class")) and wow_spec == _tag(
+        params.get("wow_spec")
+    )
+
+
+def claims_from_response(data: Any) -> list[dict[str, Any]]:
+    """Collect the claim dicts of a Helix response (one dict per payload)."""
+    responses = data if isinstance(data, list) else [data]
+    claims: list[dict[str, Any]] = []
+    for response in responses:
+        if not isinstance(response, dict):
+            continue
+        for value in response.values():
+            if isinstance(value, list):
+                claims.extend(item for item in value if isinstance(item, dict))
+    return claims
+
+
+class ClaimSnapshot:
+    """
+    Read-only, memory-mapped claim store with a tag index.
+
+    Each record is one JSON line; the index keeps (offset, length) per record
+    and record numbers per (class, spec) and per role.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = path.open("rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._tags: list[tuple[str, str, str]] = []
+        self._by_spec: dict[tuple[str, str], array] = {}
+        self._by_role: dict[str, array] = {}
+        self.digest = hashlib.sha256()
+        self.loaded_at = time.time()
+        try:
+            self._build_index()
+        except BaseException:
+            self.close()
+            raise
+
+    @classmethod
+    def write(cls, path: Path, claims: Iterable[dict[str, Any]]) -> ClaimSnapshot:
+        """
+        Write claims to a snapshot file atomically and open it.
+
+        Args:
+            path: Snapshot file path
+            claims: Claim dicts
+
+        Returns:
+            The opened snapshot
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as file:
+            for claim in claims:
+                file.write(orjson.dumps(claim, option=orjson.OPT_SORT_KEYS))
+                file.write(b"\n")
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of the snapshot contents, to detect changed dumps."""
+        return self.digest.hexdigest()
+
+    def search(self, query_name: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Answer a claim search from the snapshot.
+
+        Args:
+            query_name: SearchClaimsByTags or SearchClaimsByRole
+            params: Query parameters
+
+        Returns:
+            Matching claims in snapshot order
+        """
+        if query_name == SEARCH_BY_ROLE:
+            candidates = self._by_role.get(_tag(params.get("wow_role")), array("I"))
+        else:
+            key = (_tag(params.get("wow_class")), _tag(params.get("wow_spec")))
+            candidates = self._by_spec.get(key, array("I"))
+        return [
+            self._read(record)
+            for record in candidates
+            if matches_query(self._tags[record], query_name, params)
+        ]
+
+    def stats(self) -> dict[str, float]:
+        """Return snapshot size statistics."""
+        return {
+            "claims": len(self._offsets),
+            "specs": len(self._by_spec),
+            "bytes": self._mmap.size() if self._mmap is not None else 0,
+            "age_seconds": time.time() - self.loaded_at,
+        }
+
+    def close(self) -> None:
+        """Unmap and close the snapshot file."""
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def _read(self, record: int) -> dict[str, Any]:
+        offset = self._offsets[record]
+        return orjson.loads(self._mmap[offset : offset + self._lengths[record]])
+
+    def _build_index(self) -> None:
+        if self._mmap is None:
+            return
+        offset = 0
+        size = self._mmap.size()
+        while offset < size:
+            end = self._mmap.find(b"\n", offset)
+            if end == -1:
+                end = size
+            line = self._mmap[offset:end]
+            if line.strip():
+                self.digest.update(line)
+                tags = claim_tags(orjson.loads(line))
+                record = len(self._offsets)
+                self._offsets.append(offset)
+                self._lengths.append(end - offset)
+                self._tags.append(tags)
+                self._by_spec.setdefault((tags[0], tags[1]), array("I")).append(record)
+                self._by_role.setdefault(tags[2], array("I")).append(record)
+            offset = end + 1
+
+
+class SnapshotHelixQueryClient:
+    """
+    Helix client that answers claim searches from a local snapshot.
+
+    The snapshot file is loaded at startup and refreshed in the background
+    from the upstream client; a new snapshot is swapped in only when the
+    dump changed. Other queries, and all queries before the first snapshot
+    is available, go to the upstream client.
+    """
+
+    def __init__(
+        self,
+        upstream: HelixQueryClient,
+        path: Path,
+        dump_query: str,
+        refresh_seconds: float,
+    ) -> None:
+        self._upstream = upstream
+        self.path = path
+        self.dump_query = dump_query
+        self.refresh_seconds = refresh_seconds
+        self._snapshot: ClaimSnapshot | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback run after a new snapshot is swapped in."""
+        self._listeners.append(listener)
+
+    async def start(self) -> None:
+        """
+        Load the snapshot file and start refreshing.
+
+        A missing, unreadable or empty file is replaced by a fresh dump.
+        """
+        loaded_from_file = await self._load_file()
+        if not loaded_from_file:
+            await self.refresh()
+        if self.refresh_seconds > 0:
+            # A snapshot left by a previous run is refreshed right away
+            self._refresh_task = asyncio.create_task(
+                self._refresh_loop(refresh_first=loaded_from_file)
+            )
+
+    async def refresh(self) -> bool:
+        """
+        Dump the claims from upstream and swap in a new snapshot if changed.
+
+        An empty dump counts as a failed refresh and keeps the current snapshot.
+
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        start = time.perf_counter()
+        try:
+            result = await self._upstream.query(self.dump_query, {})
+            claims = claims_from_response(result.data)
+            if not claims:
+                raise ValueError("the dump returned no claims")
+            tmp_path = self.path.with_suffix(self.path.suffix + ".new")
+            snapshot = await asyncio.to_thread(ClaimSnapshot.write, tmp_path, claims)
+        except Exception as exc:
+            logger.warning("Helix snapshot refresh failed: %s", exc)
+            get_metrics().increment("helix_snapshot_refreshes_total", status="error")
+            return False
+
+        current = self._snapshot
+        if current is not None and current.content_hash == snapshot.content_hash:
+            snapshot.close()
+            tmp_path.unlink(missing_ok=True)
+            current.loaded_at = time.time()
+            get_metrics().increment(
+                "helix_snapshot_refreshes_total", status="unchanged"
+            )
+            return False
+
+        # The open map stays valid across the rename
+        os.replace(tmp_path, self.path)
+        snapshot.path = self.path
+        self._swap(snapshot)
+        get_metrics().increment("helix_snapshot_refreshes_total", status="updated")
+        logger.info(
+            "Helix snapshot updated: %d claims in %.2fs",
+            len(claims),
+            time.perf_counter() - start,
+        )
+        return True
+
+    async def query(
+        self, query_name: str, params: dict[str, Any] | None = None
+    ) -> HelixQueryResult:
+        """
+        Run a Helix query, in-process when the snapshot can answer it.
+
+        Args:
+            query_name: Name of the Helix query
+            params: Query parameters
+
+        Returns:
+            HelixQueryResult shaped like the Helix response
+        """
+        payload = params or {}
+        snapshot = self._snapshot
+        if snapshot is None or query_name not in (SEARCH_BY_TAGS, SEARCH_BY_ROLE):
+            return await self._upstream.query(query_name, payload)
+
+        start = time.perf_counter()
+        claims = snapshot.search(query_name, payload)
+        get_metrics().observe(
+            "helix_snapshot_query_seconds",
+            time.perf_counter() - start,
+            query=query_name,
+        )
+        return HelixQueryResult(query_name=query_name, data=[{"claims": claims}])
+
+    def stats(self) -> dict[str, float]:
+        """Return snapshot statistics (empty until a snapshot is loaded)."""
+        return self._snapshot.stats() if self._snapshot is not None else {}
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Get connection counts of the upstream client's HTTP pool."""
+        return self._upstream.pool_stats()
+
+    async def aclose(self) -> None:
+        """Stop refreshing, close the snapshot and the upstream client."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+        await self._upstream.aclose()
+
+    async def _load_file(self) -> bool:
+        """Swap in the snapshot file left by a previous run, if it is usable."""
+        if not self.path.exists():
+            return False
+        try:
+            snapshot = await asyncio.to_thread(ClaimSnapshot, self.path)
+        except Exception as exc:
+            logger.warning("Helix snapshot %s is unreadable: %s", self.path, exc)
+            return False
+        if not len(snapshot):
+            snapshot.close()
+            logger.warning("Helix snapshot %s is empty", self.path)
+            return False
+        self._swap(snapshot)
+        return True
+
+    async def _refresh_loop(self, refresh_first: bool) -> None:
+        if refresh_first:
+            await self.refresh()
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            await self.refresh()
+
+    def _swap(self, snapshot: ClaimSnapshot) -> None:
+        previous, self._snapshot = self._snapshot, snapshot
+        # Searches decode synchronously, so nothing reads the old map anymore
+        if previous is not None:
+            previous.close()
+        for listener in self._listeners:
+            listener()
@@ -0,0 +1,55 @@
+"""
+Connection pool statistics of pooled httpx clients.
+
+httpx does not expose its httpcore pool publicly, so the stats read
+AsyncClient._transport._pool. That layout is why httpx and httpcore are
+pinned to a tested range in pyproject.toml; if it ever changes, the stats
+are reported as unavailable (empty) with a warning instead of as zeros.
+"""
+
+import logging
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_warned = False
+
+
+def pool_stats(http_client: httpx.AsyncClient) -> dict[str, Any]:
+    """
+    Get connection counts of an httpx client's connection pool.
+
+    Args:
+        http_client: Pooled client using the default transport
+
+    Returns:
+        Connection counts, or an empty dict if the pool cannot be read
+    """
+    global _warned
+    pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    requests = getattr(pool, "_requests", None)
+    if connections is None or requests is None:
+        if not _warned:
+            _warned = True
+            logger.warning(
+                "httpx connection pool is not readable (httpx %s); "
+                "pool stats are unavailable",
+                httpx.__version__,
+            )
+        return {}
+
+    connections = list(connections)
+    return {
+        "connections": len(connections),
+        "idle": sum(1 for connection in connections if connection.is_idle()),
+        "active": sum(
+            1
+            for connection in connections
+            if not connection.is_idle() and not connection.is_closed()
+        ),
+        "http2": sum(1 for connection in connections if "HTTP/2" in connection.info()),
+        "pending_requests": len(requests),
+    }
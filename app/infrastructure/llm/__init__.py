@@ -2,6 +2,19 @@
 LLM infrastructure module.
 """
 
-from .client import LLMClient
+from .client import LLMClient, create_http_client
+from .coalescing import CoalescingChatModel, StreamCoalescer
+from .hedging import HedgePolicy, HedgeStats, HedgingChatModel
+from .tokenizer import count_message_tokens, count_tokens
 
-__all__ = ["LLMClient"]
+__all__ = [
+    "CoalescingChatModel",
+    "HedgePolicy",
+    "HedgeStats",
+    "HedgingChatModel",
+    "LLMClient",
+    "StreamCoalescer",
+    "create_http_client",
+    "count_message_tokens",
+    "count_tokens",
+]
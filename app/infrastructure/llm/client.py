@@ -2,19 +2,90 @@
 LLM client wrapper using LangChain ChatOpenAI.
 """
 
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_openai import ChatOpenAI
 
 from app.infrastructure.config import get_settings
+from app.infrastructure.http_pool import pool_stats
+
+from .coalescing import CoalescingChatModel, StreamCoalescer
+from .hedging import HedgePolicy, HedgeStats, HedgingChatModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled async HTTP client shared by all model variants.
+
+    HTTP/2 is only enabled when requested and the h2 package is installed.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    settings = get_settings()
+    http2 = settings.llm_http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("LLM_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(
+            settings.llm_read_timeout_seconds,
+            connect=settings.llm_connect_timeout_seconds,
+        ),
+    )
 
 
 class LLMClient:
     """
     Wrapper around LangChain ChatOpenAI.
     Provides a consistent interface for LLM interactions.
+
+    All variants derived with with_temperature/with_model share one pooled
+    HTTP client, so warm keep-alive connections are reused across them.
     """
 
-    def __init__(self, model: ChatOpenAI):
+    def __init__(
+        self,
+        model: ChatOpenAI,
+        coalescer: StreamCoalescer | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        hedge_model_name: str = "",
+        hedge_stats: HedgeStats | None = None,
+    ):
         self._model = model
+        self._coalescer = coalescer
+        self._http_client = http_client
+        self._hedge_policy = hedge_policy
+        self._hedge_model_name = hedge_model_name
+        self._hedge_stats = hedge_stats or HedgeStats()
+        self._hedged_primary: ChatOpenAI | None = None
+        self._hedge_model: ChatOpenAI | None = None
+        if hedge_policy is not None:
+            # Streams inside the hedging wrapper are retried by its policy,
+            # within the deadline; the plain model keeps the SDK retries
+            self._hedged_primary = self._without_retries(model, model.model_name)
+            self._hedge_model = self._hedged_primary
+            if hedge_model_name and hedge_model_name != model.model_name:
+                self._hedge_model = self._without_retries(model, hedge_model_name)
 
     @classmethod
     def from_settings(cls) -> "LLMClient":
@@ -25,19 +96,94 @@ class LLMClient:
             Configured LLMClient instance
         """
         settings = get_settings()
-        model = ChatOpenAI(
+        http_client = create_http_client()
+        hedge_policy = None
+        if settings.llm_hedge_enabled:
+            hedge_policy = HedgePolicy(
+                first_token_timeout=settings.llm_first_token_timeout_seconds,
+                max_retries=settings.llm_max_retries,
+                retry_backoff=settings.llm_retry_backoff_seconds,
+            )
+        model = cls._build_model(
             api_key=settings.openai_api_key,
-            model=settings.openai_model,
+            model_name=settings.openai_model,
             temperature=0.7,
+            http_client=http_client,
+            max_retries=settings.llm_max_retries,
+        )
+        coalescer = StreamCoalescer() if settings.llm_coalesce_enabled else None
+        return cls(
+            model=model,
+            coalescer=coalescer,
+            http_client=http_client,
+            hedge_policy=hedge_policy,
+            hedge_model_name=settings.llm_hedge_model,
+        )
+
+    def _without_retries(self, model: ChatOpenAI, model_name: str) -> ChatOpenAI:
+        return self._build_model(
+            api_key=model.openai_api_key,
+            model_name=model_name,
+            temperature=model.temperature,
+            http_client=self._http_client,
+            max_retries=0,
+        )
+
+    @staticmethod
+    def _build_model(
+        api_key: Any,
+        model_name: str,
+        temperature: float,
+        http_client: httpx.AsyncClient | None,
+        max_retries: int | None = None,
+    ) -> ChatOpenAI:
+        return ChatOpenAI(
+            api_key=api_key,
+            model=model_name,
+            temperature=temperature,
             streaming=True,
+            # Emit usage (incl. cached prompt tokens) on the final chunk
+            stream_usage=True,
+            http_async_client=http_client,
+            max_retries=max_retries,
         )
-        return cls(model=model)
 
     @property
     def model(self) -> ChatOpenAI:
-        """Get the underlying ChatOpenAI model."""
+        """Get the underlying ChatOpenAI model (SDK retries, no hedging)."""
         return self._model
 
+    @property
+    def chat_model(self) -> BaseChatModel:
+        """
+        Get the model to use inside the agent graph.
+
+        Wraps the underlying model with the first-token deadline and hedging
+        policy, if enabled, and so identical concurrent streams share one
+        upstream request when coalescing is enabled.
+        """
+        model: BaseChatModel = self._model
+        if self._hedge_policy is not None:
+            model = HedgingChatModel(
+                primary=self._hedged_primary,
+                hedge=self._hedge_model,
+                policy=self._hedge_policy,
+                stats=self._hedge_stats,
+            )
+        if self._coalescer is None:
+            return model
+        return CoalescingChatModel(inner=model, coalescer=self._coalescer)
+
+    @property
+    def coalescer(self) -> StreamCoalescer | None:
+        """Get the stream coalescer, if coalescing is enabled."""
+        return self._coalescer
+
+    @property
+    def hedge_stats(self) -> HedgeStats:
+        """Get hedging statistics shared by all derived clients."""
+        return self._hedge_stats
+
     def with_temperature(self, temperature: float) -> "LLMClient":
         """
         Create a new client with different temperature.
@@ -48,10 +194,85 @@ class LLMClient:
         Returns:
             New LLMClient with updated temperature
         """
-        new_model = ChatOpenAI(
+        return self._derive(self._model.model_name, temperature)
+
+    def with_model(self, model_name: str) -> "LLMClient":
+        """
+        Create a new client for a different model.
+
+        Args:
+            model_name: OpenAI model name
+
+        Returns:
+            New LLMClient using the model, same temperature
+        """
+        return self._derive(model_name, self._model.temperature)
+
+    def _derive(self, model_name: str, temperature: float | None) -> "LLMClient":
+        new_model = self._build_model(
             api_key=self._model.openai_api_key,
-            model=self._model.model_name,
+            model_name=model_name,
             temperature=temperature,
-            streaming=True,
+            http_client=self._http_client,
+            max_retries=self._model.max_retries,
+        )
+        return LLMClient(
+            model=new_model,
+            coalescer=self._coalescer,
+            http_client=self._http_client,
+            hedge_policy=self._hedge_policy,
+            hedge_model_name=self._hedge_model_name,
+            hedge_stats=self._hedge_stats,
+        )
+
+    async def prewarm(self, connections: int | None = None) -> None:
+        """
+        Open keep-alive connections (DNS + TCP + TLS) ahead of the first call.
+
+        Sends lightweight GET /models requests concurrently; any HTTP status
+        counts as success since only the connection matters.
+
+        Args:
+            connections: Number of connections to open (defaults to settings)
+        """
+        if self._http_client is None:
+            return
+        if connections is None:
+            connections = get_settings().llm_prewarm_connections
+        if connections <= 0:
+            return
+
+        base_url = (self._model.openai_api_base or DEFAULT_OPENAI_BASE_URL).rstrip("/")
+        headers = {}
+        if self._model.openai_api_key:
+            api_key = self._model.openai_api_key.get_secret_value()
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        results = await asyncio.gather(
+            *(
+                self._http_client.get(f"{base_url}/models", headers=headers)
+                for _ in range(connections)
+            ),
+            return_exceptions=True,
         )
-        return LLMClient(model=new_model)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning("LLM connection prewarm failed: %s", failures[0])
+        else:
+            logger.info("Prewarmed %d LLM connections to %s", connections, base_url)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool statistics of the shared HTTP client.
+
+        Returns:
+            Dict with connection counts (empty if no shared client)
+        """
+        if self._http_client is None:
+            return {}
+        return pool_stats(self._http_client)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
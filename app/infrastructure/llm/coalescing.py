@@ -0,0 +1,247 @@
+"""
+Single-flight coalescing of identical concurrent LLM streams.
+
+When several graph runs issue the exact same request (same messages, bound
+tools, model and sampling parameters) at the same time, only one upstream
+stream is opened and its chunks are fanned out to every waiting caller.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from pydantic import ConfigDict, Field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Flight:
+    """Shared state of one in-flight upstream stream."""
+
+    chunks: list[Any] = field(default_factory=list)
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+    done: bool = False
+    error: BaseException | None = None
+    subscribers: int = 0
+    task: asyncio.Task | None = None
+
+
+class StreamCoalescer:
+    """
+    Deduplicates concurrent async streams that share a key.
+
+    The first caller for a key starts the upstream stream in a background
+    task; later callers subscribe to it and replay the chunks received so
+    far before following live. The upstream task is cancelled only when the
+    last subscriber goes away (reference-counted cancellation).
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight] = {}
+        self.started = 0
+        self.joined = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of upstream streams currently running."""
+        return len(self._flights)
+
+    async def stream(
+        self,
+        key: str,
+        factory: Callable[[], AsyncIterator[Any]],
+        follower_transform: Callable[[Any], Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Subscribe to the stream for a key, starting it if needed.
+
+        Args:
+            key: Fingerprint identifying identical requests
+            factory: Creates the upstream async iterator (called once per flight)
+            follower_transform: Applied to the chunks yielded to callers that
+                joined an existing flight (the caller that started it gets
+                them unchanged)
+
+        Yields:
+            Chunks of the shared upstream stream, from the beginning
+        """
+        flight = self._flights.get(key)
+        transform = None
+        if flight is None:
+            flight = _Flight()
+            self._flights[key] = flight
+            flight.task = asyncio.create_task(self._produce(key, flight, factory))
+            self.started += 1
+        else:
+            self.joined += 1
+            transform = follower_transform
+            logger.debug(
+                "Coalesced LLM stream %s (%d waiting)", key[:12], flight.subscribers + 1
+            )
+
+        flight.subscribers += 1
+        index = 0
+        try:
+            while True:
+                async with flight.condition:
+                    while index >= len(flight.chunks) and not flight.done:
+                        await flight.condition.wait()
+                while index < len(flight.chunks):
+                    chunk = flight.chunks[index]
+                    yield transform(chunk) if transform else chunk
+                    index += 1
+                if flight.done and index >= len(flight.chunks):
+                    if flight.error is not None:
+                        raise flight.error
+                    return
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done and flight.task:
+                # Last interested caller left: stop the upstream request
+                flight.task.cancel()
+                self._discard(key, flight)
+
+    async def _produce(
+        self, key: str, flight: _Flight, factory: Callable[[], AsyncIterator[Any]]
+    ) -> None:
+        try:
+            async for chunk in factory():
+                async with flight.condition:
+                    flight.chunks.append(chunk)
+                    flight.condition.notify_all()
+        except asyncio.CancelledError:
+            flight.error = asyncio.CancelledError()
+            raise
+        except Exception as exc:
+            flight.error = exc
+        finally:
+            flight.done = True
+            self._discard(key, flight)
+            async with flight.condition:
+                flight.condition.notify_all()
+
+    def _discard(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+def _message_key(message: BaseMessage) -> dict[str, Any]:
+    """
+    Fields of a message that affect the generation.
+
+    Message ids are left out: every run assigns its own (add_messages gives
+    new messages a random id, stored messages keep their database id).
+    """
+    return {
+        "type": message.type,
+        "content": message.content,
+        "tool_calls": getattr(message, "tool_calls", None),
+        "tool_call_id": getattr(message, "tool_call_id", None),
+        "name": message.name,
+    }
+
+
+def _without_usage(chunk: ChatGenerationChunk) -> ChatGenerationChunk:
+    """Drop provider usage from a chunk; it is attributed to the leader only."""
+    message = chunk.message
+    if getattr(message, "usage_metadata", None) is None:
+        return chunk
+    return ChatGenerationChunk(
+        message=message.model_copy(update={"usage_metadata": None}),
+        generation_info=chunk.generation_info,
+    )
+
+
+def _fingerprint(payload: object) -> str:
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CoalescingChatModel(BaseChatModel):
+    """
+    Chat model wrapper that coalesces identical concurrent streaming calls.
+
+    The fingerprint covers the input messages (content, not ids), stop
+    sequences, bound call options (tools, tool_choice, ...) and the wrapped
+    model's identifying parameters (model name, temperature, ...). Callbacks
+    still fire per caller, so every graph run receives its own stream events;
+    provider usage is only reported to the caller that started the stream.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    inner: BaseChatModel
+    coalescer: StreamCoalescer = Field(exclude=True)
+
+    @property
+    def _llm_type(self) -> str:
+        return f"coalescing-{self.inner._llm_type}"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return self.inner._identifying_params
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        """Bind tools using the wrapped model's tool formatting."""
+        bound = self.inner.bind_tools(tools, **kwargs)
+        return self.bind(**bound.kwargs)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return self.inner._generate(messages, stop=stop, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await self.inner._agenerate(messages, stop=stop, **kwargs)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        key = _fingerprint(
+            {
+                "model": self.inner._identifying_params,
+                "messages": [_message_key(message) for message in messages],
+                "stop": stop,
+                "kwargs": kwargs,
+            }
+        )
+
+        def factory() -> AsyncIterator[ChatGenerationChunk]:
+            # No run_manager: callbacks fire from each caller's astream instead
+            return self.inner._astream(messages, stop=stop, **kwargs)
+
+        # The provider bills a shared stream once: only the caller that
+        # started it reports its usage
+        async for chunk in self.coalescer.stream(key, factory, _without_usage):
+            # Chunks are shared between callers and astream mutates them
+            yield ChatGenerationChunk(
+                message=chunk.message.model_copy(),
+                generation_info=chunk.generation_info,
+            )
@@ -0,0 +1,261 @@
+"""
+Deadline-aware, hedged LLM streams.
+
+A provider that stalls before the first token otherwise keeps the user
+waiting for the full HTTP read timeout. Each stream gets a time-to-first-token
+deadline; when it expires, a hedged request is sent (to a fallback model, or
+the same one) and whichever stream produces a first chunk first is used, the
+other one is cancelled. Transient errors before the first chunk are retried
+with jittered exponential backoff. Errors after it are raised: part of the
+answer has already been streamed.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import openai
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from pydantic import ConfigDict, Field
+
+from app.infrastructure.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT_ERRORS = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    httpx.TransportError,
+)
+
+WINNER_PRIMARY = "primary"
+WINNER_HEDGE = "hedge"
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Deadline and retry policy of LLM streams.
+
+    Attributes:
+        first_token_timeout: Seconds to wait for the first chunk before
+            sending a hedged request
+        max_retries: Retries of transient errors before the first chunk
+        retry_backoff: Base delay of the exponential backoff, in seconds
+    """
+
+    first_token_timeout: float
+    max_retries: int = 2
+    retry_backoff: float = 0.5
+
+
+class HedgeStats:
+    """Counts of hedged streams, shared by every model variant of a client."""
+
+    def __init__(self) -> None:
+        self.streams = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.retries = 0
+
+    def snapshot(self) -> dict[str, float]:
+        """Return hedge rate and how often the hedged request won."""
+        return {
+            "streams": self.streams,
+            "hedged": self.hedged,
+            "hedge_rate": self.hedged / self.streams if self.streams else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "hedge_win_rate": self.hedge_wins / self.hedged if self.hedged else 0.0,
+            "retries": self.retries,
+        }
+
+
+class _Attempt:
+    """One upstream stream, with its first chunk being awaited in a task."""
+
+    def __init__(self, name: str, stream: AsyncIterator[ChatGenerationChunk]):
+        self.name = name
+        self.stream = stream
+        self.first = asyncio.ensure_future(self._first_chunk())
+
+    async def _first_chunk(self) -> ChatGenerationChunk | None:
+        try:
+            return await anext(self.stream)
+        except StopAsyncIteration:
+            return None
+
+    async def aclose(self) -> None:
+        """Cancel the attempt and close its upstream request."""
+        self.first.cancel()
+        with contextlib.suppress(BaseException):
+            await self.first
+        with contextlib.suppress(Exception):
+            await self.stream.aclose()
+
+
+class HedgingChatModel(BaseChatModel):
+    """
+    Chat model wrapper adding a first-token deadline, hedging and retries.
+
+    Both models receive the same messages and bound call options (tools,
+    tool_choice, ...), so the hedge model must accept the primary's tool
+    format.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    primary: BaseChatModel
+    hedge: BaseChatModel
+    policy: HedgePolicy = Field(exclude=True)
+    stats: HedgeStats = Field(exclude=True, default_factory=HedgeStats)
+
+    @property
+    def _llm_type(self) -> str:
+        return f"hedging-{self.primary._llm_type}"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return self.primary._identifying_params
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        """Bind tools using the primary model's tool formatting."""
+        bound = self.primary.bind_tools(tools, **kwargs)
+        return self.bind(**bound.kwargs)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return self.primary._generate(messages, stop=stop, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await self.primary._agenerate(messages, stop=stop, **kwargs)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        self.stats.streams += 1
+        attempt = 0
+        while True:
+            try:
+                winner = await self._start(messages, stop, kwargs)
+                break
+            except TRANSIENT_ERRORS as exc:
+                if attempt >= self.policy.max_retries:
+                    raise
+                delay = (
+                    self.policy.retry_backoff * 2**attempt * random.uniform(0.5, 1.5)
+                )
+                attempt += 1
+                self.stats.retries += 1
+                get_metrics().increment("llm_retries_total", error=type(exc).__name__)
+                logger.warning(
+                    "LLM stream failed before the first token (%s); retry %d in %.2fs",
+                    exc,
+                    attempt,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+        try:
+            first = winner.first.result()
+            if first is None:
+                return
+            yield first
+            async for chunk in winner.stream:
+                yield chunk
+        finally:
+            await winner.aclose()
+
+    async def _start(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None,
+        kwargs: dict[str, Any],
+    ) -> _Attempt:
+        """
+        Open the stream, hedging it if the first chunk misses the deadline.
+
+        Returns:
+            The attempt whose first chunk arrived first
+
+        Raises:
+            Exception: The last error, if every attempt failed
+        """
+        attempts = [
+            _Attempt(
+                WINNER_PRIMARY, self.primary._astream(messages, stop=stop, **kwargs)
+            )
+        ]
+        try:
+            done, _ = await asyncio.wait(
+                [attempts[0].first], timeout=self.policy.first_token_timeout
+            )
+            if done:
+                attempts[0].first.result()
+                return attempts[0]
+
+            self.stats.hedged += 1
+            get_metrics().increment("llm_hedged_streams_total")
+            logger.info(
+                "No LLM token after %.1fs; sending a hedged request",
+                self.policy.first_token_timeout,
+            )
+            attempts.append(
+                _Attempt(
+                    WINNER_HEDGE, self.hedge._astream(messages, stop=stop, **kwargs)
+                )
+            )
+            winner = await _first_to_start(attempts)
+        except BaseException:
+            for attempt in attempts:
+                await attempt.aclose()
+            raise
+
+        if winner.name == WINNER_HEDGE:
+            self.stats.hedge_wins += 1
+        get_metrics().increment("llm_hedge_wins_total", winner=winner.name)
+        for attempt in attempts:
+            if attempt is not winner:
+                await attempt.aclose()
+        return winner
+
+
+async def _first_to_start(attempts: list[_Attempt]) -> _Attempt:
+    """Wait for the first attempt to produce a chunk; failures wait for the rest."""
+    pending = {attempt.first: attempt for attempt in attempts}
+    error: BaseException = RuntimeError("No LLM stream was started")
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            attempt = pending.pop(task)
+            if task.exception() is None:
+                return attempt
+            error = task.exception()
+    raise error
@@ -0,0 +1,109 @@
+"""
+Local token counting.
+
+Used when the provider does not report usage (human and tool messages,
+replayed answers). tiktoken may download encoding files on first use, so
+encodings are loaded at startup in a worker thread (see load_encoding; set
+TIKTOKEN_CACHE_DIR to ship them with the image). Until an encoding is
+loaded, or if loading failed, counts fall back to a characters-per-token
+estimate.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Iterable
+
+import tiktoken
+from langchain_core.messages import AIMessage, BaseMessage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "o200k_base"
+# Rough average for English text with OpenAI BPE tokenizers
+CHARS_PER_TOKEN = 4
+# Role and separator tokens the chat format adds around every message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+# Loaded encodings by model name (None is the default encoding)
+_encodings: dict[str | None, tiktoken.Encoding] = {}
+
+
+def _load(model: str | None) -> tiktoken.Encoding:
+    if model:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            pass
+    return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+async def load_encoding(model: str | None = None) -> bool:
+    """
+    Load an encoding without blocking the event loop.
+
+    Failures are not remembered, so a later call retries.
+
+    Args:
+        model: Model name used to pick the encoding (defaults to o200k_base)
+
+    Returns:
+        Whether the encoding is available
+    """
+    if model in _encodings:
+        return True
+    try:
+        _encodings[model] = await asyncio.to_thread(_load, model)
+    except Exception as exc:
+        logger.warning("Tokenizer unavailable, estimating token counts: %s", exc)
+        return False
+    return True
+
+
+def _get_encoding(model: str | None) -> tiktoken.Encoding | None:
+    """Get a loaded encoding, falling back to the default one."""
+    return _encodings.get(model) or _encodings.get(None)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """
+    Count the tokens of a text.
+
+    Args:
+        text: Text to count
+        model: Model name used to pick the encoding (defaults to o200k_base)
+
+    Returns:
+        Token count (estimated when no encoding is available)
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return max(1, len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(
+    messages: Iterable[BaseMessage], model: str | None = None
+) -> int:
+    """
+    Estimate the prompt tokens of a list of chat messages.
+
+    Args:
+        messages: LangChain messages (content and tool call arguments count)
+        model: Model name used to pick the encoding
+
+    Returns:
+        Approximate prompt token count
+    """
+    total = 0
+    for message in messages:
+        content = message.content
+        if not isinstance(content, str):
+            content = json.dumps(content)
+        total += MESSAGE_OVERHEAD_TOKENS + count_tokens(content, model)
+        if isinstance(message, AIMessage) and message.tool_calls:
+            total += count_tokens(json.dumps(message.tool_calls), model)
+    return total
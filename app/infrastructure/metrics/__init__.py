@@ -0,0 +1,7 @@
+"""
+Metrics infrastructure module.
+"""
+
+from .registry import MetricsRegistry, get_metrics
+
+__all__ = ["MetricsRegistry", "get_metrics"]
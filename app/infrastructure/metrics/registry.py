@@ -0,0 +1,132 @@
+"""
+In-process metrics registry.
+
+Counters and latency histograms are kept in memory per worker process and
+exposed as a JSON snapshot by the /metrics route. Collectors let components
+that already track their own numbers (connection pools, caches) report them
+at snapshot time.
+"""
+
+import math
+from collections import defaultdict, deque
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+# Samples kept per histogram for percentile estimates
+HISTOGRAM_WINDOW = 1024
+
+
+def _series_name(name: str, labels: dict[str, str]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f"{key}={labels[key]}" for key in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class _Histogram:
+    """Running count/sum plus a sliding window of recent samples."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.window: deque[float] = deque(maxlen=HISTOGRAM_WINDOW)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.window.append(value)
+
+    def snapshot(self) -> dict[str, float]:
+        values = sorted(self.window)
+        if not values:
+            return {"count": 0, "sum": 0.0}
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+            "max": values[-1],
+        }
+
+
+class MetricsRegistry:
+    """Registry of counters, histograms and snapshot-time collectors."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, float] = defaultdict(float)
+        self._histograms: dict[str, _Histogram] = defaultdict(_Histogram)
+        self._collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Metric name
+            value: Amount to add
+            **labels: Label values distinguishing series of the same metric
+        """
+        self._counters[_series_name(name, labels)] += value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Record a sample (e.g. a latency in seconds) in a histogram.
+
+        Args:
+            name: Metric name
+            value: Observed value
+            **labels: Label values distinguishing series of the same metric
+        """
+        self._histograms[_series_name(name, labels)].observe(value)
+
+    def register_collector(
+        self, name: str, collector: Callable[[], dict[str, Any]]
+    ) -> None:
+        """
+        Register a callable reporting values at snapshot time.
+
+        Args:
+            name: Section name in the snapshot (replaces any previous one)
+            collector: Returns a JSON-serializable dict
+        """
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get the current value of every metric.
+
+        Returns:
+            Dict with counters, histograms and collector sections
+        """
+        collected = {}
+        for name, collector in self._collectors.items():
+            try:
+                collected[name] = collector()
+            except Exception as exc:
+                collected[name] = {"error": str(exc)}
+        return {
+            "counters": dict(self._counters),
+            "histograms": {
+                name: histogram.snapshot()
+                for name, histogram in self._histograms.items()
+            },
+            **collected,
+        }
+
+    def reset(self) -> None:
+        """Clear counters and histograms (collectors stay registered)."""
+        self._counters.clear()
+        self._histograms.clear()
+
+
+@lru_cache
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return MetricsRegistry()
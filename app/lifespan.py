@@ -7,8 +7,26 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from app.application.agent import GraphBuilder, get_all_tools
-from app.infrastructure import LLMClient, close_database, init_database
+from app.application.agent import (
+    AnswerCache,
+    GraphBuilder,
+    SummarizeNode,
+    SummaryRefresher,
+    get_all_tools,
+)
+from app.application.agent.knowledge import get_context_pack_store, get_spec_index
+from app.application.agent.prompts.system_prompt import AGENT_SYSTEM_PROMPT_VERSION
+from app.infrastructure import (
+    LLMClient,
+    close_database,
+    get_metrics,
+    get_settings,
+    init_database,
+)
+from app.infrastructure.helix.cache import CachedHelixQueryClient
+from app.infrastructure.helix.client import get_helix_client, get_helix_snapshot
+from app.infrastructure.llm.tokenizer import load_encoding
+from app.presentation.api.dependencies import open_summary_repositories
 
 
 @asynccontextmanager
@@ -18,10 +36,16 @@ async def lifespan(app: FastAPI):
 
     On startup:
     - Initialize database connections
+    - Load the tokenizer encoding
     - Build the LangGraph agent (singleton)
+    - Prewarm LLM connections
+    - Load the local Helix claim snapshot (if enabled)
 
     On shutdown:
+    - Finish pending summary refreshes
     - Close database connections
+    - Close the shared LLM HTTP client
+    - Close the pooled Helix HTTP client
     """
     # Startup
     print("Starting up...")
@@ -30,23 +54,79 @@ async def lifespan(app: FastAPI):
     engine, session_factory = await init_database()
     print(f"Database initialized: {engine.url}")
 
+    # Load the tokenizer off the event loop (it may download its encoding)
+    await load_encoding()
+
     # Build the graph singleton
     llm_client = LLMClient.from_settings()
     tools = get_all_tools()
+    # Load spec knowledge now so get_spec_info calls are plain lookups
+    spec_index = get_spec_index()
     graph_builder = GraphBuilder(llm_client=llm_client, tools=tools)
     graph = graph_builder.build()
 
+    # Open LLM connections now so the first requests skip the TLS handshake
+    await llm_client.prewarm()
+    get_metrics().register_collector("llm_http_pool", llm_client.pool_stats)
+    get_metrics().register_collector("llm_hedging", llm_client.hedge_stats.snapshot)
+    helix_client = get_helix_client()
+    helix_snapshot = get_helix_snapshot()
+    if helix_snapshot is not None:
+        # Load the claim snapshot before serving so searches stay in-process
+        await helix_snapshot.start()
+        get_metrics().register_collector("helix_snapshot", helix_snapshot.stats)
+    get_metrics().register_collector("helix_http_pool", helix_client.pool_stats)
+    if isinstance(helix_client, CachedHelixQueryClient):
+        get_metrics().register_collector("helix_cache", helix_client.stats)
+
+    # Answer cache singleton (shared across requests)
+    settings = get_settings()
+    answer_cache = None
+    if settings.answer_cache_enabled:
+        answer_cache = AnswerCache(
+            prompt_version=AGENT_SYSTEM_PROMPT_VERSION,
+            data_version=settings.helix_data_version,
+            max_entries=settings.answer_cache_max_entries,
+            ttl_seconds=settings.answer_cache_ttl_seconds,
+            max_question_chars=settings.answer_cache_max_question_chars,
+        )
+
+    # Summaries past the trigger are refreshed after the answer is streamed
+    summary_refresher = None
+    if settings.summary_enabled:
+        summary_refresher = SummaryRefresher(
+            SummarizeNode(
+                llm_client.with_temperature(0).model,
+                token_threshold=settings.summary_trigger_tokens,
+                keep_turns=settings.summary_keep_turns,
+            ),
+            open_summary_repositories,
+        )
+
     # Store in app state for access in routes
     app.state.graph = graph
     app.state.llm_client = llm_client
     app.state.db_engine = engine
+    app.state.answer_cache = answer_cache
+    app.state.summary_refresher = summary_refresher
 
     print("Graph built and ready")
     print(f"Tools available: {[t.name for t in tools]}")
+    print(f"Spec knowledge loaded: {len(spec_index)} specs")
+    if settings.context_packs_enabled:
+        print(f"Context packs loaded: {len(get_context_pack_store())}")
 
     yield
 
     # Shutdown
     print("Shutting down...")
+    if summary_refresher is not None:
+        await summary_refresher.aclose()
     await close_database()
     print("Database connections closed")
+    await llm_client.aclose()
+    print("LLM HTTP client closed")
+    await helix_client.aclose()
+    get_helix_client.cache_clear()
+    get_helix_snapshot.cache_clear()
+    print("Helix HTTP client closed")
@@ -2,25 +2,37 @@
 Presentation layer - API and serialization.
 """
 
-from .api import chat_router, threads_router
+from .api import (
+    chat_router,
+    exports_router,
+    metrics_router,
+    threads_router,
+    usage_router,
+)
 from .schemas import (
     CreateThreadRequest,
     MessageResponse,
     SendMessageRequest,
     ThreadResponse,
+    UsageResponse,
 )
-from .serializers import serialize_message, serialize_thread
+from .serializers import serialize_message, serialize_messages_json, serialize_thread
 
 __all__ = [
     # Routers
     "chat_router",
+    "exports_router",
+    "metrics_router",
     "threads_router",
+    "usage_router",
     # Schemas
     "SendMessageRequest",
     "MessageResponse",
     "CreateThreadRequest",
     "ThreadResponse",
+    "UsageResponse",
     # Serializers
     "serialize_message",
+    "serialize_messages_json",
     "serialize_thread",
 ]
@@ -2,14 +2,30 @@
 API module.
 """
 
-from .dependencies import ChatServiceDep, DBSession, Graph, ThreadServiceDep
-from .routes import chat_router, threads_router
+from .dependencies import (
+    ChatServiceDep,
+    DBSession,
+    Graph,
+    ThreadServiceDep,
+    UsageServiceDep,
+)
+from .routes import (
+    chat_router,
+    exports_router,
+    metrics_router,
+    threads_router,
+    usage_router,
+)
 
 __all__ = [
     "chat_router",
+    "exports_router",
+    "metrics_router",
     "threads_router",
+    "usage_router",
     "ChatServiceDep",
     "ThreadServiceDep",
+    "UsageServiceDep",
     "DBSession",
     "Graph",
 ]
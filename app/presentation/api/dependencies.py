@@ -2,16 +2,27 @@
 FastAPI dependencies for dependency injection.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastapi import Depends, Request
 from langgraph.graph.state import CompiledStateGraph
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.application.services import ChatService, ThreadService, create_chat_service, create_thread_service
+from app.application.agent import AnswerCache, SummaryRefresher
+from app.application.services import (
+    ChatService,
+    ThreadService,
+    UsageService,
+    create_chat_service,
+    create_thread_service,
+    create_usage_service,
+)
 from app.infrastructure.database import (
     MessageRepositoryImpl,
     ThreadRepositoryImpl,
+    UsageRepositoryImpl,
     get_session_factory,
 )
 
@@ -33,6 +44,26 @@ async def get_db_session() -> AsyncSession:
             raise
 
 
+@asynccontextmanager
+async def open_summary_repositories() -> AsyncIterator[
+    tuple[ThreadRepositoryImpl, UsageRepositoryImpl]
+]:
+    """
+    Open a session of its own for background summary refreshes.
+
+    Yields:
+        Thread and usage repositories sharing the session, committed on exit
+    """
+    factory = get_session_factory()
+    async with factory() as session:
+        try:
+            yield ThreadRepositoryImpl(session), UsageRepositoryImpl(session)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 def get_graph(request: Request) -> CompiledStateGraph:
     """
     Get the compiled graph from app state.
@@ -46,6 +77,32 @@ def get_graph(request: Request) -> CompiledStateGraph:
     return request.app.state.graph
 
 
+def get_answer_cache(request: Request) -> AnswerCache | None:
+    """
+    Get the answer cache from app state.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        AnswerCache singleton, or None if disabled
+    """
+    return getattr(request.app.state, "answer_cache", None)
+
+
+def get_summary_refresher(request: Request) -> SummaryRefresher | None:
+    """
+    Get the summary refresher from app state.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        SummaryRefresher singleton, or None if summaries are disabled
+    """
+    return getattr(request.app.state, "summary_refresher", None)
+
+
 def get_message_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)]
 ) -> MessageRepositoryImpl:
@@ -60,16 +117,31 @@ def get_thread_repository(
     return ThreadRepositoryImpl(session)
 
 
+def get_usage_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)]
+) -> UsageRepositoryImpl:
+    """Get usage repository with injected session."""
+    return UsageRepositoryImpl(session)
+
+
 def get_chat_service(
     graph: Annotated[CompiledStateGraph, Depends(get_graph)],
     message_repo: Annotated[MessageRepositoryImpl, Depends(get_message_repository)],
     thread_repo: Annotated[ThreadRepositoryImpl, Depends(get_thread_repository)],
+    answer_cache: Annotated[AnswerCache | None, Depends(get_answer_cache)],
+    usage_repo: Annotated[UsageRepositoryImpl, Depends(get_usage_repository)],
+    summary_refresher: Annotated[
+        SummaryRefresher | None, Depends(get_summary_refresher)
+    ],
 ) -> ChatService:
     """Get chat service with all dependencies."""
     return create_chat_service(
         graph=graph,
         message_repository=message_repo,
         thread_repository=thread_repo,
+        answer_cache=answer_cache,
+        usage_repository=usage_repo,
+        summary_refresher=summary_refresher,
     )
 
 
@@ -84,8 +156,16 @@ def get_thread_service(
     )
 
 
+def get_usage_service(
+    usage_repo: Annotated[UsageRepositoryImpl, Depends(get_usage_repository)],
+) -> UsageService:
+    """Get usage service with all dependencies."""
+    return create_usage_service(usage_repository=usage_repo)
+
+
 # Type aliases for cleaner route signatures
 DBSession = Annotated[AsyncSession, Depends(get_db_session)]
 Graph = Annotated[CompiledStateGraph, Depends(get_graph)]
 ChatServiceDep = Annotated[ChatService, Depends(get_chat_service)]
 ThreadServiceDep = Annotated[ThreadService, Depends(get_thread_service)]
+UsageServiceDep = Annotated[UsageService, Depends(get_usage_service)]
@@ -0,0 +1,53 @@
+"""
+Helpers for ETag generation and conditional GET handling.
+"""
+
+import hashlib
+
+ETAG_HEADER = "ETag"
+CACHE_CONTROL_HEADER = "Cache-Control"
+
+# Clients may keep a copy but must revalidate before reusing it
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*parts: object) -> str:
+    """
+    Build a weak ETag from the values that identify a representation.
+
+    The tag is weak because the same content is sent gzip-compressed or not,
+    depending on Accept-Encoding, and the two bodies are not byte-identical.
+
+    Args:
+        parts: Values the representation depends on (e.g. thread id, version)
+
+    Returns:
+        Weak, quoted ETag string
+    """
+    raw = "\x1f".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header value against the current ETag.
+
+    Uses weak comparison, as required for If-None-Match (RFC 9110).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client copy is still current
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    current = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == current for candidate in candidates)
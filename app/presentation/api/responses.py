@@ -0,0 +1,73 @@
+"""
+Response helpers for pre-encoded JSON payloads.
+"""
+
+import gzip
+
+from fastapi import Request, Response
+
+# Bodies smaller than this are sent uncompressed (gzip overhead outweighs gain)
+GZIP_MINIMUM_SIZE = 4096
+# Favor speed over ratio; JSON compresses well even at low levels
+GZIP_COMPRESS_LEVEL = 5
+
+
+def accepts_gzip(request: Request) -> bool:
+    """
+    Check whether the client accepts gzip content encoding.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        True if gzip is listed in Accept-Encoding with a non-zero q-value
+    """
+    header = request.headers.get("accept-encoding", "")
+    for entry in header.split(","):
+        coding, _, params = entry.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().removeprefix("q=").strip()
+        if not quality:
+            return True
+        try:
+            return float(quality) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def json_bytes_response(
+    request: Request,
+    body: bytes,
+    headers: dict[str, str] | None = None,
+    status_code: int = 200,
+) -> Response:
+    """
+    Build a response from already-encoded JSON bytes.
+
+    Bypasses FastAPI's response_model validation and JSON encoding.
+    Large bodies are gzip-compressed when the client accepts it.
+
+    Args:
+        request: Incoming request (used for content negotiation)
+        body: UTF-8 encoded JSON document
+        headers: Extra response headers
+        status_code: HTTP status code
+
+    Returns:
+        Response carrying the (possibly compressed) body
+    """
+    response_headers = dict(headers or {})
+    response_headers["Vary"] = "Accept-Encoding"
+
+    if len(body) >= GZIP_MINIMUM_SIZE and accepts_gzip(request):
+        body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+        response_headers["Content-Encoding"] = "gzip"
+
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=response_headers,
+    )
@@ -3,6 +3,15 @@ API routes module.
 """
 
 from .chat import router as chat_router
+from .exports import router as exports_router
+from .metrics import router as metrics_router
 from .threads import router as threads_router
+from .usage import router as usage_router
 
-__all__ = ["chat_router", "threads_router"]
+__all__ = [
+    "chat_router",
+    "exports_router",
+    "metrics_router",
+    "threads_router",
+    "usage_router",
+]
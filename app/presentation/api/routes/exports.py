@@ -0,0 +1,65 @@
+"""
+Export API routes.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.domain import Message
+from app.presentation.api.dependencies import ThreadServiceDep
+from app.presentation.serializers import serialize_message_ndjson
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+# Lines are grouped into chunks of roughly this size before being written
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+async def _ndjson_chunks(messages: AsyncIterator[Message]) -> AsyncIterator[bytes]:
+    """Encode messages as NDJSON, yielding them in ~64 KiB chunks."""
+    buffer = bytearray()
+    async for message in messages:
+        buffer += serialize_message_ndjson(message)
+        if len(buffer) >= EXPORT_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+@router.get("/messages")
+async def export_messages(
+    thread_service: ThreadServiceDep,
+    user_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> StreamingResponse:
+    """
+    Export messages across threads as NDJSON (one message per line).
+
+    Rows are read through a server-side cursor and written with chunked
+    transfer encoding, so memory use does not grow with the export size.
+
+    Args:
+        user_id: Only include threads owned by this user
+        since: Timestamp lower bound (inclusive)
+        until: Timestamp upper bound (exclusive)
+
+    Returns:
+        Streaming NDJSON response ordered by thread, then timestamp
+    """
+    if user_id is None and since is None and until is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide user_id or a time range (since/until)",
+        )
+
+    messages = thread_service.export_messages(user_id=user_id, since=since, until=until)
+    return StreamingResponse(
+        _ndjson_chunks(messages),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-store"},
+    )
@@ -0,0 +1,23 @@
+"""
+Metrics API routes.
+"""
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.infrastructure.metrics import get_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics_snapshot() -> dict[str, Any]:
+    """
+    Get the in-process metrics of this worker.
+
+    Returns:
+        Counters, latency histograms (count, sum, p50/p95/p99, max) and
+        collector sections such as LLM HTTP pool statistics
+    """
+    return get_metrics().snapshot()
@@ -2,58 +2,134 @@
 Thread API routes.
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException, Request, Response
 
 from app.presentation.api.dependencies import ThreadServiceDep
+from app.presentation.api.etags import (
+    CACHE_CONTROL_HEADER,
+    ETAG_HEADER,
+    REVALIDATE_CACHE_CONTROL,
+    build_etag,
+    etag_matches,
+)
+from app.presentation.api.responses import json_bytes_response
 from app.presentation.schemas import MessageResponse, ThreadResponse
-from app.presentation.serializers import serialize_message, serialize_thread
+from app.presentation.serializers import serialize_messages_json, serialize_thread
 
 router = APIRouter(prefix="/threads", tags=["threads"])
 
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+@router.get("", response_model=list[ThreadResponse])
+async def list_user_threads(
+    user_id: str,
+    thread_service: ThreadServiceDep,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[ThreadResponse]:
+    """
+    List a user's threads, most recently active first.
+
+    Message counts, token totals and last activity come from the
+    denormalized thread counters, so no message rows are scanned.
+
+    Args:
+        user_id: ID of the user
+        limit: Maximum number of threads to return
+        offset: Number of threads to skip
+
+    Returns:
+        List of threads ordered by updated_at descending
+    """
+    threads = await thread_service.get_user_threads(
+        user_id=user_id,
+        limit=limit,
+        offset=offset,
+    )
+    return [serialize_thread(thread) for thread in threads]
+
 
 @router.get("/{thread_id}/messages", response_model=list[MessageResponse])
 async def get_thread_messages(
     thread_id: str,
     thread_service: ThreadServiceDep,
+    request: Request,
     limit: int | None = None,
     offset: int = 0,
-) -> list[MessageResponse]:
+    after: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Get all messages for a thread.
 
+    The total number of messages is returned in the X-Total-Count header,
+    read from the thread counters. The ETag is derived from the thread
+    version, so a matching If-None-Match is answered with 304 after a single
+    thread lookup, without touching the messages table.
+
+    Messages are encoded straight to JSON bytes (the documented
+    response_model is not re-validated) and gzip-compressed when large.
+
     Args:
         thread_id: ID of the thread
         limit: Maximum number of messages to return
         offset: Number of messages to skip
+        after: Message ID cursor; only messages after it are returned
+        if_none_match: ETag of the client's cached copy
 
     Returns:
         List of messages ordered by timestamp
     """
+    thread = await thread_service.get_thread(thread_id)
+    headers = {TOTAL_COUNT_HEADER: str(thread.message_count if thread else 0)}
+    if thread:
+        etag = build_etag(thread.id, thread.version, limit, offset, after)
+        headers[ETAG_HEADER] = etag
+        headers[CACHE_CONTROL_HEADER] = REVALIDATE_CACHE_CONTROL
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
     messages = await thread_service.get_thread_messages(
         thread_id=thread_id,
         limit=limit,
         offset=offset,
+        after_id=after,
+    )
+    return json_bytes_response(
+        request, serialize_messages_json(messages), headers=headers
     )
-    return [serialize_message(msg) for msg in messages]
 
 
 @router.get("/{thread_id}", response_model=ThreadResponse)
 async def get_thread(
     thread_id: str,
     thread_service: ThreadServiceDep,
-) -> ThreadResponse:
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> ThreadResponse | Response:
     """
     Get a thread by ID.
 
     Args:
         thread_id: ID of the thread
+        if_none_match: ETag of the client's cached copy
 
     Returns:
-        Thread details
+        Thread details, or 304 if the client copy is current
     """
     thread = await thread_service.get_thread(thread_id)
     if not thread:
         raise HTTPException(status_code=404, detail="Thread not found")
+
+    etag = build_etag(thread.id, thread.version)
+    headers = {ETAG_HEADER: etag, CACHE_CONTROL_HEADER: REVALIDATE_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
     return serialize_thread(thread)
 
 
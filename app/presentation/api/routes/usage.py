@@ -0,0 +1,57 @@
+"""
+Token usage API routes.
+"""
+
+from datetime import date
+
+from fastapi import APIRouter, Query
+
+from app.presentation.api.dependencies import UsageServiceDep
+from app.presentation.schemas import UsageResponse
+from app.presentation.serializers import serialize_usage
+
+router = APIRouter(prefix="/usage", tags=["usage"])
+
+
+@router.get("/users/{user_id}", response_model=UsageResponse)
+async def get_user_usage(
+    user_id: str,
+    usage_service: UsageServiceDep,
+    since: date | None = None,
+) -> UsageResponse:
+    """
+    Get a user's LLM token usage across all threads.
+
+    Args:
+        user_id: ID of the user
+        since: Only include usage from this UTC day on (inclusive)
+
+    Returns:
+        Aggregate usage for the user
+    """
+    usage = await usage_service.get_user_usage(user_id, since=since)
+    return serialize_usage(usage)
+
+
+@router.get("/threads", response_model=list[UsageResponse])
+async def get_top_threads(
+    usage_service: UsageServiceDep,
+    limit: int = Query(default=20, ge=1, le=500),
+    since: date | None = None,
+    user_id: str | None = None,
+) -> list[UsageResponse]:
+    """
+    List the threads with the highest LLM token usage.
+
+    Args:
+        limit: Maximum number of threads to return
+        since: Only include usage from this UTC day on (inclusive)
+        user_id: Only include threads owned by this user
+
+    Returns:
+        Per-thread usage ordered by total tokens descending
+    """
+    usages = await usage_service.get_top_threads(
+        limit=limit, since=since, user_id=user_id
+    )
+    return [serialize_usage(usage) for usage in usages]
@@ -4,10 +4,12 @@ API schemas module.
 
 from .chat import MessageResponse, SendMessageRequest
 from .thread import CreateThreadRequest, ThreadResponse
+from .usage import UsageResponse
 
 __all__ = [
     "SendMessageRequest",
     "MessageResponse",
     "CreateThreadRequest",
     "ThreadResponse",
+    "UsageResponse",
 ]
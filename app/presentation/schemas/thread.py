@@ -16,6 +16,10 @@ class ThreadResponse(BaseModel):
     title: str | None = None
     created_at: str
     updated_at: str
+    message_count: int = 0
+    total_tokens: int = 0
+    last_message_at: str | None = None
+    version: int = 0
 
 
 class CreateThreadRequest(BaseModel):
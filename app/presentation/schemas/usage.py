@@ -0,0 +1,17 @@
+"""
+Pydantic schemas for token usage API responses.
+"""
+
+from pydantic import BaseModel
+
+
+class UsageResponse(BaseModel):
+    """Response schema for token usage totals."""
+
+    user_id: str
+    thread_id: str | None = None
+    llm_calls: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
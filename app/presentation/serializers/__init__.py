@@ -2,6 +2,20 @@
 Serializers module.
 """
 
-from .message_serializer import serialize_message, serialize_thread
+from .message_serializer import (
+    message_to_dict,
+    serialize_message,
+    serialize_message_ndjson,
+    serialize_messages_json,
+    serialize_thread,
+    serialize_usage,
+)
 
-__all__ = ["serialize_message", "serialize_thread"]
+__all__ = [
+    "message_to_dict",
+    "serialize_message",
+    "serialize_message_ndjson",
+    "serialize_messages_json",
+    "serialize_thread",
+    "serialize_usage",
+]
@@ -2,8 +2,26 @@
 Serializers for converting domain entities to API schemas.
 """
 
-from app.domain import Message, Thread
-from app.presentation.schemas import MessageResponse, ThreadResponse
+import orjson
+
+from app.domain import Message, Thread, TokenUsage
+from app.presentation.schemas import MessageResponse, ThreadResponse, UsageResponse
+
+
+def _serialize_tool_calls(message: Message) -> list[dict] | None:
+    """Convert message tool calls to their API representation."""
+    if not message.tool_calls:
+        return None
+    return [
+        {
+            "id": tc.id,
+            "function": {
+                "name": tc.name,
+                "arguments": tc.arguments,
+            },
+        }
+        for tc in message.tool_calls
+    ]
 
 
 def serialize_message(message: Message) -> MessageResponse:
@@ -16,26 +34,13 @@ def serialize_message(message: Message) -> MessageResponse:
     Returns:
         MessageResponse schema
     """
-    tool_calls_data = None
-    if message.tool_calls:
-        tool_calls_data = [
-            {
-                "id": tc.id,
-                "function": {
-                    "name": tc.name,
-                    "arguments": tc.arguments,
-                },
-            }
-            for tc in message.tool_calls
-        ]
-
     return MessageResponse(
         id=message.id,
         thread_id=message.thread_id,
         role=message.role.value,
         content=message.content,
         timestamp=message.timestamp.isoformat(),
-        tool_calls=tool_calls_data,
+        tool_calls=_serialize_tool_calls(message),
         tool_call_id=message.tool_call_id,
         tool_result=message.tool_result,
         reasoning=message.reasoning,
@@ -43,6 +48,61 @@ def serialize_message(message: Message) -> MessageResponse:
     )
 
 
+def message_to_dict(message: Message) -> dict:
+    """
+    Convert a Message entity to a plain dict shaped like MessageResponse.
+
+    Skips pydantic model construction; use for bulk JSON encoding.
+
+    Args:
+        message: Domain message entity
+
+    Returns:
+        Dict with the same keys and values as MessageResponse
+    """
+    return {
+        "id": message.id,
+        "thread_id": message.thread_id,
+        "role": message.role.value,
+        "content": message.content,
+        "timestamp": message.timestamp.isoformat(),
+        "tool_calls": _serialize_tool_calls(message),
+        "tool_call_id": message.tool_call_id,
+        "tool_result": message.tool_result,
+        "reasoning": message.reasoning,
+        "token_count": message.token_count,
+    }
+
+
+def serialize_messages_json(messages: list[Message]) -> bytes:
+    """
+    Encode a list of Message entities straight to JSON bytes.
+
+    Produces the same document as list[MessageResponse] but in a single
+    pass, without pydantic validation.
+
+    Args:
+        messages: Domain message entities
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    return orjson.dumps([message_to_dict(message) for message in messages])
+
+
+def serialize_message_ndjson(message: Message) -> bytes:
+    """
+    Encode a Message entity as a single NDJSON line.
+
+    Args:
+        message: Domain message entity
+
+    Returns:
+        UTF-8 encoded JSON object terminated by a newline
+    """
+    return orjson.dumps(message_to_dict(message), option=orjson.OPT_APPEND_NEWLINE)
+
+
 def serialize_thread(thread: Thread) -> ThreadResponse:
     """
     Convert a Thread entity to ThreadResponse schema.
@@ -62,4 +122,31 @@ def serialize_thread(thread: Thread) -> ThreadResponse:
         title=thread.title,
         created_at=thread.created_at.isoformat(),
         updated_at=thread.updated_at.isoformat(),
+        message_count=thread.message_count,
+        total_tokens=thread.total_tokens,
+        last_message_at=(
+            thread.last_message_at.isoformat() if thread.last_message_at else None
+        ),
+        version=thread.version,
+    )
+
+
+def serialize_usage(usage: TokenUsage) -> UsageResponse:
+    """
+    Convert a TokenUsage entity to UsageResponse schema.
+
+    Args:
+        usage: Domain token usage entity
+
+    Returns:
+        UsageResponse schema
+    """
+    return UsageResponse(
+        user_id=usage.user_id,
+        thread_id=usage.thread_id,
+        llm_calls=usage.llm_calls,
+        input_tokens=usage.input_tokens,
+        cached_input_tokens=usage.cached_input_tokens,
+        output_tokens=usage.output_tokens,
+        total_tokens=usage.total_tokens,
     )
@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks for hot paths (run as modules, e.g. python -m benchmarks.x).
+"""
@@ -0,0 +1,155 @@
+"""
+Benchmark: concurrent Helix searches.
+
+Compares the previous path (blocking helix.Client.query pushed to the
+default thread executor, as LangChain does for sync tools) against the
+async HelixQueryClient on a pooled httpx client. Both talk to a local
+stand-in Helix server that answers every query after a fixed latency.
+
+Requires the previous SDK (pip install -e ".[bench]").
+
+Usage:
+    python -m benchmarks.helix_client [--concurrency 50] [--searches 500] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import time
+
+import helix
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.helix.client import HelixQueryClient
+
+_CLAIMS = {
+    "claims": [{"id": f"claim-{i}", "text": "Keep Enrage up. " * 8} for i in range(10)]
+}
+_PARAMS = {"wow_class": "warrior", "wow_spec": "fury", "wow_role": "dps"}
+
+
+def serve_stand_in(port: int, latency: float) -> None:
+    """Stand-in Helix server: answers POST /{query_name} after `latency` seconds."""
+
+    async def query(request: Request) -> JSONResponse:
+        await request.json()
+        await asyncio.sleep(latency)
+        return JSONResponse(_CLAIMS)
+
+    app = Starlette(routes=[Route("/{query_name}", query, methods=["POST"])])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error", backlog=4096)
+
+
+def start_stand_in_server(latency: float) -> tuple[multiprocessing.Process, int]:
+    """Start the stand-in server in its own process and wait until it accepts connections."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = multiprocessing.Process(
+        target=serve_stand_in, args=(port, latency), daemon=True
+    )
+    process.start()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process, port
+        except OSError:
+            time.sleep(0.05)
+
+
+async def run_searches(
+    search, searches: int, concurrency: int
+) -> tuple[float, list[float]]:
+    """Run searches with at most `concurrency` in flight; return wall time and latencies."""
+    latencies: list[float] = []
+    remaining = iter(range(searches))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            await search()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def report(name: str, searches: int, elapsed: float, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<14} {searches / elapsed:8.0f} searches/s   "
+        f"p50 {p50 * 1000:7.1f} ms   p99 {p99 * 1000:7.1f} ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server, port = start_stand_in_server(args.latency_ms / 1000)
+
+    legacy_client = helix.Client(local=True, port=port, verbose=False)
+
+    async def legacy_search() -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, legacy_client.query, "SearchClaimsByTags", _PARAMS
+        )
+
+    settings = get_settings()
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.helix_max_connections,
+            max_keepalive_connections=settings.helix_max_connections,
+        )
+    )
+    async_client = HelixQueryClient(
+        base_url=f"http://127.0.0.1:{port}",
+        http_client=http_client,
+        max_concurrency=settings.helix_max_concurrency,
+    )
+
+    async def async_search() -> None:
+        await async_client.query("SearchClaimsByTags", _PARAMS)
+
+    # Same response shape on both paths
+    legacy_data = await asyncio.get_running_loop().run_in_executor(
+        None, legacy_client.query, "SearchClaimsByTags", _PARAMS
+    )
+    assert (await async_client.query("SearchClaimsByTags", _PARAMS)).data == legacy_data
+
+    print(f"searches:       {args.searches} from {args.concurrency} concurrent callers")
+    print(
+        f"helix pool:     {settings.helix_max_connections} connections, {settings.helix_max_concurrency} in flight"
+    )
+    print(f"server latency: {args.latency_ms:.0f} ms")
+    for name, search in (
+        ("thread pool", legacy_search),
+        ("async pooled", async_search),
+    ):
+        # Warm-up round so both paths are measured with open connections/threads
+        await run_searches(search, args.concurrency, args.concurrency)
+        elapsed, latencies = await run_searches(search, args.searches, args.concurrency)
+        report(name, args.searches, elapsed, latencies)
+
+    await async_client.aclose()
+    server.terminate()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--searches", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
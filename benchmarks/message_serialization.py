@@ -0,0 +1,122 @@
+"""
+Benchmark: thread message listing serialization.
+
+Compares the previous response path (MessageResponse models, FastAPI
+response_model validation and jsonable_encoder + json.dumps) against the
+fast path (plain dicts encoded with orjson) for a 1k-message thread.
+
+Usage:
+    python -m benchmarks.message_serialization [--messages 1000] [--repeat 20]
+"""
+
+import argparse
+import gzip
+import json
+import timeit
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.domain import Message, MessageRole, ToolCall
+from app.presentation.api.responses import GZIP_COMPRESS_LEVEL
+from app.presentation.schemas import MessageResponse
+from app.presentation.serializers import serialize_message, serialize_messages_json
+
+_TOOL_PAYLOAD = json.dumps(
+    [
+        {
+            "claims": [
+                {"id": f"claim-{i}", "text": "Keep Enrage up. " * 8} for i in range(20)
+            ]
+        }
+    ]
+)
+
+
+def build_thread(message_count: int) -> list[Message]:
+    """Build a synthetic thread cycling human -> ai(tool call) -> tool -> ai."""
+    thread_id = f"{uuid.uuid4()}_bench"
+    start = datetime.now(UTC)
+    messages: list[Message] = []
+    for index in range(message_count):
+        timestamp = start + timedelta(seconds=index)
+        call_id = f"call_{index // 4}"
+        match index % 4:
+            case 0:
+                message = Message(
+                    str(uuid.uuid4()),
+                    thread_id,
+                    MessageRole.HUMAN,
+                    "What is my stat priority?",
+                    timestamp,
+                )
+            case 1:
+                message = Message(
+                    str(uuid.uuid4()),
+                    thread_id,
+                    MessageRole.AI,
+                    "",
+                    timestamp,
+                    tool_calls=[
+                        ToolCall(
+                            call_id, "search_helix", '{"user_query": "stat priority"}'
+                        )
+                    ],
+                )
+            case 2:
+                message = Message(
+                    str(uuid.uuid4()),
+                    thread_id,
+                    MessageRole.TOOL,
+                    _TOOL_PAYLOAD,
+                    timestamp,
+                    tool_call_id=call_id,
+                    tool_result=_TOOL_PAYLOAD,
+                )
+            case _:
+                message = Message(
+                    str(uuid.uuid4()),
+                    thread_id,
+                    MessageRole.AI,
+                    "Haste > Mastery > Crit. " * 20,
+                    timestamp,
+                )
+        messages.append(message)
+    return messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    messages = build_thread(args.messages)
+    adapter = TypeAdapter(list[MessageResponse])
+
+    def legacy_path() -> bytes:
+        models = [serialize_message(message) for message in messages]
+        validated = adapter.validate_python(models, from_attributes=True)
+        return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+    def fast_path() -> bytes:
+        return serialize_messages_json(messages)
+
+    assert json.loads(legacy_path()) == json.loads(fast_path())
+
+    legacy = min(timeit.repeat(legacy_path, number=1, repeat=args.repeat))
+    fast = min(timeit.repeat(fast_path, number=1, repeat=args.repeat))
+    body = fast_path()
+    compressed = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+
+    print(f"messages:        {args.messages}")
+    print(f"legacy path:     {legacy * 1000:8.2f} ms")
+    print(f"fast path:       {fast * 1000:8.2f} ms  ({legacy / fast:.1f}x)")
+    print(f"body size:       {len(body) / 1024:8.1f} KiB")
+    print(f"gzip body size:  {len(compressed) / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
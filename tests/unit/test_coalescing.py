@@ -0,0 +1,81 @@
+"""
+Tests for single-flight coalescing of LLM streams inside the agent graph.
+"""
+
+import asyncio
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langchain_core.outputs import ChatGenerationChunk
+from langgraph.graph import END, StateGraph
+
+from app.application.agent.nodes.llm_node import LLMNode
+from app.application.agent.state_schema import AgentState
+from app.infrastructure.llm import CoalescingChatModel, StreamCoalescer
+
+
+class SlowChatModel(BaseChatModel):
+    """Streams a fixed answer slowly and counts upstream requests."""
+
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake"
+
+    def _generate(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        for token in ("Use ", "Combustion"):
+            await asyncio.sleep(0.05)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content="",
+                usage_metadata={
+                    "input_tokens": 100,
+                    "output_tokens": 2,
+                    "total_tokens": 102,
+                },
+            )
+        )
+
+
+def build_graph(model: BaseChatModel):
+    graph = StateGraph(AgentState)
+    graph.add_node("agent", LLMNode(model))
+    graph.set_entry_point("agent")
+    graph.add_edge("agent", END)
+    return graph.compile()
+
+
+def new_state() -> AgentState:
+    return AgentState(
+        messages=[HumanMessage(content="How do I play fire mage?")],
+        thread_id="thread",
+        user_id="user",
+        wow_class="mage",
+        wow_spec="fire",
+        wow_role="dps",
+    )
+
+
+async def test_concurrent_graph_runs_share_one_upstream_stream():
+    upstream = SlowChatModel()
+    coalescer = StreamCoalescer()
+    graph = build_graph(CoalescingChatModel(inner=upstream, coalescer=coalescer))
+
+    first, second = await asyncio.gather(
+        graph.ainvoke(new_state()), graph.ainvoke(new_state())
+    )
+
+    assert upstream.calls == 1
+    assert coalescer.joined == 1
+    answers = [first["messages"][-1], second["messages"][-1]]
+    assert [answer.content for answer in answers] == ["Use Combustion"] * 2
+    # The provider billed one request: only the leader reports usage
+    usages = [answer.usage_metadata for answer in answers]
+    assert sum(1 for usage in usages if usage) == 1
@@ -0,0 +1,97 @@
+"""
+Tests for parallel search_helix calls sharing one speculative query.
+"""
+
+import asyncio
+
+import pytest
+
+from app.application.agent.run_context import RunContext
+from app.application.agent.speculation import PredictedCall, Speculation, _Prediction
+from app.application.agent.tools import helix_search as helix_search_module
+from app.application.agent.tools.helix_search import helix_query_for, search_helix
+from app.domain.entities.helix_query_result import HelixQueryResult
+from app.infrastructure.helix.cache import build_cache_key
+
+ARGS = {
+    "user_query": "stat priority",
+    "wow_class": "mage",
+    "wow_spec": "fire",
+    "wow_role": "dps",
+}
+
+
+def claims_result(query_name: str, text: str) -> HelixQueryResult:
+    return HelixQueryResult(
+        query_name=query_name,
+        data=[{"claims": [{"id": "claim-1", "text": text}]}],
+    )
+
+
+class FallbackClient:
+    """Helix client used when no speculative query can be claimed."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+
+    async def query(self, query_name, params=None) -> HelixQueryResult:
+        self.queries += 1
+        return claims_result(query_name, "Fallback claim")
+
+
+class NoSpeculator:
+    def record(self, speculation: Speculation) -> None:
+        return
+
+
+def run_context_sharing(task: asyncio.Task) -> RunContext:
+    query_name, params = helix_query_for("mage", "fire", "dps")
+    call = PredictedCall(
+        tool_name="search_helix",
+        key=build_cache_key("", query_name, params),
+        run=lambda: task,
+    )
+    speculation = Speculation(
+        speculator=NoSpeculator(),
+        turn_kind="first",
+        predictions=[_Prediction(call=call, task=task)],
+    )
+    return RunContext(speculation=speculation)
+
+
+@pytest.fixture
+def fallback_client(monkeypatch) -> FallbackClient:
+    client = FallbackClient()
+    monkeypatch.setattr(helix_search_module, "get_helix_client", lambda: client)
+    return client
+
+
+async def test_claimant_timeout_does_not_cancel_shared_query(fallback_client):
+    async def slow_query() -> HelixQueryResult:
+        await asyncio.sleep(0.2)
+        return claims_result("SearchClaimsByTags", "Speculative claim")
+
+    shared = asyncio.create_task(slow_query())
+    config = run_context_sharing(shared).as_config()
+
+    impatient, patient = await asyncio.gather(
+        asyncio.wait_for(search_helix.arun(ARGS, config=config), 0.05),
+        asyncio.wait_for(search_helix.arun(ARGS, config=config), 5),
+        return_exceptions=True,
+    )
+
+    assert isinstance(impatient, TimeoutError)
+    assert "Speculative claim" in patient
+    assert not shared.cancelled()
+    assert fallback_client.queries == 0
+
+
+async def test_cancelled_shared_query_falls_back_to_client(fallback_client):
+    shared = asyncio.create_task(asyncio.sleep(5))
+    config = run_context_sharing(shared).as_config()
+    shared.cancel()
+
+    result = await search_helix.arun(ARGS, config=config)
+
+    assert "Fallback claim" in result
+    assert fallback_client.queries == 1